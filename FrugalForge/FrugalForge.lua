@@ -40,6 +40,8 @@ local function isVendorItem(itemId)
 end
 
 local PRODUCERS_BY_OUTPUT = nil
+-- Output itemId -> recipe maps built from the generated createdBy index, one per profession table.
+local RECIPE_BY_OUTPUT = setmetatable({}, { __mode = "k" })
 local NO_SCAN_REAGENT_IDS = {
   [6218] = true,  -- Runed Copper Rod
   [6339] = true,  -- Runed Silver Rod
@@ -172,6 +174,9 @@ end
 
 
 local function latestSnapshot()
+  if type(_G.FrugalScan_GetLastSnapshot) == "function" then
+    return _G.FrugalScan_GetLastSnapshot()
+  end
   local db = _G.FrugalScanDB
   if type(db) ~= "table" then return nil end
   local snap = db.lastSnapshot
@@ -512,6 +517,41 @@ local function getProfessionByName(name)
   return nil
 end
 
+-- Generated data carries skillIndex.buckets[floor(skill / bucketSize)] = { recipe indices }
+-- listing every recipe that is not gray somewhere in that bucket. Returns nil for data
+-- without an index so callers fall back to scanning every recipe.
+local function getSkillIndex(prof)
+  local index = prof and prof.skillIndex
+  if type(index) ~= "table" or type(index.buckets) ~= "table" or type(prof.recipes) ~= "table" then
+    return nil, nil
+  end
+  local bucketSize = tonumber(index.bucketSize) or 0
+  if bucketSize <= 0 then return nil, nil end
+  return index.buckets, bucketSize
+end
+
+local function recipesForSkillRange(prof, fromSkill, toSkill)
+  local buckets, bucketSize = getSkillIndex(prof)
+  if not buckets then return nil end
+  local seen = {}
+  local indices = {}
+  for bucket = math.floor(fromSkill / bucketSize), math.floor(toSkill / bucketSize) do
+    for _, idx in ipairs(buckets[bucket] or {}) do
+      if not seen[idx] then
+        seen[idx] = true
+        table.insert(indices, idx)
+      end
+    end
+  end
+  table.sort(indices)
+  local out = {}
+  for _, idx in ipairs(indices) do
+    local r = prof.recipes[idx]
+    if r then table.insert(out, r) end
+  end
+  return out
+end
+
 local function currentSkillForProfession(professionName)
   local rank, maxRank = getProfessionSkillByName(professionName)
   if rank then return rank, maxRank end
@@ -569,7 +609,8 @@ buildTargetsForProfession = function(professionId, targetSkill)
   end
 
     local includeNonTrainer = (FrugalForgeDB.settings.includeNonTrainerRecipes ~= false)
-    for _, r in ipairs(prof.recipes or {}) do
+    local candidates = recipesForSkillRange(prof, currentSkill, maxSkill) or prof.recipes or {}
+    for _, r in ipairs(candidates) do
       local minSkill = r.minSkill or 0
       local grayAt = r.grayAt or 0
       if minSkill <= maxSkill and grayAt > currentSkill then
@@ -633,6 +674,15 @@ end
 buildRecipeByOutput = function(profession)
   local map = {}
   if not profession or type(profession.recipes) ~= "table" then return map end
+  if type(profession.createdBy) == "table" then
+    local cached = RECIPE_BY_OUTPUT[profession]
+    if cached then return cached end
+    for itemId, idx in pairs(profession.createdBy) do
+      map[itemId] = profession.recipes[idx]
+    end
+    RECIPE_BY_OUTPUT[profession] = map
+    return map
+  end
   for _, r in ipairs(profession.recipes) do
     if r and r.createsItemId and not recipeUsesOgreTannin(r) then
       local existing = map[r.createsItemId]
@@ -1031,10 +1081,26 @@ local function buildMaps()
       ids = merged
     end
     if type(ids) == "table" then
+      -- The scanner keeps the current character's bag and bank counts indexed from bag
+      -- events; GetItemCount is the fallback until its bank has been counted once.
+      local indexed = nil
+      if type(_G.FrugalScan_GetOwnedCounts) == "function" then
+        local wanted = {}
+        for _, itemId in ipairs(ids) do
+          local n = tonumber(itemId)
+          if n and n > 0 then wanted[n] = true end
+        end
+        indexed = _G.FrugalScan_GetOwnedCounts(wanted, true)
+      end
       for _, itemId in ipairs(ids) do
         local n = tonumber(itemId)
         if n and n > 0 then
-          local count = GetItemCount(n, true) or 0
+          local count = 0
+          if indexed then
+            count = indexed[n] or 0
+          else
+            count = GetItemCount(n, true) or 0
+          end
           if count > 0 then
             ownedMap[n] = math.max(ownedMap[n] or 0, count)
           end
@@ -1079,6 +1145,30 @@ local function copperToText(c)
   end
 end
 
+-- Plans are cached in memory (a /reload always plans from scratch), keyed on their inputs.
+-- sim keeps the skill simulation with every owned count and known-recipe check it read, so
+-- owned changes the simulation never looked at re-run only the shopping and summary stages;
+-- full keeps the finished plan for unchanged inputs.
+local PLAN_CACHE = { sim = nil, full = nil }
+
+local function planCacheKey(...)
+  local parts = {}
+  for i = 1, select("#", ...) do
+    parts[i] = tostring((select(i, ...)))
+  end
+  return table.concat(parts, "|")
+end
+
+local function ownedMapKey(ownedMap)
+  local ids = {}
+  for itemId in pairs(ownedMap) do table.insert(ids, itemId) end
+  table.sort(ids)
+  for i, itemId in ipairs(ids) do
+    ids[i] = tostring(itemId) .. "=" .. tostring(ownedMap[itemId])
+  end
+  return table.concat(ids, ",")
+end
+
 local function generatePlan()
   ensureDb()
   local prices, priceCount, ownedMap, ownedCount, ownedByChar, snap, owned = buildMaps()
@@ -1099,6 +1189,8 @@ local function generatePlan()
         targets = built.targets,
         reagentIds = built.reagentIds,
       }
+      FrugalForgeDB.targetsBuiltAt = ts()
+      FrugalForgeDB.targetsBuiltAtEpoch = time()
       applyTargetsSafe(built)
       recipes = built.targets
     else
@@ -1170,6 +1262,21 @@ local function generatePlan()
     intermediates[itemId] = (intermediates[itemId] or 0) + crafts
   end
 
+  -- Owned counts and known-recipe checks read while planning, per stage, for PLAN_CACHE.
+  local planReads = { phase = "sim", sim = {}, shop = {}, unresolvedLinks = false }
+  local function notePlanRead(kind, key, value)
+    local reads = planReads.phase and planReads[planReads.phase]
+    if reads then
+      local byKey = reads[kind]
+      if not byKey then
+        byKey = {}
+        reads[kind] = byKey
+      end
+      if byKey[key] == nil then byKey[key] = value end
+    end
+    return value
+  end
+
   local liveOwnedCache = {}
   local function getLiveOwned(itemId)
     if not itemId then return 0 end
@@ -1183,7 +1290,7 @@ local function generatePlan()
     return live
   end
 
-  local function getOwnedCount(itemId, mode)
+  local function readOwnedCount(itemId, mode)
     if not itemId then return 0 end
     if mode == "selection" and ignoreOwnedSelection then
       return 0
@@ -1199,6 +1306,11 @@ local function generatePlan()
     return snapOwned
   end
 
+  local function getOwnedCount(itemId, mode)
+    if not itemId then return 0 end
+    return notePlanRead(mode or "snapshot", itemId, readOwnedCount(itemId, mode))
+  end
+
   local function getRecipeReagents(recipe)
     if type(recipe.reagentsWithQty) == "table" and #recipe.reagentsWithQty > 0 then
       return recipe.reagentsWithQty
@@ -1220,16 +1332,16 @@ local function generatePlan()
     local recipe = info and info.recipe
     local name = (recipe and recipe.name) or (info and info.name)
     if not name then return false end
+    local known = false
     if type(GetSpellInfo) == "function" then
       local _, _, _, _, _, _, spellId = GetSpellInfo(name)
       if spellId and type(IsSpellKnown) == "function" and IsSpellKnown(spellId) then
-        return true
-      end
-      if spellId and type(IsPlayerSpell) == "function" and IsPlayerSpell(spellId) then
-        return true
+        known = true
+      elseif spellId and type(IsPlayerSpell) == "function" and IsPlayerSpell(spellId) then
+        known = true
       end
     end
-    return false
+    return notePlanRead("known", name, known)
   end
 
   local function formatQty(q)
@@ -1241,6 +1353,8 @@ local function generatePlan()
       local link = select(2, GetItemInfo(itemId))
       if link then return link end
     end
+    -- The client may not have the item cached yet; a later plan can show its link.
+    planReads.unresolvedLinks = true
     return getItemName(itemId)
   end
 
@@ -1587,6 +1701,67 @@ local function generatePlan()
   if not currentSkill then currentSkill = 1 end
   local targetSkill = FrugalForgeDB.settings.targetSkill or (currentSkill + 100)
 
+  -- Debug output is written while planning, so debug runs always plan from scratch, as do
+  -- plans from the scanner's targets, which carry no build time.
+  local planKeys = nil
+  if not FrugalForgeDB.settings.debug and storedTargets then
+    local s = FrugalForgeDB.settings
+    local ageHours = hoursSince(getSnapshotEpoch(snap))
+    planKeys = {}
+    -- Content fingerprints rather than table identity: targets by when they were built, the
+    -- loaded profession data by id and size (it only changes on a /reload, which clears the
+    -- cache), snapshots by when they were taken and what they hold.
+    planKeys.sim = planCacheKey(
+      FrugalForgeDB.targetsBuiltAtEpoch, #recipes, targetProfessionName,
+      professionData and professionData.professionId, professionData and #(professionData.recipes or {}),
+      snap and snap.realmName, snap and snap.faction, getSnapshotEpoch(snap), priceCount,
+      useIntermediates, ignoreOwnedSelection, s.currentCharOnlySelection, nonTrainerPenalty,
+      currentSkill, targetSkill, skillCap
+    )
+    planKeys.full = planCacheKey(
+      planKeys.sim, ownedMapKey(ownedMap), ownedCount, getSnapshotEpoch(owned),
+      ownedValueFactor, rank, maxRank, profWarning, s.devMode, s.warnStaleHours,
+      ageHours and string.format("%.1f", ageHours),
+      type(_G.FrugalScan_TargetItemIds) == "table" and #_G.FrugalScan_TargetItemIds or 0
+    )
+  end
+
+  local function planReadsMatch(readSets, readOwnedValueFactor)
+    local phase = planReads.phase
+    planReads.phase = nil
+    local ok = true
+    for _, reads in ipairs(readSets) do
+      for kind, byKey in pairs(reads) do
+        for key, value in pairs(byKey) do
+          local now
+          if kind == "known" then
+            now = isRecipeKnown({ name = key })
+          elseif kind == "map" then
+            now = ownedMap[key] or 0
+          else
+            now = getOwnedCount(key, kind)
+          end
+          if now ~= value or (kind == "selection" and value > 0 and readOwnedValueFactor ~= ownedValueFactor) then
+            ok = false
+          end
+        end
+      end
+    end
+    planReads.phase = phase
+    return ok
+  end
+
+  local fullCache = planKeys and PLAN_CACHE.full
+  if fullCache and fullCache.key == planKeys.full and planReadsMatch(fullCache.reads, ownedValueFactor) then
+    local plan = {}
+    for k, v in pairs(fullCache.plan) do plan[k] = v end
+    plan.generatedAt = ts()
+    plan.generatedAtEpochUtc = time()
+    FrugalForgeDB.lastPlan = plan
+    updateUi()
+    return
+  end
+
   local function clamp01(x)
     if x < 0 then return 0 end
     if x > 1 then return 1 end
@@ -1700,381 +1875,449 @@ local function generatePlan()
     end
   end
 
-  local recipeInfos = {}
-  local trackedRecipeIds = {
-    ["bolt-of-netherweave"] = true,
-    ["bolt-of-imbued-netherweave"] = true,
-  }
-  local trackedRecipeOrder = {
-    "bolt-of-netherweave",
-    "bolt-of-imbued-netherweave",
-  }
-  local trackedRecipeInfoById = {}
-  local trackedDebugLines = nil
-  if FrugalForgeDB.settings and FrugalForgeDB.settings.debug then
-    trackedDebugLines = {}
-  end
+  -- Picks the cheapest recipe for each skill point; returns chosenBySkill and the number of
+  -- items with no price, or nil when no recipe can be planned. The last simulation is reused
+  -- when its inputs and every owned count and known-recipe check it read are unchanged, so
+  -- only the shopping and summary stages below run again.
+  local function simulateSkills()
+    local simCache = planKeys and PLAN_CACHE.sim
+    if simCache and simCache.key == planKeys.sim and planReadsMatch({ simCache.reads }, simCache.ownedValueFactor) then
+      planReads.sim = simCache.reads
+      return simCache.chosenBySkill, simCache.missingForPlanCount
+    end
 
-  local function isTrackedRecipeId(recipeId)
-    return recipeId and trackedRecipeIds[recipeId] == true
-  end
+    local recipeInfos = {}
+    local trackedRecipeIds = {
+      ["bolt-of-netherweave"] = true,
+      ["bolt-of-imbued-netherweave"] = true,
+    }
+    local trackedRecipeOrder = {
+      "bolt-of-netherweave",
+      "bolt-of-imbued-netherweave",
+    }
+    local trackedRecipeInfoById = {}
+    local trackedDebugLines = nil
+    if FrugalForgeDB.settings and FrugalForgeDB.settings.debug then
+      trackedDebugLines = {}
+    end
 
-  local function logTopCandidates(skill)
-    if not (FrugalForgeDB.settings and FrugalForgeDB.settings.debug) then return end
-    local candidates = {}
-    for _, info in ipairs(recipeInfos) do
-      if skill >= info.minSkill and skill < info.grayAt then
-        if info.missingPriceCount and info.missingPriceCount > 0 then
-          -- skip recipes with missing price data
-        else
-          local p = chanceForSkill(skill, info.recipe)
-          if p > 0 then
-            local crafts = 1 / p
-            local cost, missing = estimateCostForCrafts(info, crafts, ownedMap)
-            local score = (missing > 0) and 1e18 or cost
-            table.insert(candidates, { info = info, score = score, cost = cost, missing = missing, p = p, crafts = crafts })
+    local function isTrackedRecipeId(recipeId)
+      return recipeId and trackedRecipeIds[recipeId] == true
+    end
+
+    local function logTopCandidates(skill)
+      if not (FrugalForgeDB.settings and FrugalForgeDB.settings.debug) then return end
+      local candidates = {}
+      for _, info in ipairs(recipeInfos) do
+        if skill >= info.minSkill and skill < info.grayAt then
+          if info.missingPriceCount and info.missingPriceCount > 0 then
+            -- skip recipes with missing price data
+          else
+            local p = chanceForSkill(skill, info.recipe)
+            if p > 0 then
+              local crafts = 1 / p
+              local cost, missing = estimateCostForCrafts(info, crafts, ownedMap)
+              local score = (missing > 0) and 1e18 or cost
+              table.insert(candidates, { info = info, score = score, cost = cost, missing = missing, p = p, crafts = crafts })
+            end
           end
         end
       end
-    end
-    table.sort(candidates, function(a, b)
-      if a.missing == b.missing then return a.score < b.score end
-      return a.missing < b.missing
-    end)
-    local lines = {}
-    table.insert(lines, "Top candidates for skill " .. tostring(skill) .. ":")
-    for i = 1, math.min(5, #candidates) do
-      local c = candidates[i]
-      table.insert(lines, string.format("  #%d %s (p=%.2f, crafts~%.1f, cost=%s, missing=%d)",
-        i,
-        c.info.name or c.info.recipeId or "recipe",
-        c.p,
-        c.crafts,
-        copperToText(math.floor(c.cost + 0.5)),
-        c.missing))
-    end
-    if #candidates > 0 then
-      local top = candidates[1]
-      table.insert(lines, "  Top reagents:")
-      for itemId, qty in pairs(top.info.leaf or {}) do
-        local ownedQty = ownedMap[itemId] or 0
-      local price = prices[itemId]
-      if not price then
-        price = getVendorPrice(itemId)
+      table.sort(candidates, function(a, b)
+        if a.missing == b.missing then return a.score < b.score end
+        return a.missing < b.missing
+      end)
+      local lines = {}
+      table.insert(lines, "Top candidates for skill " .. tostring(skill) .. ":")
+      for i = 1, math.min(5, #candidates) do
+        local c = candidates[i]
+        table.insert(lines, string.format("  #%d %s (p=%.2f, crafts~%.1f, cost=%s, missing=%d)",
+          i,
+          c.info.name or c.info.recipeId or "recipe",
+          c.p,
+          c.crafts,
+          copperToText(math.floor(c.cost + 0.5)),
+          c.missing))
+      end
+      if #candidates > 0 then
+        local top = candidates[1]
+        table.insert(lines, "  Top reagents:")
+        for itemId, qty in pairs(top.info.leaf or {}) do
+          local ownedQty = ownedMap[itemId] or 0
+        local price = prices[itemId]
+        if not price then
+          price = getVendorPrice(itemId)
+        end
+          table.insert(lines, string.format("    - %s (%d): qty %s, owned %s, price %s",
+            getItemName(itemId), itemId, tostring(qty), tostring(ownedQty), tostring(price)))
+        end
       end
-        table.insert(lines, string.format("    - %s (%d): qty %s, owned %s, price %s",
-          getItemName(itemId), itemId, tostring(qty), tostring(ownedQty), tostring(price)))
+      if #candidates == 0 then
+        table.insert(lines, "  (no candidates in current skill window)")
       end
+      FrugalForgeDB.lastCandidateDebugLines = lines
     end
-    if #candidates == 0 then
-      table.insert(lines, "  (no candidates in current skill window)")
-    end
-    FrugalForgeDB.lastCandidateDebugLines = lines
-  end
 
-  for _, r in ipairs(recipes) do
-    if type(r) == "table" then
-      if r.cooldownSeconds and r.cooldownSeconds > 0 then
-        -- skip cooldown recipes
-      else
-      local reagents = nil
-      if type(r.reagentsWithQty) == "table" and #r.reagentsWithQty > 0 then
-        reagents = r.reagentsWithQty
-      elseif type(r.reagents) == "table" and #r.reagents > 0 and type(r.reagents[1]) == "table" then
-        reagents = r.reagents
-      elseif type(r.reagents) == "table" then
-        reagents = {}
-        for _, itemId in ipairs(r.reagents) do
-          table.insert(reagents, { itemId = itemId, qty = 1 })
-        end
-      end
-      if not reagents then
-        -- skip
-      else
+    for _, r in ipairs(recipes) do
+      if type(r) == "table" then
+        if r.cooldownSeconds and r.cooldownSeconds > 0 then
+          -- skip cooldown recipes
+        else
+        local reagents = nil
+        if type(r.reagentsWithQty) == "table" and #r.reagentsWithQty > 0 then
+          reagents = r.reagentsWithQty
+        elseif type(r.reagents) == "table" and #r.reagents > 0 and type(r.reagents[1]) == "table" then
+          reagents = r.reagents
+        elseif type(r.reagents) == "table" then
+          reagents = {}
+          for _, itemId in ipairs(r.reagents) do
+            table.insert(reagents, { itemId = itemId, qty = 1 })
+          end
+        end
+        if not reagents then
+          -- skip
+        else
 
-      local leaf = {}
-      local inter = {}
-      local visited = {}
-      for _, entry in ipairs(reagents) do
-        local itemId = tonumber(entry.itemId or entry.id or entry[1])
-        local qty = entry.qty or entry.quantity or 1
-        if itemId and qty and qty > 0 then
-          expandItem(itemId, qty, visited, leaf, inter)
+        local leaf = {}
+        local inter = {}
+        local visited = {}
+        for _, entry in ipairs(reagents) do
+          local itemId = tonumber(entry.itemId or entry.id or entry[1])
+          local qty = entry.qty or entry.quantity or 1
+          if itemId and qty and qty > 0 then
+            expandItem(itemId, qty, visited, leaf, inter)
+          end
         end
-      end
 
-      local costPerCraft = 0
-      local missing = 0
-      local missingPriceCount = 0
-      for itemId, qty in pairs(leaf) do
-      local price = prices[itemId]
-      if not price then
-        price = getVendorPrice(itemId)
-      end
-        local ownedQty = ownedMap[itemId] or 0
-        if price then
-          local ownedUse = math.min(qty, ownedQty)
-          costPerCraft = costPerCraft + (price * (qty - ownedUse))
-        else
-          if ownedQty < qty then
-            missing = missing + 1
-            missingPriceCount = missingPriceCount + 1
+        local costPerCraft = 0
+        local missing = 0
+        local missingPriceCount = 0
+        for itemId, qty in pairs(leaf) do
+        local price = prices[itemId]
+        if not price then
+          price = getVendorPrice(itemId)
+        end
+          local ownedQty = notePlanRead("map", itemId, ownedMap[itemId] or 0)
+          if price then
+            local ownedUse = math.min(qty, ownedQty)
+            costPerCraft = costPerCraft + (price * (qty - ownedUse))
+          else
+            if ownedQty < qty then
+              missing = missing + 1
+              missingPriceCount = missingPriceCount + 1
+            end
           end
         end
-      end
 
-      local recipeItemId = tonumber(r.recipeItemId or r.recipeItem or r.recipeItemID)
-      local recipeVendorPrice = resolveRecipeVendorPrice(recipeItemId, r.recipeVendorPrice)
-      if r.requiresRecipe and not recipeVendorPrice then
-        missing = missing + 1
-      end
+        local recipeItemId = tonumber(r.recipeItemId or r.recipeItem or r.recipeItemID)
+        local recipeVendorPrice = resolveRecipeVendorPrice(recipeItemId, r.recipeVendorPrice)
+        if r.requiresRecipe and not recipeVendorPrice then
+          missing = missing + 1
+        end
 
-      local infoEntry = {
-        recipe = r,
-        recipeId = r.recipeId,
-        minSkill = r.minSkill or 0,
-        grayAt = r.grayAt or (r.greenUntil or r.yellowUntil or r.minSkill or 0),
-        name = r.name or r.recipeId or "recipe",
-        outputItemId = r.createsItemId,
-        leaf = leaf,
-        inter = inter,
-        costPerCraft = costPerCraft,
-        missing = missing,
-        missingPriceCount = missingPriceCount,
-        requiresRecipe = r.requiresRecipe == true,
-        recipeItemId = recipeItemId,
-        recipeVendorPrice = recipeVendorPrice,
-      }
-      table.insert(recipeInfos, infoEntry)
-      if isTrackedRecipeId(r.recipeId) then
-        trackedRecipeInfoById[r.recipeId] = infoEntry
+        local infoEntry = {
+          recipe = r,
+          recipeId = r.recipeId,
+          minSkill = r.minSkill or 0,
+          grayAt = r.grayAt or (r.greenUntil or r.yellowUntil or r.minSkill or 0),
+          name = r.name or r.recipeId or "recipe",
+          outputItemId = r.createsItemId,
+          leaf = leaf,
+          inter = inter,
+          costPerCraft = costPerCraft,
+          missing = missing,
+          missingPriceCount = missingPriceCount,
+          requiresRecipe = r.requiresRecipe == true,
+          recipeItemId = recipeItemId,
+          recipeVendorPrice = recipeVendorPrice,
+        }
+        table.insert(recipeInfos, infoEntry)
+        if isTrackedRecipeId(r.recipeId) then
+          trackedRecipeInfoById[r.recipeId] = infoEntry
+        end
+        end
       end
       end
     end
-    end
-  end
 
-  local viableCount = 0
-  for _, info in ipairs(recipeInfos) do
-    if not (info.missingPriceCount and info.missingPriceCount > 0) then
-      viableCount = viableCount + 1
+    local viableCount = 0
+    for _, info in ipairs(recipeInfos) do
+      if not (info.missingPriceCount and info.missingPriceCount > 0) then
+        viableCount = viableCount + 1
+      end
     end
-  end
-  if #recipeInfos == 0 or viableCount == 0 then
-    if FrugalForgeDB.settings and FrugalForgeDB.settings.debug then
-      FrugalForgeDB.lastCandidateDebugLines = { "Top candidates unavailable (no recipes)" }
+    if #recipeInfos == 0 or viableCount == 0 then
+      if FrugalForgeDB.settings and FrugalForgeDB.settings.debug then
+        FrugalForgeDB.lastCandidateDebugLines = { "Top candidates unavailable (no recipes)" }
+      end
+      return nil
     end
-    local msg = "No viable recipes found for the selected skill range. Missing prices prevent planning. Run Scan Missing or expand your scan."
-    FrugalForgeDB.lastPlan = {
-      generatedAt = ts(),
-      generatedAtEpochUtc = time(),
-      snapshotTimestampUtc = snap and snap.snapshotTimestampUtc or nil,
-      ownedTimestampUtc = owned and owned.snapshotTimestampUtc or nil,
-      staleWarning = msg,
-      stepsText = "",
-      shoppingText = "",
-      summaryText = msg,
-    }
-    updateUi()
-    return
-  end
 
-  local missingForPlan = {}
-  for _, info in ipairs(recipeInfos) do
-    for itemId in pairs(info.leaf or {}) do
-      if not prices[itemId] and not isVendorItem(itemId) and shouldTrackMissingPrice(itemId) then
-        missingForPlan[itemId] = true
+    local missingForPlan = {}
+    for _, info in ipairs(recipeInfos) do
+      for itemId in pairs(info.leaf or {}) do
+        if not prices[itemId] and not isVendorItem(itemId) and shouldTrackMissingPrice(itemId) then
+          missingForPlan[itemId] = true
+        end
       end
     end
-  end
-  local missingForPlanCount = 0
-  for _ in pairs(missingForPlan) do missingForPlanCount = missingForPlanCount + 1 end
-  local missingIds = {}
-  for itemId in pairs(missingForPlan) do
-    table.insert(missingIds, itemId)
-  end
-
-  if FrugalForgeDB.settings and FrugalForgeDB.settings.debug then
-    logTopCandidates(currentSkill)
-    if type(FrugalForgeDB.lastCandidateDebugLines) ~= "table" then
-      FrugalForgeDB.lastCandidateDebugLines = { "Top candidates unavailable (no data)" }
+    local missingForPlanCount = 0
+    for _ in pairs(missingForPlan) do missingForPlanCount = missingForPlanCount + 1 end
+    local missingIds = {}
+    for itemId in pairs(missingForPlan) do
+      table.insert(missingIds, itemId)
     end
-    if trackedDebugLines then
-      table.insert(trackedDebugLines, "Tracked recipe diagnostics:")
-      for _, trackedId in ipairs(trackedRecipeOrder) do
-        local info = trackedRecipeInfoById[trackedId]
-        if not info then
-          table.insert(trackedDebugLines, string.format("  - %s: not present in active recipe targets", trackedId))
-        else
-          table.insert(trackedDebugLines, string.format(
-            "  - %s: min=%d grayAt=%d missingPriceCount=%d requiresRecipe=%s recipeVendor=%s known=%s",
-            trackedId,
-            info.minSkill or 0,
-            info.grayAt or 0,
-            info.missingPriceCount or 0,
-            tostring(info.requiresRecipe == true),
-            info.recipeVendorPrice and copperToText(info.recipeVendorPrice) or "n/a",
-            tostring(isRecipeKnown(info))
-          ))
-          local leafIds = {}
-          for itemId in pairs(info.leaf or {}) do
-            table.insert(leafIds, itemId)
-          end
-          table.sort(leafIds)
-          for _, itemId in ipairs(leafIds) do
-            local qty = info.leaf[itemId] or 0
-            local price = prices[itemId]
-            if not price then
-              price = getVendorPrice(itemId)
-            end
-            local ownedQty = getOwnedCount(itemId, "selection")
-            local blocks = (not price) and (ownedQty < qty)
+
+    if FrugalForgeDB.settings and FrugalForgeDB.settings.debug then
+      logTopCandidates(currentSkill)
+      if type(FrugalForgeDB.lastCandidateDebugLines) ~= "table" then
+        FrugalForgeDB.lastCandidateDebugLines = { "Top candidates unavailable (no data)" }
+      end
+      if trackedDebugLines then
+        table.insert(trackedDebugLines, "Tracked recipe diagnostics:")
+        for _, trackedId in ipairs(trackedRecipeOrder) do
+          local info = trackedRecipeInfoById[trackedId]
+          if not info then
+            table.insert(trackedDebugLines, string.format("  - %s: not present in active recipe targets", trackedId))
+          else
             table.insert(trackedDebugLines, string.format(
-              "      * %s (%d): qty=%s owned(selection)=%s price=%s blocks=%s",
-              getItemName(itemId), itemId, tostring(qty), tostring(ownedQty),
-              price and copperToText(price) or "missing",
-              tostring(blocks == true)
+              "  - %s: min=%d grayAt=%d missingPriceCount=%d requiresRecipe=%s recipeVendor=%s known=%s",
+              trackedId,
+              info.minSkill or 0,
+              info.grayAt or 0,
+              info.missingPriceCount or 0,
+              tostring(info.requiresRecipe == true),
+              info.recipeVendorPrice and copperToText(info.recipeVendorPrice) or "n/a",
+              tostring(isRecipeKnown(info))
             ))
+            local leafIds = {}
+            for itemId in pairs(info.leaf or {}) do
+              table.insert(leafIds, itemId)
+            end
+            table.sort(leafIds)
+            for _, itemId in ipairs(leafIds) do
+              local qty = info.leaf[itemId] or 0
+              local price = prices[itemId]
+              if not price then
+                price = getVendorPrice(itemId)
+              end
+              local ownedQty = getOwnedCount(itemId, "selection")
+              local blocks = (not price) and (ownedQty < qty)
+              table.insert(trackedDebugLines, string.format(
+                "      * %s (%d): qty=%s owned(selection)=%s price=%s blocks=%s",
+                getItemName(itemId), itemId, tostring(qty), tostring(ownedQty),
+                price and copperToText(price) or "missing",
+                tostring(blocks == true)
+              ))
+            end
           end
         end
       end
     end
-  end
 
-  local ownedRemainingSelection = {}
-  local ownedRecipes = {}
-  local function recipePriorityFactor(info)
-    local recipeId = info and info.recipe and info.recipe.recipeId
-    if recipeId == "bolt-of-netherweave" then
-      return 0.75
-    end
-    if recipeId == "bolt-of-imbued-netherweave" then
-      return 0.70
-    end
-    if info and info.requiresRecipe and info.recipeVendorPrice then
-      return 0.90
+    local ownedRemainingSelection = {}
+    local ownedRecipes = {}
+    local function recipePriorityFactor(info)
+      local recipeId = info and info.recipe and info.recipe.recipeId
+      if recipeId == "bolt-of-netherweave" then
+        return 0.75
+      end
+      if recipeId == "bolt-of-imbued-netherweave" then
+        return 0.70
+      end
+      if info and info.requiresRecipe and info.recipeVendorPrice then
+        return 0.90
+      end
+      return 1
     end
-    return 1
-  end
 
-  local function amortizedRecipeScoreCost(skill, info, recipeCost)
-    if not recipeCost or recipeCost <= 0 then return 0 end
-    local startSkill = math.max(skill, info.minSkill or skill)
-    local endSkill = math.min(targetSkill - 1, (info.grayAt or (startSkill + 1)) - 1)
-    local remainingSkills = endSkill - startSkill + 1
-    if remainingSkills < 1 then remainingSkills = 1 end
-    return recipeCost / remainingSkills
-  end
+    local function amortizedRecipeScoreCost(skill, info, recipeCost)
+      if not recipeCost or recipeCost <= 0 then return 0 end
+      local startSkill = math.max(skill, info.minSkill or skill)
+      local endSkill = math.min(targetSkill - 1, (info.grayAt or (startSkill + 1)) - 1)
+      local remainingSkills = endSkill - startSkill + 1
+      if remainingSkills < 1 then remainingSkills = 1 end
+      return recipeCost / remainingSkills
+    end
 
-  local chosenBySkill = {}
-  for skill = currentSkill, targetSkill - 1 do
-    local best = nil
-    local trackedSkillState = nil
-    if trackedDebugLines and skill >= 295 and skill <= 360 then
-      trackedSkillState = {}
+    -- Per skill bucket, the recipeInfos that can be live in it (in recipeInfos order, so
+    -- ties resolve exactly as in a full scan). Targets live in SavedVariables and may
+    -- predate the loaded data, so any recipe the index does not describe identically
+    -- disables the index for this plan.
+    local function buildInfoBuckets()
+      local buckets, bucketSize = getSkillIndex(professionData)
+      if not buckets then return nil, nil end
+      local dataIndexByRecipeId = {}
+      for idx, r in ipairs(professionData.recipes) do
+        if r.recipeId then dataIndexByRecipeId[r.recipeId] = idx end
+      end
+      local infoByDataIndex = {}
+      local orderByInfo = {}
+      for order, info in ipairs(recipeInfos) do
+        local idx = info.recipeId and dataIndexByRecipeId[info.recipeId]
+        local r = idx and professionData.recipes[idx]
+        if not r or (r.minSkill or 0) ~= info.minSkill or r.grayAt ~= info.grayAt then
+          return nil, nil
+        end
+        infoByDataIndex[idx] = info
+        orderByInfo[info] = order
+      end
+      local infoBuckets = {}
+      for bucket, indices in pairs(buckets) do
+        local infos = {}
+        for _, idx in ipairs(indices) do
+          local info = infoByDataIndex[idx]
+          if info then table.insert(infos, info) end
+        end
+        table.sort(infos, function(a, b) return orderByInfo[a] < orderByInfo[b] end)
+        infoBuckets[bucket] = infos
+      end
+      return infoBuckets, bucketSize
     end
-    for _, info in ipairs(recipeInfos) do
-      local recipeId = info.recipeId or (info.recipe and info.recipe.recipeId)
-      if skill >= info.minSkill and skill < info.grayAt then
-        if info.missingPriceCount and info.missingPriceCount > 0 then
-          if trackedSkillState and isTrackedRecipeId(recipeId) then
-            trackedSkillState[recipeId] = string.format("blocked: missingPriceCount=%d", info.missingPriceCount or 0)
-          end
-          -- skip recipes with missing price data
-        else
-          local p = chanceForSkill(skill, info.recipe)
-          if p > 0 then
-            local crafts = 1 / p
-            local cost, missing = estimateCostForCrafts(info, crafts, ownedRemainingSelection)
-            local rawCost, rawMissing = estimateCostForCraftsNoOwned(info, crafts)
-            local recipeKey = info.recipeItemId or (info.recipe and info.recipe.recipeId) or info.recipeId or info.name
-            local recipeCost = 0
-            if info.requiresRecipe and info.recipeVendorPrice and recipeKey and not ownedRecipes[recipeKey] and not isRecipeKnown(info) then
-              recipeCost = info.recipeVendorPrice
-            end
-            if recipeCost > 0 then
-              cost = cost + recipeCost
-              rawCost = rawCost + recipeCost
-            end
-            local scoreCost = cost
-            local scoreRawCost = rawCost
-            if recipeCost > 0 then
-              local amortizedCost = amortizedRecipeScoreCost(skill, info, recipeCost)
-              scoreCost = scoreCost - recipeCost + amortizedCost
-              scoreRawCost = scoreRawCost - recipeCost + amortizedCost
-            end
-            local priorityFactor = recipePriorityFactor(info)
-            scoreCost = scoreCost * priorityFactor
-            scoreRawCost = scoreRawCost * priorityFactor
+    local infoBuckets, infoBucketSize = buildInfoBuckets()
+
+    local chosenBySkill = {}
+    for skill = currentSkill, targetSkill - 1 do
+      local best = nil
+      local trackedSkillState = nil
+      if trackedDebugLines and skill >= 295 and skill <= 360 then
+        trackedSkillState = {}
+      end
+      local candidates = recipeInfos
+      if infoBuckets then
+        candidates = infoBuckets[math.floor(skill / infoBucketSize)] or {}
+      end
+      for _, info in ipairs(candidates) do
+        local recipeId = info.recipeId or (info.recipe and info.recipe.recipeId)
+        if skill >= info.minSkill and skill < info.grayAt then
+          if info.missingPriceCount and info.missingPriceCount > 0 then
             if trackedSkillState and isTrackedRecipeId(recipeId) then
-              trackedSkillState[recipeId] = string.format(
-                "candidate: p=%.2f score=%s expected=%s missing=%d",
-                p,
-                copperToText(math.floor(scoreCost + 0.5)),
-                copperToText(math.floor(cost + 0.5)),
-                missing
-              )
+              trackedSkillState[recipeId] = string.format("blocked: missingPriceCount=%d", info.missingPriceCount or 0)
             end
-            if not best
-              or missing < best.missing
-              or (missing == best.missing and scoreCost < best.scoreCost)
-              or (missing == best.missing and scoreCost == best.scoreCost and rawMissing < best.rawMissing)
-              or (missing == best.missing and scoreCost == best.scoreCost and rawMissing == best.rawMissing and scoreRawCost < best.scoreRawCost) then
-              best = {
-                info = info,
-                p = p,
-                crafts = crafts,
-                expectedCost = cost,
-                missing = missing,
-                rawCost = rawCost,
-                rawMissing = rawMissing,
-                scoreCost = scoreCost,
-                scoreRawCost = scoreRawCost
-              }
+            -- skip recipes with missing price data
+          else
+            local p = chanceForSkill(skill, info.recipe)
+            if p > 0 then
+              local crafts = 1 / p
+              local cost, missing = estimateCostForCrafts(info, crafts, ownedRemainingSelection)
+              local rawCost, rawMissing = estimateCostForCraftsNoOwned(info, crafts)
+              local recipeKey = info.recipeItemId or (info.recipe and info.recipe.recipeId) or info.recipeId or info.name
+              local recipeCost = 0
+              if info.requiresRecipe and info.recipeVendorPrice and recipeKey and not ownedRecipes[recipeKey] and not isRecipeKnown(info) then
+                recipeCost = info.recipeVendorPrice
+              end
+              if recipeCost > 0 then
+                cost = cost + recipeCost
+                rawCost = rawCost + recipeCost
+              end
+              local scoreCost = cost
+              local scoreRawCost = rawCost
+              if recipeCost > 0 then
+                local amortizedCost = amortizedRecipeScoreCost(skill, info, recipeCost)
+                scoreCost = scoreCost - recipeCost + amortizedCost
+                scoreRawCost = scoreRawCost - recipeCost + amortizedCost
+              end
+              local priorityFactor = recipePriorityFactor(info)
+              scoreCost = scoreCost * priorityFactor
+              scoreRawCost = scoreRawCost * priorityFactor
+              if trackedSkillState and isTrackedRecipeId(recipeId) then
+                trackedSkillState[recipeId] = string.format(
+                  "candidate: p=%.2f score=%s expected=%s missing=%d",
+                  p,
+                  copperToText(math.floor(scoreCost + 0.5)),
+                  copperToText(math.floor(cost + 0.5)),
+                  missing
+                )
+              end
+              if not best
+                or missing < best.missing
+                or (missing == best.missing and scoreCost < best.scoreCost)
+                or (missing == best.missing and scoreCost == best.scoreCost and rawMissing < best.rawMissing)
+                or (missing == best.missing and scoreCost == best.scoreCost and rawMissing == best.rawMissing and scoreRawCost < best.scoreRawCost) then
+                best = {
+                  info = info,
+                  p = p,
+                  crafts = crafts,
+                  expectedCost = cost,
+                  missing = missing,
+                  rawCost = rawCost,
+                  rawMissing = rawMissing,
+                  scoreCost = scoreCost,
+                  scoreRawCost = scoreRawCost
+                }
+              end
+            elseif trackedSkillState and isTrackedRecipeId(recipeId) then
+              trackedSkillState[recipeId] = "blocked: skill-up chance is 0"
             end
-          elseif trackedSkillState and isTrackedRecipeId(recipeId) then
-            trackedSkillState[recipeId] = "blocked: skill-up chance is 0"
           end
         end
       end
-    end
-    if trackedSkillState then
-      local winnerName = best and (best.info.name or best.info.recipeId or "none") or "none"
-      local states = {}
-      for _, trackedId in ipairs(trackedRecipeOrder) do
-        local state = trackedSkillState[trackedId]
-        if not state then
-          local trackedInfo = trackedRecipeInfoById[trackedId]
-          if not trackedInfo then
-            state = "not in active targets"
-          elseif skill < (trackedInfo.minSkill or 0) or skill >= (trackedInfo.grayAt or 0) then
-            state = "out-of-window"
-          else
-            state = "not evaluated"
+      if trackedSkillState then
+        local winnerName = best and (best.info.name or best.info.recipeId or "none") or "none"
+        local states = {}
+        for _, trackedId in ipairs(trackedRecipeOrder) do
+          local state = trackedSkillState[trackedId]
+          if not state then
+            local trackedInfo = trackedRecipeInfoById[trackedId]
+            if not trackedInfo then
+              state = "not in active targets"
+            elseif skill < (trackedInfo.minSkill or 0) or skill >= (trackedInfo.grayAt or 0) then
+              state = "out-of-window"
+            else
+              state = "not evaluated"
+            end
           end
+          table.insert(states, trackedId .. "=" .. state)
+        end
+        table.insert(trackedDebugLines, string.format("  skill %d winner=%s | %s", skill, winnerName, table.concat(states, " | ")))
+      end
+      if not best then break end
+      chosenBySkill[skill] = best
+      if best.info.requiresRecipe and best.info.recipeVendorPrice then
+        local recipeKey = best.info.recipeItemId or (best.info.recipe and best.info.recipe.recipeId) or best.info.recipeId or best.info.name
+        if recipeKey then
+          ownedRecipes[recipeKey] = true
         end
-        table.insert(states, trackedId .. "=" .. state)
       end
-      table.insert(trackedDebugLines, string.format("  skill %d winner=%s | %s", skill, winnerName, table.concat(states, " | ")))
+      consumeOwnedForCrafts(best.info, best.crafts, ownedRemainingSelection)
     end
-    if not best then break end
-    chosenBySkill[skill] = best
-    if best.info.requiresRecipe and best.info.recipeVendorPrice then
-      local recipeKey = best.info.recipeItemId or (best.info.recipe and best.info.recipe.recipeId) or best.info.recipeId or best.info.name
-      if recipeKey then
-        ownedRecipes[recipeKey] = true
+    if trackedDebugLines and #trackedDebugLines > 0 then
+      FrugalForgeDB.lastCandidateDebugLines = FrugalForgeDB.lastCandidateDebugLines or {}
+      table.insert(FrugalForgeDB.lastCandidateDebugLines, "")
+      for _, line in ipairs(trackedDebugLines) do
+        table.insert(FrugalForgeDB.lastCandidateDebugLines, line)
       end
     end
-    consumeOwnedForCrafts(best.info, best.crafts, ownedRemainingSelection)
-  end
-  if trackedDebugLines and #trackedDebugLines > 0 then
-    FrugalForgeDB.lastCandidateDebugLines = FrugalForgeDB.lastCandidateDebugLines or {}
-    table.insert(FrugalForgeDB.lastCandidateDebugLines, "")
-    for _, line in ipairs(trackedDebugLines) do
-      table.insert(FrugalForgeDB.lastCandidateDebugLines, line)
+    if planKeys then
+      PLAN_CACHE.sim = {
+        key = planKeys.sim,
+        chosenBySkill = chosenBySkill,
+        missingForPlanCount = missingForPlanCount,
+        reads = planReads.sim,
+        ownedValueFactor = ownedValueFactor,
+      }
     end
+    return chosenBySkill, missingForPlanCount
   end
 
+  local chosenBySkill, missingForPlanCount = simulateSkills()
+  if not chosenBySkill then
+    local msg = "No viable recipes found for the selected skill range. Missing prices prevent planning. Run Scan Missing or expand your scan."
+    FrugalForgeDB.lastPlan = {
+      generatedAt = ts(),
+      generatedAtEpochUtc = time(),
+      snapshotTimestampUtc = snap and snap.snapshotTimestampUtc or nil,
+      ownedTimestampUtc = owned and owned.snapshotTimestampUtc or nil,
+      staleWarning = msg,
+      stepsText = "",
+      shoppingText = "",
+      summaryText = msg,
+    }
+    updateUi()
+    return
+  end
+  planReads.phase = "shop"
+
   local ranges = {}
   local current = nil
   for skill = currentSkill, targetSkill - 1 do
@@ -2719,6 +2962,10 @@ local function generatePlan()
     end)(),
   }
 
+  if planKeys and not planReads.unresolvedLinks then
+    PLAN_CACHE.full = { key = planKeys.full, plan = FrugalForgeDB.lastPlan, reads = { planReads.sim, planReads.shop } }
+  end
+
   -- keep quiet; no chat spam on plan updates
   updateUi()
 end
@@ -25,6 +25,8 @@ local function EnsureDb()
   if type(s.priceRank) ~= "number" then s.priceRank = 3 end
 
   s.verboseDebug = (s.verboseDebug == true)
+  -- The export JSON is built on demand now; drop the copy older versions persisted.
+  FrugalScanDB.lastSnapshotJson = nil
 end
 
 EnsureDb()
@@ -428,10 +430,146 @@ local function TryNextPageViaUi()
   return true
 end
 
+-- lastSnapshot.prices and lastSnapshot.scannedAt are saved packed into one string
+-- (PLAYER_LOGOUT) and unpacked on first use: entries sorted by itemId, each
+-- "<itemId delta>,<minUnitBuyoutCopper>,<totalQuantity>,<seconds scanned before
+-- generatedAtEpochUtc>" in base 36, separated by ";" (an empty field is nil). An item that
+-- was scanned but not found has empty price and quantity fields. Version 1 strings have no
+-- scan time field. tools/datapacks/snapshot_codec.py reads and writes the same format.
+local SNAPSHOT_PACK_VERSION = 2
+local BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+local function ToBase36(n)
+  n = math.floor(n)
+  if n <= 0 then return "0" end
+  local digits = {}
+  while n > 0 do
+    local d = n % 36
+    table.insert(digits, 1, string.sub(BASE36_DIGITS, d + 1, d + 1))
+    n = math.floor(n / 36)
+  end
+  return table.concat(digits)
+end
+
+local function PackSnapshotPrices(prices, scannedAt, snapshotAt)
+  local byItem = {}
+  local itemIds = {}
+  for _, p in ipairs(prices) do
+    local itemId = tonumber(p.itemId)
+    if itemId and itemId > 0 and not byItem[itemId] then
+      byItem[itemId] = p
+      table.insert(itemIds, itemId)
+    end
+  end
+  for itemId in pairs(scannedAt or {}) do
+    itemId = tonumber(itemId)
+    if itemId and itemId > 0 and not byItem[itemId] then
+      byItem[itemId] = false
+      table.insert(itemIds, itemId)
+    end
+  end
+  table.sort(itemIds)
+
+  local parts = {}
+  local lastItemId = 0
+  for _, itemId in ipairs(itemIds) do
+    local p = byItem[itemId] or {}
+    local price = tonumber(p.minUnitBuyoutCopper)
+    local qty = tonumber(p.totalQuantity)
+    local at = scannedAt and tonumber(scannedAt[itemId])
+    table.insert(parts, ToBase36(itemId - lastItemId) .. "," .. (price and ToBase36(price) or "") .. "," .. (qty and ToBase36(qty) or "") .. "," .. (at and ToBase36(snapshotAt - at) or ""))
+    lastItemId = itemId
+  end
+  return table.concat(parts, ";")
+end
+
+local function UnpackSnapshotPrices(packed, snapshotAt)
+  local prices = {}
+  local scannedAt = {}
+  local itemId = 0
+  for delta, price, qty, ago in string.gmatch(packed, "(%w+),(%w*),(%w*),?(%w*)") do
+    itemId = itemId + tonumber(delta, 36)
+    if price ~= "" or qty ~= "" then
+      table.insert(prices, {
+        itemId = itemId,
+        minUnitBuyoutCopper = (price ~= "" and tonumber(price, 36)) or nil,
+        totalQuantity = (qty ~= "" and tonumber(qty, 36)) or nil,
+      })
+    end
+    if ago ~= "" then
+      scannedAt[itemId] = snapshotAt - tonumber(ago, 36)
+    end
+  end
+  return prices, scannedAt
+end
+
+local function GetLastSnapshot()
+  local snap = FrugalScanDB and FrugalScanDB.lastSnapshot
+  if type(snap) ~= "table" then return nil end
+  if type(snap.packedPrices) == "string" then
+    if snap.pricesPackVersion == SNAPSHOT_PACK_VERSION then
+      snap.prices, snap.scannedAt = UnpackSnapshotPrices(snap.packedPrices, tonumber(snap.generatedAtEpochUtc) or 0)
+    elseif snap.pricesPackVersion == 1 then
+      -- Saved before scan times were packed; they are still a separate table.
+      snap.prices = UnpackSnapshotPrices(snap.packedPrices, 0)
+    else
+      snap.prices = snap.prices or {}
+    end
+    snap.packedPrices = nil
+    snap.pricesPackVersion = nil
+  end
+  return snap
+end
+
+_G.FrugalScan_GetLastSnapshot = GetLastSnapshot
+
+local snapshotPackFrame = CreateFrame("Frame")
+snapshotPackFrame:RegisterEvent("PLAYER_LOGOUT")
+snapshotPackFrame:SetScript("OnEvent", function()
+  local snap = FrugalScanDB and FrugalScanDB.lastSnapshot
+  if type(snap) == "table" and type(snap.prices) == "table" then
+    local scannedAt = type(snap.scannedAt) == "table" and snap.scannedAt or nil
+    snap.packedPrices = PackSnapshotPrices(snap.prices, scannedAt, tonumber(snap.generatedAtEpochUtc) or 0)
+    snap.pricesPackVersion = SNAPSHOT_PACK_VERSION
+    snap.prices = nil
+    snap.scannedAt = nil
+  end
+end)
+
+-- Which of the cheapest unit buyouts an item is priced at: 1 is the lowest, 3 the third lowest.
+local function ScanPriceRank()
+  local rank = math.floor(tonumber(GetSetting("priceRank", 3)) or 3)
+  if rank < 1 then rank = 1 end
+  return rank
+end
+
+local function IsSameScanRealm(snap)
+  return snap ~= nil and snap.realmName == GetRealmName() and snap.faction == UnitFactionGroup("player")
+end
+
+-- Longest staleness budget in FrugalForgeScanHints; scan times older than this can no longer
+-- justify a skip and are dropped from the snapshot.
+local scanHintMaxStaleHours = nil
+local function ScanHintMaxStaleHours()
+  if scanHintMaxStaleHours == nil then
+    scanHintMaxStaleHours = 0
+    local hints = type(_G.FrugalForgeScanHints) == "table" and _G.FrugalForgeScanHints.items or nil
+    if type(hints) == "table" then
+      for _, hint in pairs(hints) do
+        local hours = type(hint) == "table" and tonumber(hint.staleHours) or 0
+        if hours > scanHintMaxStaleHours then scanHintMaxStaleHours = hours end
+      end
+    end
+  end
+  return scanHintMaxStaleHours
+end
+
 local function StartSnapshot()
   state.prices = {}
-  if state.mergeWithLast == true and FrugalScanDB and type(FrugalScanDB.lastSnapshot) == "table" and type(FrugalScanDB.lastSnapshot.prices) == "table" then
-    for _, p in ipairs(FrugalScanDB.lastSnapshot.prices) do
+  state.scannedAt = {}
+  local last = GetLastSnapshot()
+  if state.mergeWithLast == true and IsSameScanRealm(last) and type(last.prices) == "table" then
+    for _, p in ipairs(last.prices) do
       if p and p.itemId then
         state.prices[p.itemId] = {
           bestUnits = { p.minUnitBuyoutCopper },
@@ -497,11 +635,22 @@ local function BuildExportJsonFromSnapshot(snap)
   if snap.targetProfessionName then
     table.insert(parts, ',"targetProfessionName":"' .. tostring(snap.targetProfessionName) .. '"')
   end
+  if snap.priceRank then
+    table.insert(parts, ',"priceRank":' .. tostring(snap.priceRank))
+  end
   table.insert(parts, ',"prices":[')
 
+  -- scannedAt marks the items this scan (or a recent one it carried over) actually queried;
+  -- entries without it are prices carried over from an older scan.
+  local scannedAt = type(snap.scannedAt) == "table" and snap.scannedAt or {}
   for i, p in ipairs(snap.prices or {}) do
     if i > 1 then table.insert(parts, ",") end
-    table.insert(parts, string.format('{"itemId":%d,"minUnitBuyoutCopper":%d,"totalQuantity":%d}', p.itemId, p.minUnitBuyoutCopper or 0, p.totalQuantity or 0))
+    local at = tonumber(scannedAt[p.itemId])
+    table.insert(parts, string.format('{"itemId":%d,"minUnitBuyoutCopper":%d,"totalQuantity":%d', p.itemId, p.minUnitBuyoutCopper or 0, p.totalQuantity or 0))
+    if at then
+      table.insert(parts, string.format(',"scannedAt":%d', at))
+    end
+    table.insert(parts, "}")
   end
 
   table.insert(parts, "]}")
@@ -509,7 +658,7 @@ local function BuildExportJsonFromSnapshot(snap)
 end
 
 local function FinishSnapshot()
-  local rank = 3
+  local rank = ScanPriceRank()
 
   local realmName = GetRealmName()
   local realmSlug = NormalizeRealmSlug(realmName)
@@ -546,12 +695,26 @@ local function FinishSnapshot()
 
   table.sort(snapshot.prices, function(a, b) return a.itemId < b.itemId end)
 
-  if state.mergeWithLast == true then
-  local base = (FrugalScanDB and FrugalScanDB.lastSnapshot) or nil
-    if base and type(base.prices) == "table" then
+  -- Carry prices and scan times over from the last snapshot: all of them when topping up
+  -- missing prices, only the items PrioritizeQueue skipped otherwise, and nothing from
+  -- another realm or faction. Scan times past the longest staleness budget are dropped.
+  snapshot.scannedAt = {}
+  local base = GetLastSnapshot()
+  local mergeAll = state.mergeWithLast == true
+  local skippedItems = state.skippedItems or {}
+  if IsSameScanRealm(base) and (mergeAll or next(skippedItems) ~= nil) then
+    if type(base.scannedAt) == "table" then
+      local keepAfter = time() - ScanHintMaxStaleHours() * 3600
+      for itemId, at in pairs(base.scannedAt) do
+        if (mergeAll or skippedItems[itemId]) and tonumber(at) and at > keepAfter then
+          snapshot.scannedAt[itemId] = at
+        end
+      end
+    end
+    if type(base.prices) == "table" then
       local merged = {}
       for _, p in ipairs(base.prices) do
-        if p and p.itemId then
+        if p and p.itemId and (mergeAll or skippedItems[p.itemId]) then
           merged[p.itemId] = p
         end
       end
@@ -567,10 +730,12 @@ local function FinishSnapshot()
       table.sort(snapshot.prices, function(a, b) return a.itemId < b.itemId end)
     end
   end
+  for itemId, at in pairs(state.scannedAt or {}) do
+    snapshot.scannedAt[itemId] = at
+  end
   state.mergeWithLast = true
 
   FrugalScanDB.lastSnapshot = snapshot
-  FrugalScanDB.lastSnapshotJson = BuildExportJsonFromSnapshot(snapshot)
   FrugalScanDB.lastGeneratedAtEpochUtc = snapshot.generatedAtEpochUtc
 
   state.running = false
@@ -584,11 +749,9 @@ local function FinishSnapshot()
 end
 
 local function BuildExportJson()
-  local snap = FrugalScanDB.lastSnapshot
+  local snap = GetLastSnapshot()
   if not snap then return nil end
-  local json = BuildExportJsonFromSnapshot(snap)
-  FrugalScanDB.lastSnapshotJson = json
-  return json
+  return BuildExportJsonFromSnapshot(snap)
 end
 
 local function ParseItemRef(v)
@@ -677,7 +840,15 @@ local function BuildWantedItemIdSet()
   return wanted, count
 end
 
-local function BuildOwnedCountsByCharacterFromBagBrother(wantedSet)
+local function IsGuildLikeKey(k)
+  if type(k) ~= "string" then return false end
+  local key = string.lower(k)
+  return string.find(key, "guild", 1, true) or string.find(key, "vault", 1, true)
+end
+
+-- Returns this realm's character roots in the bag DB as { name, node } entries, the DB's
+-- global name, and an error message when there is nothing usable.
+local function FindBagBrotherCharacters()
   local function IsAddOnLoadedSafe(addonName)
     if C_AddOns and C_AddOns.IsAddOnLoaded then
       return C_AddOns.IsAddOnLoaded(addonName)
@@ -714,12 +885,6 @@ local function BuildOwnedCountsByCharacterFromBagBrother(wantedSet)
     return nil, nil
   end
 
-  local function IsGuildLikeKey(k)
-    if type(k) ~= "string" then return false end
-    local key = string.lower(k)
-    return string.find(key, "guild", 1, true) or string.find(key, "vault", 1, true)
-  end
-
   local function ExtractCharacterName(k)
     if type(k) ~= "string" then return nil end
     local name = string.match(k, "^(.-)%s%-%s")
@@ -764,38 +929,48 @@ local function BuildOwnedCountsByCharacterFromBagBrother(wantedSet)
   end
 
   if #charRoots == 0 then
-    return nil, nil, "Owned export: could not find realm-specific section in " .. tostring(source) .. ". Refusing to scan entire DB to avoid counting guild bank/other realms. Use /frugalscan owneddebug for diagnostics."
+    return nil, source, "Owned export: could not find realm-specific section in " .. tostring(source) .. ". Refusing to scan entire DB to avoid counting guild bank/other realms. Use /frugalscan owneddebug for diagnostics."
   else
     DebugPrint("Owned export: using " .. tostring(source) .. " realm=\"" .. tostring(realmName) .. "\" characters=" .. tostring(#charRoots))
   end
 
-  local function WalkCounts(node, counts, visited)
-    local tt = type(node)
-    if tt == "table" then
-      if visited[node] then return end
-      visited[node] = true
-      for k, v in pairs(node) do
-        if not IsGuildLikeKey(k) then
-          WalkCounts(v, counts, visited)
-        end
+  return charRoots, source, nil
+end
+
+-- Adds every item stack under node to counts; wantedSet limits the item ids (nil counts all).
+local function WalkOwnedCounts(node, counts, visited, wantedSet)
+  local tt = type(node)
+  if tt == "table" then
+    if visited[node] then return end
+    visited[node] = true
+    for k, v in pairs(node) do
+      if not IsGuildLikeKey(k) then
+        WalkOwnedCounts(v, counts, visited, wantedSet)
       end
-      return
     end
+    return
+  end
 
-    if tt == "string" then
-      local itemId, qty = ParseItemRef(node)
-      if itemId and qty and wantedSet[itemId] then
-        counts[itemId] = (counts[itemId] or 0) + qty
-      end
+  if tt == "string" then
+    local itemId, qty = ParseItemRef(node)
+    if itemId and qty and (not wantedSet or wantedSet[itemId]) then
+      counts[itemId] = (counts[itemId] or 0) + qty
     end
   end
+end
+
+local function BuildOwnedCountsByCharacterFromBagBrother(wantedSet)
+  local charRoots, _, err = FindBagBrotherCharacters()
+  if not charRoots then
+    return nil, nil, err
+  end
 
   local totals = {}
   local byCharacter = {}
 
   for _, c in ipairs(charRoots) do
     local counts = {}
-    WalkCounts(c.node, counts, {})
+    WalkOwnedCounts(c.node, counts, {}, wantedSet)
     if next(counts) ~= nil then
       byCharacter[c.name or "Unknown"] = counts
       for itemId, qty in pairs(counts) do
@@ -812,6 +987,243 @@ local function BuildOwnedCountsFromBagBrother(wantedSet)
   return totals, err
 end
 
+-- Owned-count index (FrugalScanDB.ownedIndex). A character's BagBrother data only changes
+-- while that character is logged in, so full item counts are cached per realm and
+-- character, each with the index stamp of its last change. The current character is
+-- counted from its own containers (bags on BAG_UPDATE_DELAYED, bank while the bank is
+-- open); other characters are walked from BagBrother once per session, since their data
+-- can have changed while they were played (with or without FrugalForge), and again after
+-- /frugalscan owned rebuild.
+local OWNED_INDEX_VERSION = 1
+local BANK_CONTAINER_ID = BANK_CONTAINER or -1
+local ownedIndexState = { bankOpen = false, bankSeedTried = false, altsChecked = false, bagDbError = nil }
+
+local function GetOwnedIndexRealm()
+  EnsureDb()
+  local index = FrugalScanDB.ownedIndex
+  if type(index) ~= "table" or index.version ~= OWNED_INDEX_VERSION or type(index.realms) ~= "table" then
+    index = { version = OWNED_INDEX_VERSION, stamp = 0, realms = {} }
+    FrugalScanDB.ownedIndex = index
+  end
+  local realmName = GetRealmName()
+  local realm = index.realms[realmName]
+  if type(realm) ~= "table" then
+    realm = {}
+    index.realms[realmName] = realm
+  end
+  return realm, index
+end
+
+local function CountsEqual(a, b)
+  for k, v in pairs(a) do
+    if b[k] ~= v then return false end
+  end
+  for k, v in pairs(b) do
+    if a[k] ~= v then return false end
+  end
+  return true
+end
+
+local function BagContainerIds()
+  local ids = {}
+  for bag = 0, (NUM_BAG_SLOTS or 4) do
+    table.insert(ids, bag)
+  end
+  return ids
+end
+
+local function BankContainerIds()
+  local ids = { BANK_CONTAINER_ID }
+  local first = (NUM_BAG_SLOTS or 4) + 1
+  for bag = first, first + (NUM_BANKBAGSLOTS or 6) - 1 do
+    table.insert(ids, bag)
+  end
+  return ids
+end
+
+local function GetContainerSlotItem(bag, slot)
+  if C_Container and C_Container.GetContainerItemInfo then
+    local info = C_Container.GetContainerItemInfo(bag, slot)
+    if info then return info.itemID, info.stackCount end
+    return nil, nil
+  end
+  local _, count, _, _, _, _, link, _, _, itemId = GetContainerItemInfo(bag, slot)
+  return itemId or ParseItemIdFromLink(link), count
+end
+
+local function CountContainers(bagIds)
+  local getNumSlots = (C_Container and C_Container.GetContainerNumSlots) or GetContainerNumSlots
+  local counts = {}
+  for _, bag in ipairs(bagIds) do
+    for slot = 1, (getNumSlots(bag) or 0) do
+      local itemId, count = GetContainerSlotItem(bag, slot)
+      if itemId and count and count > 0 then
+        counts[itemId] = (counts[itemId] or 0) + count
+      end
+    end
+  end
+  return counts
+end
+
+local function TouchOwnedIndexEntry(index, entry)
+  index.stamp = (index.stamp or 0) + 1
+  entry.stamp = index.stamp
+  entry.updatedAt = time()
+end
+
+-- part is "bags" or "bank"; the entry's counts are their sum.
+local function SetCurrentCharacterCounts(part, counts)
+  local realm, index = GetOwnedIndexRealm()
+  local name = UnitName("player")
+  local entry = realm[name]
+  if type(entry) ~= "table" or entry.source ~= "live" then
+    entry = { source = "live", counts = {} }
+    realm[name] = entry
+  end
+  if type(entry[part]) == "table" and CountsEqual(entry[part], counts) then return end
+  entry[part] = counts
+  local total = {}
+  for _, p in ipairs({ "bags", "bank" }) do
+    for itemId, qty in pairs(entry[p] or {}) do
+      total[itemId] = (total[itemId] or 0) + qty
+    end
+  end
+  entry.counts = total
+  TouchOwnedIndexEntry(index, entry)
+end
+
+local function RefreshOwnedBags()
+  SetCurrentCharacterCounts("bags", CountContainers(BagContainerIds()))
+end
+
+local function RefreshOwnedBank()
+  SetCurrentCharacterCounts("bank", CountContainers(BankContainerIds()))
+end
+
+-- Brings alt entries (and the current character's bank, until it is first opened) up to
+-- date from BagBrother. Other characters' BagBrother data is loaded at login and cannot
+-- change until the next one, so alts are walked on the first sync of a session (or on
+-- rebuild) and entries whose counts changed get a new stamp. The last bag DB error is
+-- kept in ownedIndexState.bagDbError.
+local function SyncOwnedIndex(includeAlts, rebuild)
+  local realm, index = GetOwnedIndexRealm()
+  local player = UnitName("player")
+  local current = realm[player]
+  if type(current) ~= "table" or type(current.bags) ~= "table" then
+    RefreshOwnedBags()
+    current = realm[player]
+  end
+
+  local needsBankSeed = type(current.bank) ~= "table" and not ownedIndexState.bankSeedTried
+  local walkAlts = rebuild or (includeAlts and not ownedIndexState.altsChecked)
+  if not needsBankSeed and not walkAlts then return realm end
+  ownedIndexState.bankSeedTried = true
+
+  local charRoots, _, err = FindBagBrotherCharacters()
+  ownedIndexState.bagDbError = err
+  if not charRoots then return realm end
+
+  local seen = {}
+  for _, c in ipairs(charRoots) do
+    local name = c.name or "Unknown"
+    seen[name] = true
+    if name == player then
+      if needsBankSeed and not ownedIndexState.bankOpen then
+        local counts = {}
+        local visited = {}
+        for _, bag in ipairs(BankContainerIds()) do
+          WalkOwnedCounts(c.node[bag] or c.node[tostring(bag)], counts, visited, nil)
+        end
+        SetCurrentCharacterCounts("bank", counts)
+      end
+    elseif walkAlts then
+      local counts = {}
+      WalkOwnedCounts(c.node, counts, {}, nil)
+      local entry = realm[name]
+      if type(entry) ~= "table" or entry.source ~= "bagbrother" or not CountsEqual(entry.counts or {}, counts) then
+        entry = { source = "bagbrother", counts = counts }
+        realm[name] = entry
+        TouchOwnedIndexEntry(index, entry)
+      end
+    end
+  end
+
+  if walkAlts then
+    ownedIndexState.altsChecked = true
+    for name, entry in pairs(realm) do
+      if name ~= player and not seen[name] and type(entry) == "table" and entry.source == "bagbrother" then
+        realm[name] = nil
+        index.stamp = (index.stamp or 0) + 1
+      end
+    end
+  end
+  return realm
+end
+
+-- Owned counts from the index, limited to wantedSet (nil returns every item). Returns
+-- totals, counts by character name and the index stamp. With currentOnly, only the
+-- current character is counted, and nil is returned until its bank counts are known.
+local function GetOwnedCounts(wantedSet, currentOnly)
+  local realm = SyncOwnedIndex(not currentOnly, false)
+  local index = FrugalScanDB.ownedIndex
+  local player = UnitName("player")
+  if currentOnly and (type(realm[player]) ~= "table" or type(realm[player].bank) ~= "table") then
+    return nil, nil, index.stamp
+  end
+
+  local totals = {}
+  local byCharacter = {}
+  for name, entry in pairs(realm) do
+    if type(entry) == "table" and type(entry.counts) == "table" and (not currentOnly or name == player) then
+      local counts = {}
+      if wantedSet then
+        for itemId in pairs(wantedSet) do
+          local qty = entry.counts[itemId]
+          if qty and qty > 0 then counts[itemId] = qty end
+        end
+      else
+        for itemId, qty in pairs(entry.counts) do
+          if qty > 0 then counts[itemId] = qty end
+        end
+      end
+      if next(counts) ~= nil then
+        byCharacter[name] = counts
+        for itemId, qty in pairs(counts) do
+          totals[itemId] = (totals[itemId] or 0) + qty
+        end
+      end
+    end
+  end
+  return totals, byCharacter, index.stamp
+end
+
+_G.FrugalScan_GetOwnedCounts = GetOwnedCounts
+
+local ownedIndexFrame = CreateFrame("Frame")
+ownedIndexFrame:RegisterEvent("PLAYER_LOGIN")
+ownedIndexFrame:RegisterEvent("BAG_UPDATE_DELAYED")
+ownedIndexFrame:RegisterEvent("BANKFRAME_OPENED")
+ownedIndexFrame:RegisterEvent("BANKFRAME_CLOSED")
+ownedIndexFrame:RegisterEvent("PLAYERBANKSLOTS_CHANGED")
+ownedIndexFrame:SetScript("OnEvent", function(_, event)
+  if event == "BANKFRAME_OPENED" then
+    ownedIndexState.bankOpen = true
+    RefreshOwnedBank()
+    return
+  end
+  if event == "BANKFRAME_CLOSED" then
+    ownedIndexState.bankOpen = false
+    return
+  end
+  if event == "PLAYERBANKSLOTS_CHANGED" then
+    if ownedIndexState.bankOpen then RefreshOwnedBank() end
+    return
+  end
+  -- PLAYER_LOGIN, BAG_UPDATE_DELAYED (also fired for bank bags while the bank is open)
+  RefreshOwnedBags()
+  if ownedIndexState.bankOpen then RefreshOwnedBank() end
+end)
+
 local function OwnedDebug()
   local realmName = GetRealmName()
   Print("Owned debug: realm=\"" .. tostring(realmName) .. "\" slug=\"" .. tostring(NormalizeRealmSlug(realmName)) .. "\"")
@@ -890,7 +1302,7 @@ end
 local exportFrame
 local ShowExportFrame
 
-local function ExportOwned()
+local function ExportOwned(rebuild)
   EnsureDb()
 
   local wantedSet, wantedCount = BuildWantedItemIdSet()
@@ -899,10 +1311,12 @@ local function ExportOwned()
     return
   end
 
-  local counts, byCharacter, err = BuildOwnedCountsByCharacterFromBagBrother(wantedSet)
-  if not counts then
-    Print("Owned export failed: " .. tostring(err))
-    return
+  if rebuild then
+    SyncOwnedIndex(true, true)
+  end
+  local counts, byCharacter = GetOwnedCounts(wantedSet, false)
+  if ownedIndexState.bagDbError then
+    DebugPrint(ownedIndexState.bagDbError .. " Exporting indexed characters only.")
   end
 
   local realmName = GetRealmName()
@@ -1016,8 +1430,58 @@ ShowExportFrame = function(textOverride, titleOverride)
   exportFrame:Show()
 end
 
-local function QueueItems()
+-- FrugalForgeScanHints (FrugalForge_Data_ScanHints.lua, from tools/datapacks/scan_priority.py)
+-- gives reagents a priority and a staleness budget. Items last scanned on this realm within
+-- their budget are skipped (FinishSnapshot carries their last price over); the rest are queued
+-- highest priority first, items without a hint (no price history) ahead of all. Returns the
+-- skipped count.
+local function PrioritizeQueue(scanAll)
+  local hints = type(_G.FrugalForgeScanHints) == "table" and _G.FrugalForgeScanHints.items or nil
+  if type(hints) ~= "table" or next(hints) == nil then return 0 end
+
+  local scannedAt = nil
+  local last = GetLastSnapshot()
+  if not scanAll and IsSameScanRealm(last) and type(last.scannedAt) == "table" then
+    scannedAt = last.scannedAt
+  end
+
+  local now = time()
+  local kept = {}
+  local skipped = 0
+  for _, itemId in ipairs(state.queue) do
+    local hint = hints[itemId]
+    local budget = hint and tonumber(hint.staleHours) or 0
+    local at = scannedAt and tonumber(scannedAt[itemId])
+    if at and budget > 0 and (now - at) < budget * 3600 then
+      skipped = skipped + 1
+      state.skippedItems[itemId] = true
+    else
+      table.insert(kept, itemId)
+    end
+  end
+
+  local function Priority(itemId)
+    local hint = hints[itemId]
+    return (hint and tonumber(hint.priority)) or math.huge
+  end
+  table.sort(kept, function(a, b)
+    local pa, pb = Priority(a), Priority(b)
+    if pa ~= pb then return pa > pb end
+    return a < b
+  end)
+  state.queue = kept
+  return skipped
+end
+
+local function SkippedSuffix(skipped)
+  if not skipped or skipped <= 0 then return "" end
+  return " Skipped " .. tostring(skipped) .. " stable item(s) scanned recently (/frugalscan start full to include them)."
+end
+
+local function QueueItems(scanAll)
   state.queue = {}
+  state.skippedFresh = 0
+  state.skippedItems = {}
   local function FilterQueue()
     if #state.queue == 0 then return end
     local filtered = {}
@@ -1133,7 +1597,8 @@ local function QueueItems()
       table.sort(state.queue, function(a, b) return a < b end)
       FilterQueue()
       if #state.queue > 0 then
-        Print("Queued " .. tostring(#state.queue) .. " items from full target list.")
+        state.skippedFresh = PrioritizeQueue(scanAll)
+        Print("Queued " .. tostring(#state.queue) .. " items from full target list." .. SkippedSuffix(state.skippedFresh))
         state.total = #state.queue
         UpdateStatus()
         return
@@ -1182,7 +1647,8 @@ local function QueueItems()
       table.sort(state.queue, function(a, b) return a < b end)
       FilterQueue()
       if #state.queue > 0 then
-        Print("Queued " .. tostring(#state.queue) .. " items for skill " .. tostring(skillLevel) .. " -> " .. tostring(upper) .. " (target=" .. tostring(targetSkill or "delta " .. tostring(maxSkillDelta)) .. ", cap=" .. tostring(cap) .. ").")
+        state.skippedFresh = PrioritizeQueue(scanAll)
+        Print("Queued " .. tostring(#state.queue) .. " items for skill " .. tostring(skillLevel) .. " -> " .. tostring(upper) .. " (target=" .. tostring(targetSkill or "delta " .. tostring(maxSkillDelta)) .. ", cap=" .. tostring(cap) .. ")." .. SkippedSuffix(state.skippedFresh))
         state.total = #state.queue
         UpdateStatus()
         return
@@ -1200,13 +1666,16 @@ local function QueueItems()
   end
 
   FilterQueue()
+  if #state.queue > 0 then
+    state.skippedFresh = PrioritizeQueue(scanAll)
+  end
   state.total = #state.queue
   UpdateStatus()
 
-  if #state.queue == 0 then
+  if #state.queue == 0 and state.skippedFresh == 0 then
     Print("Queued 0 items. Targets not loaded or empty. Use /frugal to build targets, then scan again.")
   else
-    Print("Queued " .. tostring(#state.queue) .. " items.")
+    Print("Queued " .. tostring(#state.queue) .. " items." .. SkippedSuffix(state.skippedFresh))
   end
 end
 
@@ -1332,6 +1801,14 @@ local function QueryCurrentPage()
   end)
 end
 
+-- Scan time per item for the staleness budgets in FrugalForgeScanHints; items skipped after
+-- query timeouts are not recorded.
+local function MarkCurrentItemScanned()
+  if state.currentItemId and state.scannedAt then
+    state.scannedAt[state.currentItemId] = time()
+  end
+end
+
 local function NextItem()
   if not state.running then return end
 
@@ -1360,7 +1837,7 @@ local function ProcessCurrentPage()
   local idMatches = 0
   local nameMatches = 0
   local buyoutMissing = 0
-  local rank = 3
+  local rank = ScanPriceRank()
 
   for i = 1, shown do
     local auctionName, count, minBid, buyoutPrice, _ = ExtractAuctionRow("list", i)
@@ -1434,6 +1911,7 @@ local function ProcessCurrentPage()
       DebugPrint("UI pagination exhausted without finding itemId=" .. tostring(itemId) .. " (maxPages=" .. tostring(state.maxPages) .. ").")
     end
 
+    MarkCurrentItemScanned()
     state.currentItemId = nil
     C_Timer.After(state.delaySeconds, NextItem)
     return
@@ -1444,6 +1922,7 @@ local function ProcessCurrentPage()
     state.timeoutRetries = 0
     C_Timer.After(state.delaySeconds, QueryCurrentPage)
   else
+    MarkCurrentItemScanned()
     state.currentItemId = nil
     C_Timer.After(state.delaySeconds, NextItem)
   end
@@ -1488,7 +1967,7 @@ frame:SetScript("OnEvent", function(_, event, ...)
   end
 end)
 
-local function StartScan(queueOverride)
+local function StartScan(queueOverride, scanAll)
   if not IsAtAuctionHouse() then
     Print("Open the Auction House first.")
     return
@@ -1497,6 +1976,7 @@ local function StartScan(queueOverride)
   EnsureBrowseTab()
   if type(queueOverride) == "table" then
     state.queue = {}
+    state.skippedItems = {}
     for _, itemId in ipairs(queueOverride) do
       if type(itemId) == "number" and itemId > 0 and IsScanQualityAllowed(itemId) then
         table.insert(state.queue, itemId)
@@ -1512,10 +1992,14 @@ local function StartScan(queueOverride)
 
     Print("Queued " .. tostring(#state.queue) .. " manual item(s).")
   else
-    QueueItems()
+    QueueItems(scanAll)
   end
 
   if #state.queue == 0 then
+    if (state.skippedFresh or 0) > 0 then
+      Print("Nothing to scan: every item was scanned within its staleness budget. Use /frugalscan start full to rescan anyway.")
+      return
+    end
     Print("No targets loaded. Use /frugal to build targets, then scan again.")
     return
   end
@@ -1545,7 +2029,7 @@ SlashCmdList["FRUGALSCAN"] = function(msg)
   rest = Trim(rest or "")
 
   if cmd == "start" then
-    StartScan()
+    StartScan(nil, string.lower(rest) == "full")
     return
   end
 
@@ -1611,6 +2095,18 @@ SlashCmdList["FRUGALSCAN"] = function(msg)
     return
   end
 
+  if cmd == "rank" then
+    local rank = tonumber(rest)
+    if rank and rank >= 1 then
+      FrugalScanDB.settings.priceRank = math.floor(rank)
+    elseif rest ~= "" then
+      Print("Usage: /frugalscan rank <n> (1 = lowest buyout, 3 = third lowest)")
+      return
+    end
+    Print("Price rank = " .. tostring(ScanPriceRank()) .. " (takes effect on the next scan)")
+    return
+  end
+
   if cmd == "verbose" or cmd == "v" then
     FrugalScanDB.settings.verboseDebug = not (FrugalScanDB.settings.verboseDebug == true)
     Print("Verbose debug = " .. tostring(FrugalScanDB.settings.verboseDebug))
@@ -1625,6 +2121,7 @@ SlashCmdList["FRUGALSCAN"] = function(msg)
       ", minQueryIntervalSeconds=" .. tostring(GetSetting("minQueryIntervalSeconds", 3)) ..
       ", queryTimeoutSeconds=" .. tostring(GetSetting("queryTimeoutSeconds", 10)) ..
       ", maxTimeoutRetriesPerPage=" .. tostring(GetSetting("maxTimeoutRetriesPerPage", 3)) ..
+      ", priceRank=" .. tostring(ScanPriceRank()) ..
       ", verboseDebug=" .. tostring(GetSetting("verboseDebug", false)))
     Print("APIs: QueryAuctionItems=" .. tostring(QueryAuctionItems ~= nil) ..
       ", CanSendAuctionQuery=" .. tostring(CanSendAuctionQuery ~= nil) ..
@@ -1671,7 +2168,7 @@ SlashCmdList["FRUGALSCAN"] = function(msg)
   end
 
   if cmd == "owned" then
-    ExportOwned()
+    ExportOwned(string.lower(rest) == "rebuild")
     return
   end
 
@@ -1680,7 +2177,7 @@ SlashCmdList["FRUGALSCAN"] = function(msg)
     return
   end
 
-  Print("Commands: /frugalscan start | item <id|link> | stop | status | export | owned | owneddebug | options | log | clearlog | debug | verbose")
+  Print("Commands: /frugalscan start [full] | item <id|link> | stop | status | export | owned [rebuild] | owneddebug | options | log | clearlog | debug | verbose | rank [n]")
 end
 
 TryRegisterOptions = function() end
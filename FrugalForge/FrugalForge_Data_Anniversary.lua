@@ -3465,6 +3465,271 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [118] = 21,
+        [858] = 28,
+        [929] = 37,
+        [1710] = 49,
+        [2454] = 19,
+        [2455] = 23,
+        [2456] = 24,
+        [2457] = 26,
+        [2458] = 27,
+        [2459] = 30,
+        [3382] = 22,
+        [3383] = 34,
+        [3384] = 38,
+        [3385] = 39,
+        [3386] = 40,
+        [3387] = 91,
+        [3388] = 41,
+        [3389] = 42,
+        [3390] = 46,
+        [3391] = 47,
+        [3577] = 74,
+        [3823] = 52,
+        [3824] = 53,
+        [3825] = 54,
+        [3826] = 56,
+        [3827] = 50,
+        [3828] = 61,
+        [3829] = 64,
+        [3928] = 72,
+        [4596] = 25,
+        [4623] = 70,
+        [5631] = 29,
+        [5633] = 55,
+        [5634] = 48,
+        [5996] = 33,
+        [5997] = 20,
+        [6037] = 75,
+        [6048] = 44,
+        [6049] = 51,
+        [6050] = 59,
+        [6051] = 35,
+        [6052] = 60,
+        [6149] = 65,
+        [6370] = 31,
+        [6371] = 43,
+        [6372] = 36,
+        [6373] = 45,
+        [6662] = 32,
+        [7068] = 131,
+        [7076] = 105,
+        [7078] = 101,
+        [7080] = 104,
+        [7082] = 108,
+        [8949] = 57,
+        [8951] = 62,
+        [8956] = 66,
+        [9030] = 71,
+        [9036] = 68,
+        [9061] = 67,
+        [9088] = 84,
+        [9144] = 76,
+        [9149] = 73,
+        [9154] = 78,
+        [9155] = 79,
+        [9172] = 81,
+        [9179] = 80,
+        [9187] = 83,
+        [9197] = 82,
+        [9206] = 85,
+        [9210] = 86,
+        [9224] = 87,
+        [9233] = 88,
+        [9264] = 90,
+        [10592] = 63,
+        [12190] = 77,
+        [12360] = 102,
+        [12803] = 103,
+        [12808] = 109,
+        [13423] = 92,
+        [13442] = 93,
+        [13443] = 94,
+        [13444] = 121,
+        [13445] = 95,
+        [13446] = 100,
+        [13447] = 96,
+        [13452] = 110,
+        [13453] = 97,
+        [13454] = 112,
+        [13455] = 111,
+        [13456] = 117,
+        [13457] = 116,
+        [13458] = 118,
+        [13459] = 119,
+        [13461] = 115,
+        [13462] = 114,
+        [13503] = 123,
+        [13506] = 126,
+        [13510] = 128,
+        [13511] = 125,
+        [13512] = 127,
+        [13513] = 124,
+        [17708] = 58,
+        [18253] = 129,
+        [18294] = 69,
+        [19931] = 11,
+        [20002] = 98,
+        [20004] = 120,
+        [20007] = 99,
+        [20008] = 113,
+        [21546] = 89,
+        [21884] = 162,
+        [21885] = 163,
+        [21886] = 13,
+        [22451] = 166,
+        [22452] = 164,
+        [22456] = 18,
+        [22457] = 14,
+        [22823] = 133,
+        [22824] = 134,
+        [22825] = 135,
+        [22826] = 139,
+        [22827] = 142,
+        [22828] = 143,
+        [22829] = 147,
+        [22830] = 144,
+        [22831] = 149,
+        [22832] = 152,
+        [22833] = 154,
+        [22834] = 153,
+        [22835] = 157,
+        [22836] = 160,
+        [22837] = 159,
+        [22838] = 158,
+        [22839] = 156,
+        [22840] = 168,
+        [22841] = 171,
+        [22842] = 172,
+        [22844] = 174,
+        [22845] = 170,
+        [22846] = 175,
+        [22847] = 173,
+        [22848] = 176,
+        [22849] = 177,
+        [22850] = 12,
+        [22851] = 7,
+        [22853] = 8,
+        [22854] = 10,
+        [22861] = 6,
+        [22866] = 9,
+        [22871] = 151,
+        [23571] = 165,
+        [25867] = 161,
+        [25868] = 167,
+        [28100] = 132,
+        [28101] = 137,
+        [28102] = 130,
+        [28103] = 122,
+        [28104] = 138,
+        [31080] = 146,
+        [31676] = 155,
+        [31677] = 169,
+        [31679] = 150,
+        [32062] = 136,
+        [32063] = 140,
+        [32067] = 141,
+        [32068] = 148,
+        [32839] = 1,
+        [32849] = 2,
+        [32850] = 3,
+        [32851] = 4,
+        [32852] = 5,
+        [33208] = 179,
+        [34440] = 145,
+        [35748] = 180,
+        [35749] = 182,
+        [35750] = 181,
+        [35751] = 178,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 19, 20, 21 },
+          [1] = { 19, 20, 21 },
+          [2] = { 19, 20, 21 },
+          [3] = { 19, 20, 21, 22 },
+          [4] = { 19, 20, 21, 22 },
+          [5] = { 19, 20, 21, 22, 23 },
+          [6] = { 19, 20, 21, 22, 23 },
+          [7] = { 19, 20, 21, 22, 23 },
+          [8] = { 19, 20, 21, 22, 23, 24 },
+          [9] = { 19, 20, 21, 22, 23, 24 },
+          [10] = { 19, 20, 21, 22, 23, 24, 25, 26, 27 },
+          [11] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28 },
+          [12] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [13] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [14] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [15] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [16] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31 },
+          [17] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31 },
+          [18] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34 },
+          [19] = { 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34 },
+          [20] = { 23, 24, 25, 26, 27, 28, 29, 30, 32, 33, 34, 35, 36 },
+          [21] = { 24, 25, 26, 27, 28, 29, 30, 32, 33, 34, 35, 36 },
+          [22] = { 25, 26, 27, 28, 29, 30, 32, 33, 34, 35, 36, 37, 38 },
+          [23] = { 25, 26, 27, 28, 29, 30, 32, 33, 34, 35, 36, 37, 38 },
+          [24] = { 28, 29, 30, 32, 33, 34, 35, 36, 37, 38, 39, 40 },
+          [25] = { 29, 30, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41 },
+          [26] = { 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43 },
+          [27] = { 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44 },
+          [28] = { 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46 },
+          [29] = { 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46 },
+          [30] = { 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48 },
+          [31] = { 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49 },
+          [32] = { 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50 },
+          [33] = { 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53 },
+          [34] = { 37, 38, 39, 40, 41, 42, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53 },
+          [35] = { 39, 40, 41, 42, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55 },
+          [36] = { 39, 40, 41, 42, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56 },
+          [37] = { 41, 42, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [38] = { 42, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60 },
+          [39] = { 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62 },
+          [40] = { 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64 },
+          [41] = { 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66 },
+          [42] = { 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68 },
+          [43] = { 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72 },
+          [44] = { 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72 },
+          [45] = { 51, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76 },
+          [46] = { 51, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78 },
+          [47] = { 51, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81 },
+          [48] = { 51, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84 },
+          [49] = { 51, 58, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86 },
+          [50] = { 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92 },
+          [51] = { 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93 },
+          [52] = { 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 93, 94 },
+          [53] = { 69, 70, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 93, 94, 95 },
+          [54] = { 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 93, 94, 95, 96 },
+          [55] = { 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109 },
+          [56] = { 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111 },
+          [57] = { 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114 },
+          [58] = { 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 93, 94, 95, 96, 97, 98, 99, 100, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120 },
+          [59] = { 85, 86, 87, 88, 89, 90, 91, 93, 94, 95, 96, 97, 98, 99, 100, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121 },
+          [60] = { 87, 88, 89, 90, 91, 93, 94, 95, 96, 97, 98, 99, 100, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132 },
+          [61] = { 91, 93, 94, 95, 96, 97, 98, 99, 100, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134 },
+          [62] = { 91, 94, 95, 96, 97, 98, 99, 100, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 132, 133, 134, 135, 136, 137 },
+          [63] = { 11, 95, 96, 97, 98, 99, 100, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 132, 133, 134, 135, 136, 137, 138, 139 },
+          [64] = { 11, 96, 97, 98, 99, 100, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143 },
+          [65] = { 11, 97, 98, 99, 100, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147 },
+          [66] = { 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 123, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149 },
+          [67] = { 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 123, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151 },
+          [68] = { 115, 116, 117, 118, 119, 120, 121, 123, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152 },
+          [69] = { 121, 123, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155 },
+          [70] = { 4, 5, 123, 144, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167 },
+          [71] = { 4, 5, 123, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168 },
+          [72] = { 1, 2, 3, 4, 5, 123, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175 },
+          [73] = { 1, 2, 3, 4, 5, 123, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177 },
+          [74] = { 1, 2, 3, 4, 5, 123, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177 },
+          [75] = { 1, 2, 3, 4, 5, 123, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182 },
+          [76] = { 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182 },
+          [77] = { 13, 14, 15, 16, 17, 18, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182 },
+          [78] = { 6, 7, 8, 9, 10, 12, 13, 14, 15, 16, 17, 18, 176, 177, 178, 179, 180, 181, 182 },
+          [79] = { 6, 7, 8, 9, 10, 12, 13, 14, 15, 16, 17, 18, 178, 179, 180, 181, 182 },
+          [80] = { 6, 7, 8, 9, 10, 12, 178, 179, 180, 181, 182 },
+        },
+      },
     },
     {
       professionId = 164,
@@ -10750,6 +11015,470 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [2844] = 6,
+        [2845] = 7,
+        [2847] = 9,
+        [2848] = 37,
+        [2849] = 40,
+        [2850] = 41,
+        [2851] = 14,
+        [2852] = 2,
+        [2853] = 1,
+        [2854] = 27,
+        [2857] = 23,
+        [2862] = 4,
+        [2863] = 20,
+        [2864] = 26,
+        [2865] = 36,
+        [2866] = 35,
+        [2868] = 42,
+        [2869] = 52,
+        [2870] = 58,
+        [2871] = 46,
+        [3239] = 5,
+        [3240] = 21,
+        [3241] = 47,
+        [3469] = 8,
+        [3470] = 10,
+        [3471] = 15,
+        [3472] = 17,
+        [3473] = 18,
+        [3474] = 19,
+        [3478] = 25,
+        [3480] = 39,
+        [3481] = 48,
+        [3482] = 51,
+        [3483] = 54,
+        [3484] = 56,
+        [3485] = 61,
+        [3486] = 45,
+        [3487] = 28,
+        [3488] = 13,
+        [3489] = 24,
+        [3490] = 44,
+        [3491] = 50,
+        [3492] = 57,
+        [3835] = 71,
+        [3836] = 75,
+        [3837] = 88,
+        [3840] = 69,
+        [3841] = 77,
+        [3842] = 64,
+        [3843] = 74,
+        [3844] = 81,
+        [3845] = 91,
+        [3846] = 86,
+        [3847] = 93,
+        [3848] = 34,
+        [3849] = 70,
+        [3850] = 78,
+        [3851] = 66,
+        [3852] = 73,
+        [3853] = 82,
+        [3854] = 92,
+        [3855] = 85,
+        [3856] = 95,
+        [5540] = 38,
+        [5541] = 55,
+        [6040] = 84,
+        [6041] = 90,
+        [6042] = 63,
+        [6043] = 72,
+        [6214] = 22,
+        [6338] = 31,
+        [6350] = 29,
+        [6731] = 30,
+        [7071] = 62,
+        [7166] = 12,
+        [7913] = 68,
+        [7914] = 67,
+        [7915] = 76,
+        [7916] = 79,
+        [7917] = 83,
+        [7918] = 105,
+        [7919] = 104,
+        [7920] = 108,
+        [7921] = 107,
+        [7922] = 111,
+        [7924] = 109,
+        [7926] = 114,
+        [7927] = 113,
+        [7928] = 115,
+        [7929] = 121,
+        [7930] = 119,
+        [7931] = 120,
+        [7932] = 123,
+        [7933] = 122,
+        [7934] = 128,
+        [7935] = 127,
+        [7936] = 129,
+        [7937] = 130,
+        [7938] = 116,
+        [7939] = 133,
+        [7941] = 106,
+        [7942] = 112,
+        [7943] = 117,
+        [7944] = 126,
+        [7945] = 118,
+        [7946] = 132,
+        [7947] = 140,
+        [7954] = 125,
+        [7955] = 11,
+        [7956] = 43,
+        [7957] = 49,
+        [7958] = 53,
+        [7959] = 134,
+        [7960] = 147,
+        [7961] = 131,
+        [7963] = 99,
+        [7964] = 97,
+        [7965] = 98,
+        [7966] = 96,
+        [7967] = 110,
+        [7969] = 124,
+        [9060] = 94,
+        [9366] = 103,
+        [10421] = 3,
+        [10423] = 65,
+        [11128] = 59,
+        [11144] = 100,
+        [11604] = 168,
+        [11605] = 163,
+        [11606] = 152,
+        [11607] = 158,
+        [11608] = 149,
+        [12259] = 80,
+        [12260] = 89,
+        [12404] = 136,
+        [12405] = 138,
+        [12406] = 139,
+        [12408] = 141,
+        [12409] = 166,
+        [12410] = 167,
+        [12414] = 252,
+        [12415] = 154,
+        [12416] = 146,
+        [12417] = 183,
+        [12418] = 170,
+        [12419] = 177,
+        [12420] = 242,
+        [12422] = 229,
+        [12424] = 150,
+        [12425] = 153,
+        [12426] = 181,
+        [12427] = 182,
+        [12428] = 151,
+        [12429] = 230,
+        [12610] = 247,
+        [12611] = 244,
+        [12612] = 245,
+        [12613] = 243,
+        [12614] = 246,
+        [12618] = 210,
+        [12619] = 212,
+        [12620] = 211,
+        [12624] = 155,
+        [12625] = 173,
+        [12628] = 169,
+        [12631] = 174,
+        [12632] = 184,
+        [12633] = 254,
+        [12636] = 225,
+        [12639] = 249,
+        [12640] = 237,
+        [12641] = 231,
+        [12643] = 137,
+        [12644] = 135,
+        [12645] = 161,
+        [12773] = 160,
+        [12774] = 159,
+        [12775] = 165,
+        [12776] = 164,
+        [12777] = 162,
+        [12781] = 171,
+        [12782] = 172,
+        [12783] = 222,
+        [12784] = 187,
+        [12790] = 186,
+        [12792] = 178,
+        [12794] = 238,
+        [12796] = 221,
+        [12797] = 219,
+        [12798] = 185,
+        [15869] = 32,
+        [15870] = 60,
+        [15871] = 101,
+        [15872] = 157,
+        [16206] = 156,
+        [16988] = 218,
+        [16989] = 180,
+        [17013] = 199,
+        [17014] = 179,
+        [17015] = 200,
+        [17016] = 196,
+        [17193] = 250,
+        [17704] = 87,
+        [18262] = 208,
+        [19043] = 176,
+        [19048] = 224,
+        [19051] = 175,
+        [19057] = 220,
+        [19148] = 198,
+        [19164] = 197,
+        [19166] = 188,
+        [19167] = 190,
+        [19168] = 191,
+        [19169] = 239,
+        [19170] = 207,
+        [19690] = 192,
+        [19691] = 194,
+        [19692] = 193,
+        [19693] = 204,
+        [19694] = 205,
+        [19695] = 206,
+        [20039] = 195,
+        [20549] = 202,
+        [20550] = 201,
+        [20551] = 203,
+        [22191] = 240,
+        [22194] = 189,
+        [22195] = 236,
+        [22196] = 251,
+        [22197] = 223,
+        [22198] = 235,
+        [22383] = 248,
+        [22384] = 241,
+        [22385] = 253,
+        [22669] = 227,
+        [22670] = 228,
+        [22671] = 226,
+        [22762] = 233,
+        [22763] = 234,
+        [22764] = 232,
+        [23482] = 214,
+        [23484] = 255,
+        [23487] = 260,
+        [23488] = 261,
+        [23489] = 265,
+        [23490] = 262,
+        [23491] = 256,
+        [23493] = 213,
+        [23494] = 258,
+        [23497] = 257,
+        [23498] = 259,
+        [23499] = 263,
+        [23502] = 264,
+        [23503] = 267,
+        [23504] = 268,
+        [23505] = 279,
+        [23506] = 277,
+        [23507] = 281,
+        [23508] = 278,
+        [23509] = 300,
+        [23510] = 297,
+        [23511] = 298,
+        [23512] = 311,
+        [23513] = 319,
+        [23514] = 304,
+        [23515] = 290,
+        [23516] = 299,
+        [23517] = 301,
+        [23518] = 302,
+        [23519] = 316,
+        [23520] = 329,
+        [23521] = 330,
+        [23522] = 338,
+        [23523] = 306,
+        [23524] = 305,
+        [23525] = 326,
+        [23526] = 339,
+        [23527] = 337,
+        [23528] = 216,
+        [23529] = 284,
+        [23530] = 303,
+        [23531] = 315,
+        [23532] = 320,
+        [23533] = 333,
+        [23534] = 334,
+        [23535] = 325,
+        [23536] = 328,
+        [23537] = 307,
+        [23538] = 309,
+        [23539] = 308,
+        [23540] = 317,
+        [23541] = 327,
+        [23542] = 313,
+        [23543] = 318,
+        [23544] = 332,
+        [23546] = 314,
+        [23554] = 312,
+        [23555] = 310,
+        [23556] = 322,
+        [23559] = 266,
+        [23563] = 294,
+        [23564] = 371,
+        [23565] = 353,
+        [23575] = 282,
+        [23576] = 355,
+        [25521] = 291,
+        [25843] = 215,
+        [25844] = 283,
+        [25845] = 354,
+        [28420] = 217,
+        [28421] = 285,
+        [28425] = 289,
+        [28426] = 343,
+        [28427] = 342,
+        [28428] = 292,
+        [28429] = 359,
+        [28430] = 360,
+        [28431] = 295,
+        [28432] = 341,
+        [28433] = 372,
+        [28434] = 293,
+        [28435] = 361,
+        [28436] = 344,
+        [28437] = 287,
+        [28438] = 351,
+        [28439] = 352,
+        [28440] = 296,
+        [28441] = 350,
+        [28442] = 368,
+        [28483] = 286,
+        [28484] = 346,
+        [28485] = 347,
+        [29201] = 33,
+        [29202] = 102,
+        [29203] = 209,
+        [29204] = 288,
+        [30031] = 363,
+        [30032] = 362,
+        [30033] = 345,
+        [30034] = 340,
+        [30069] = 142,
+        [30070] = 148,
+        [30071] = 143,
+        [30072] = 145,
+        [30073] = 144,
+        [30074] = 270,
+        [30076] = 275,
+        [30077] = 276,
+        [30086] = 273,
+        [30087] = 274,
+        [30088] = 272,
+        [30089] = 271,
+        [30093] = 269,
+        [31364] = 373,
+        [31367] = 375,
+        [31368] = 374,
+        [31369] = 356,
+        [31370] = 358,
+        [31371] = 357,
+        [32401] = 365,
+        [32402] = 367,
+        [32403] = 364,
+        [32404] = 366,
+        [32568] = 369,
+        [32570] = 370,
+        [32571] = 348,
+        [32573] = 349,
+        [32854] = 321,
+        [33173] = 331,
+        [33185] = 280,
+        [33791] = 16,
+        [34377] = 324,
+        [34378] = 323,
+        [34379] = 335,
+        [34380] = 336,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 1, 2, 3, 4, 5 },
+          [1] = { 1, 2, 3, 4, 5 },
+          [2] = { 1, 2, 3, 4, 5 },
+          [3] = { 1, 2, 3, 4, 5, 6 },
+          [4] = { 1, 2, 3, 4, 5, 6, 7, 8 },
+          [5] = { 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 },
+          [6] = { 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12 },
+          [7] = { 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16 },
+          [8] = { 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17 },
+          [9] = { 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 },
+          [10] = { 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 },
+          [11] = { 1, 2, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 },
+          [12] = { 2, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19 },
+          [13] = { 2, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22 },
+          [14] = { 2, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24 },
+          [15] = { 2, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25 },
+          [16] = { 2, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 22, 23, 24, 25, 26 },
+          [17] = { 2, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 22, 23, 24, 25, 26 },
+          [18] = { 6, 7, 8, 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 22, 23, 24, 25, 26, 27 },
+          [19] = { 7, 8, 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 22, 23, 24, 25, 26, 27, 28, 29 },
+          [20] = { 9, 11, 12, 13, 14, 15, 16, 17, 18, 19, 22, 23, 24, 26, 27, 28, 29, 30, 31, 32, 33 },
+          [21] = { 11, 12, 13, 14, 15, 16, 17, 18, 19, 22, 23, 24, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36 },
+          [22] = { 13, 14, 15, 16, 17, 18, 19, 22, 23, 24, 26, 27, 28, 29, 30, 32, 33, 34, 35, 36, 37, 38, 39 },
+          [23] = { 17, 18, 19, 22, 23, 24, 26, 27, 28, 29, 30, 32, 33, 34, 35, 36, 37, 38, 39, 40 },
+          [24] = { 18, 19, 22, 23, 24, 26, 27, 28, 29, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42 },
+          [25] = { 19, 22, 23, 24, 26, 27, 28, 29, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48 },
+          [26] = { 19, 22, 23, 24, 26, 27, 28, 29, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52 },
+          [27] = { 19, 22, 23, 24, 26, 27, 28, 29, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54 },
+          [28] = { 22, 23, 24, 26, 28, 29, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 48, 49, 50, 51, 52, 53, 54, 55 },
+          [29] = { 23, 24, 26, 28, 29, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58 },
+          [30] = { 26, 28, 29, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63 },
+          [31] = { 26, 28, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 63, 64, 65, 66 },
+          [32] = { 28, 30, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 60, 61, 63, 64, 65, 66, 67, 68, 69, 70 },
+          [33] = { 28, 30, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 60, 61, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72 },
+          [34] = { 28, 30, 35, 36, 40, 41, 42, 43, 44, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 61, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75 },
+          [35] = { 30, 41, 42, 43, 44, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 61, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78 },
+          [36] = { 43, 44, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 61, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82 },
+          [37] = { 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 61, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86 },
+          [38] = { 53, 54, 55, 56, 57, 58, 61, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90 },
+          [39] = { 55, 56, 57, 58, 61, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91 },
+          [40] = { 56, 57, 58, 61, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102 },
+          [41] = { 61, 63, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105 },
+          [42] = { 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 99, 101, 102, 103, 104, 105, 106, 107, 108 },
+          [43] = { 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 99, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111 },
+          [44] = { 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 99, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114 },
+          [45] = { 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 99, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117 },
+          [46] = { 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 99, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121 },
+          [47] = { 87, 88, 89, 90, 91, 92, 93, 94, 95, 99, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125 },
+          [48] = { 91, 92, 93, 94, 95, 99, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127 },
+          [49] = { 92, 93, 94, 95, 99, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133 },
+          [50] = { 106, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139 },
+          [51] = { 106, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141 },
+          [52] = { 112, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148 },
+          [53] = { 112, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151 },
+          [54] = { 117, 118, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155 },
+          [55] = { 118, 125, 126, 127, 129, 130, 131, 132, 133, 134, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161 },
+          [56] = { 125, 126, 129, 130, 131, 132, 133, 134, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167 },
+          [57] = { 126, 131, 132, 134, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171 },
+          [58] = { 131, 132, 134, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178 },
+          [59] = { 134, 140, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184 },
+          [60] = { 140, 147, 149, 150, 151, 152, 153, 154, 155, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254 },
+          [61] = { 147, 152, 153, 154, 155, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255 },
+          [62] = { 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257 },
+          [63] = { 159, 160, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261 },
+          [64] = { 159, 160, 162, 164, 165, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 209, 210, 211, 212, 213, 214, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263 },
+          [65] = { 162, 164, 165, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 209, 210, 211, 212, 213, 214, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 266 },
+          [66] = { 171, 172, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 209, 210, 211, 212, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276 },
+          [67] = { 172, 178, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 209, 210, 211, 212, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280 },
+          [68] = { 250, 258, 259, 260, 261, 262, 263, 264, 265, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282 },
+          [69] = { 250, 262, 263, 264, 265, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282 },
+          [70] = { 264, 265, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296 },
+          [71] = { 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 281, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299 },
+          [72] = { 277, 278, 279, 281, 286, 287, 288, 289, 290, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306 },
+          [73] = { 281, 286, 287, 288, 289, 290, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336 },
+          [74] = { 286, 287, 288, 289, 290, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339 },
+          [75] = { 286, 287, 288, 289, 290, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375 },
+          [76] = { 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375 },
+          [77] = { 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375 },
+          [78] = { 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375 },
+          [79] = { 323, 324, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375 },
+          [80] = { 323, 324, 335, 336, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375 },
+          [81] = { 323, 324, 335, 336 },
+        },
+      },
     },
     {
       professionId = 185,
@@ -12900,6 +13629,207 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [724] = 26,
+        [733] = 35,
+        [787] = 13,
+        [1017] = 48,
+        [1082] = 47,
+        [2679] = 1,
+        [2680] = 16,
+        [2681] = 4,
+        [2682] = 39,
+        [2683] = 34,
+        [2684] = 24,
+        [2685] = 52,
+        [2687] = 37,
+        [2888] = 18,
+        [3220] = 31,
+        [3662] = 36,
+        [3663] = 43,
+        [3664] = 53,
+        [3665] = 57,
+        [3666] = 50,
+        [3726] = 49,
+        [3727] = 55,
+        [3728] = 59,
+        [3729] = 71,
+        [4457] = 60,
+        [4592] = 28,
+        [4593] = 44,
+        [4594] = 69,
+        [5095] = 29,
+        [5472] = 15,
+        [5473] = 17,
+        [5474] = 20,
+        [5476] = 25,
+        [5477] = 30,
+        [5478] = 42,
+        [5479] = 46,
+        [5480] = 51,
+        [5525] = 23,
+        [5526] = 41,
+        [5527] = 54,
+        [6038] = 62,
+        [6290] = 6,
+        [6316] = 27,
+        [6657] = 40,
+        [6887] = 79,
+        [6888] = 10,
+        [6890] = 21,
+        [7676] = 33,
+        [8364] = 66,
+        [10841] = 63,
+        [12209] = 56,
+        [12210] = 68,
+        [12212] = 65,
+        [12213] = 61,
+        [12214] = 67,
+        [12215] = 73,
+        [12216] = 78,
+        [12217] = 72,
+        [12218] = 77,
+        [12224] = 7,
+        [13851] = 64,
+        [13927] = 75,
+        [13928] = 82,
+        [13929] = 83,
+        [13930] = 76,
+        [13931] = 86,
+        [13932] = 87,
+        [13933] = 89,
+        [13934] = 90,
+        [13935] = 88,
+        [16766] = 81,
+        [17197] = 9,
+        [17198] = 19,
+        [17222] = 74,
+        [18045] = 80,
+        [18254] = 91,
+        [20074] = 58,
+        [20452] = 92,
+        [21023] = 97,
+        [21072] = 38,
+        [21217] = 70,
+        [22645] = 32,
+        [24105] = 12,
+        [27635] = 11,
+        [27636] = 22,
+        [27651] = 95,
+        [27655] = 100,
+        [27656] = 103,
+        [27657] = 104,
+        [27658] = 109,
+        [27659] = 113,
+        [27660] = 112,
+        [27661] = 93,
+        [27662] = 98,
+        [27663] = 102,
+        [27664] = 105,
+        [27665] = 106,
+        [27666] = 107,
+        [27667] = 116,
+        [30155] = 96,
+        [30816] = 14,
+        [31672] = 115,
+        [31673] = 114,
+        [33048] = 5,
+        [33052] = 2,
+        [33053] = 3,
+        [33825] = 110,
+        [33866] = 101,
+        [33867] = 94,
+        [33872] = 111,
+        [33874] = 99,
+        [33924] = 8,
+        [34411] = 108,
+        [34832] = 45,
+        [35563] = 84,
+        [35565] = 85,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14 },
+          [1] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14 },
+          [2] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16 },
+          [3] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16 },
+          [4] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17 },
+          [5] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 },
+          [6] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 },
+          [7] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20 },
+          [8] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21 },
+          [9] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21 },
+          [10] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [11] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [12] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33 },
+          [13] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33 },
+          [14] = { 1, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33 },
+          [15] = { 1, 4, 6, 7, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35 },
+          [16] = { 1, 4, 6, 7, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38 },
+          [17] = { 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40 },
+          [18] = { 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43 },
+          [19] = { 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43 },
+          [20] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48 },
+          [21] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48 },
+          [22] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52 },
+          [23] = { 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52 },
+          [24] = { 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53 },
+          [25] = { 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56 },
+          [26] = { 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [27] = { 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [28] = { 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [29] = { 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [30] = { 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59 },
+          [31] = { 36, 37, 38, 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59 },
+          [32] = { 39, 40, 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59 },
+          [33] = { 41, 42, 43, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59 },
+          [34] = { 44, 46, 47, 48, 49, 50, 51, 53, 54, 55, 56, 57, 58, 59 },
+          [35] = { 44, 46, 48, 49, 50, 51, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71 },
+          [36] = { 49, 50, 51, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71 },
+          [37] = { 49, 50, 51, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71 },
+          [38] = { 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71 },
+          [39] = { 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71 },
+          [40] = { 54, 55, 56, 57, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74 },
+          [41] = { 55, 57, 59, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74 },
+          [42] = { 55, 59, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74 },
+          [43] = { 59, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74 },
+          [44] = { 59, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74 },
+          [45] = { 59, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81 },
+          [46] = { 60, 61, 62, 64, 65, 66, 67, 68, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81 },
+          [47] = { 60, 61, 62, 64, 65, 66, 67, 68, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81 },
+          [48] = { 60, 61, 62, 64, 65, 66, 67, 68, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83 },
+          [49] = { 60, 61, 62, 64, 65, 66, 67, 68, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83 },
+          [50] = { 60, 61, 62, 64, 65, 66, 67, 68, 70, 71, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87 },
+          [51] = { 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87 },
+          [52] = { 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87 },
+          [53] = { 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87 },
+          [54] = { 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87 },
+          [55] = { 82, 83, 84, 85, 86, 87, 88, 89, 90, 91 },
+          [56] = { 82, 83, 84, 85, 86, 87, 88, 89, 90, 91 },
+          [57] = { 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92 },
+          [58] = { 84, 85, 86, 87, 88, 89, 90, 91, 92 },
+          [59] = { 88, 89, 90, 91, 92 },
+          [60] = { 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101 },
+          [61] = { 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101 },
+          [62] = { 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103 },
+          [63] = { 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104 },
+          [64] = { 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106 },
+          [65] = { 5, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113 },
+          [66] = { 5, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 109, 110, 111, 112, 113 },
+          [67] = { 5, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 109, 110, 111, 112, 113, 114, 115 },
+          [68] = { 5, 97, 99, 102, 103, 104, 105, 106, 107, 109, 110, 111, 112, 113, 114, 115 },
+          [69] = { 5, 97, 99, 102, 103, 104, 105, 106, 107, 109, 110, 111, 112, 113, 114, 115 },
+          [70] = { 2, 3, 5, 99, 104, 105, 106, 107, 109, 110, 111, 112, 113, 114, 115, 116 },
+          [71] = { 2, 3, 99, 105, 106, 107, 109, 112, 113, 114, 115, 116 },
+          [72] = { 2, 3, 99, 107, 109, 112, 113, 114, 115, 116 },
+          [73] = { 2, 3, 114, 115, 116 },
+          [74] = { 2, 3, 114, 115, 116 },
+          [75] = { 2, 3, 116 },
+          [76] = { 2, 3, 116 },
+          [77] = { 116 },
+        },
+      },
     },
     {
       professionId = 333,
@@ -17029,6 +17959,124 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [6218] = 8,
+        [6339] = 27,
+        [11130] = 52,
+        [11145] = 77,
+        [11287] = 9,
+        [11288] = 19,
+        [11289] = 55,
+        [11290] = 65,
+        [11811] = 112,
+        [12655] = 105,
+        [12810] = 104,
+        [16207] = 126,
+        [20744] = 14,
+        [20745] = 51,
+        [20746] = 76,
+        [20747] = 106,
+        [20748] = 132,
+        [20749] = 133,
+        [20750] = 117,
+        [22448] = 4,
+        [22449] = 3,
+        [22459] = 202,
+        [22460] = 179,
+        [22461] = 159,
+        [22462] = 201,
+        [22463] = 5,
+        [22521] = 168,
+        [22522] = 188,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 1, 2, 8 },
+          [1] = { 1, 2, 8 },
+          [2] = { 1, 2, 9 },
+          [3] = { 1, 2, 9, 10 },
+          [4] = { 1, 2, 9, 10, 11 },
+          [5] = { 1, 2, 9, 10, 11 },
+          [6] = { 1, 2, 9, 10, 11 },
+          [7] = { 1, 2, 9, 10, 11 },
+          [8] = { 1, 2, 9, 10, 11, 12 },
+          [9] = { 1, 2, 9, 10, 11, 12, 13, 14 },
+          [10] = { 1, 2, 9, 10, 11, 12, 13, 14, 15 },
+          [11] = { 1, 2, 9, 10, 11, 12, 13, 14, 15 },
+          [12] = { 1, 2, 9, 10, 11, 12, 13, 14, 15, 16, 17 },
+          [13] = { 1, 2, 9, 10, 11, 12, 13, 14, 15, 16, 17 },
+          [14] = { 1, 2, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19 },
+          [15] = { 1, 2, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19 },
+          [16] = { 1, 2, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22 },
+          [17] = { 1, 2, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22 },
+          [18] = { 1, 2, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24 },
+          [19] = { 1, 2, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24 },
+          [20] = { 1, 2, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27 },
+          [21] = { 1, 2, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28 },
+          [22] = { 1, 9, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [23] = { 1, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32 },
+          [24] = { 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34 },
+          [25] = { 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37 },
+          [26] = { 13, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39 },
+          [27] = { 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40 },
+          [28] = { 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43 },
+          [29] = { 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48 },
+          [30] = { 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52 },
+          [31] = { 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55 },
+          [32] = { 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [33] = { 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58 },
+          [34] = { 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61 },
+          [35] = { 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65 },
+          [36] = { 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67 },
+          [37] = { 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68 },
+          [38] = { 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70 },
+          [39] = { 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72 },
+          [40] = { 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77 },
+          [41] = { 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79 },
+          [42] = { 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82 },
+          [43] = { 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84 },
+          [44] = { 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86 },
+          [45] = { 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90 },
+          [46] = { 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93 },
+          [47] = { 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96 },
+          [48] = { 68, 69, 70, 71, 72, 73, 74, 75, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98 },
+          [49] = { 69, 70, 71, 72, 73, 74, 75, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101 },
+          [50] = { 71, 72, 73, 74, 75, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106 },
+          [51] = { 73, 74, 75, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107 },
+          [52] = { 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 106, 107, 108 },
+          [53] = { 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 106, 107, 108, 109, 110, 111, 112 },
+          [54] = { 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 106, 107, 108, 109, 110, 111, 112, 113, 114 },
+          [55] = { 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117 },
+          [56] = { 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118 },
+          [57] = { 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120 },
+          [58] = { 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126 },
+          [59] = { 97, 98, 99, 100, 101, 102, 103, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131 },
+          [60] = { 99, 100, 101, 102, 103, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159 },
+          [61] = { 102, 103, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163 },
+          [62] = { 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168 },
+          [63] = { 108, 109, 110, 111, 112, 113, 114, 115, 116, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170 },
+          [64] = { 109, 110, 111, 112, 113, 114, 115, 116, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173 },
+          [65] = { 113, 114, 115, 116, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179 },
+          [66] = { 115, 116, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181 },
+          [67] = { 118, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 180, 181, 182 },
+          [68] = { 160, 161, 162, 163, 164, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 180, 181, 182, 183, 184, 185, 186, 187, 188 },
+          [69] = { 164, 165, 166, 167, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190 },
+          [70] = { 5, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202 },
+          [71] = { 5, 171, 172, 173, 174, 175, 176, 177, 178, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202 },
+          [72] = { 5, 174, 175, 176, 177, 178, 180, 181, 182, 183, 184, 185, 186, 187, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214 },
+          [73] = { 5, 180, 181, 182, 183, 184, 185, 186, 187, 189, 190, 191, 192, 193, 194, 195, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214 },
+          [74] = { 5, 182, 183, 184, 185, 186, 187, 189, 190, 191, 192, 193, 194, 195, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216 },
+          [75] = { 5, 183, 184, 185, 186, 187, 189, 190, 191, 192, 193, 194, 195, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222 },
+          [76] = { 5, 189, 190, 191, 192, 193, 194, 195, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222 },
+          [77] = { 5, 191, 192, 193, 194, 195, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222 },
+          [78] = { 5, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222 },
+          [79] = { 5, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222 },
+          [80] = { 215, 216, 217, 218, 219, 220, 221, 222 },
+          [81] = { 215, 216, 217, 218, 219, 220, 221, 222 },
+          [82] = { 218, 219, 220, 221, 222 },
+        },
+      },
     },
     {
       professionId = 202,
@@ -21223,6 +22271,312 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [4357] = 7,
+        [4358] = 8,
+        [4359] = 9,
+        [4360] = 10,
+        [4361] = 12,
+        [4362] = 13,
+        [4363] = 15,
+        [4364] = 16,
+        [4365] = 17,
+        [4366] = 20,
+        [4367] = 25,
+        [4368] = 23,
+        [4369] = 27,
+        [4370] = 28,
+        [4371] = 26,
+        [4372] = 30,
+        [4373] = 31,
+        [4374] = 32,
+        [4375] = 41,
+        [4376] = 34,
+        [4377] = 36,
+        [4378] = 37,
+        [4379] = 42,
+        [4380] = 44,
+        [4381] = 45,
+        [4382] = 46,
+        [4383] = 47,
+        [4384] = 50,
+        [4385] = 53,
+        [4386] = 55,
+        [4387] = 57,
+        [4388] = 56,
+        [4389] = 60,
+        [4390] = 64,
+        [4391] = 62,
+        [4392] = 71,
+        [4393] = 72,
+        [4394] = 74,
+        [4395] = 76,
+        [4396] = 81,
+        [4397] = 79,
+        [4398] = 80,
+        [4401] = 19,
+        [4403] = 59,
+        [4404] = 21,
+        [4405] = 14,
+        [4406] = 29,
+        [4407] = 70,
+        [4852] = 73,
+        [5507] = 43,
+        [6219] = 11,
+        [6533] = 48,
+        [6712] = 24,
+        [6714] = 22,
+        [7148] = 58,
+        [7189] = 106,
+        [7191] = 142,
+        [7506] = 35,
+        [8067] = 1,
+        [8068] = 18,
+        [8069] = 33,
+        [9312] = 49,
+        [9313] = 52,
+        [9318] = 54,
+        [10498] = 63,
+        [10499] = 61,
+        [10500] = 84,
+        [10501] = 101,
+        [10502] = 110,
+        [10503] = 114,
+        [10504] = 122,
+        [10505] = 68,
+        [10506] = 111,
+        [10507] = 69,
+        [10508] = 92,
+        [10510] = 102,
+        [10512] = 97,
+        [10513] = 123,
+        [10514] = 100,
+        [10518] = 108,
+        [10542] = 87,
+        [10543] = 86,
+        [10545] = 95,
+        [10546] = 94,
+        [10548] = 120,
+        [10558] = 51,
+        [10559] = 77,
+        [10560] = 83,
+        [10561] = 99,
+        [10562] = 116,
+        [10576] = 126,
+        [10577] = 4,
+        [10586] = 117,
+        [10587] = 113,
+        [10588] = 121,
+        [10644] = 88,
+        [10645] = 118,
+        [10646] = 89,
+        [10713] = 90,
+        [10716] = 85,
+        [10720] = 96,
+        [10721] = 98,
+        [10724] = 105,
+        [10725] = 112,
+        [10726] = 115,
+        [10727] = 119,
+        [11590] = 82,
+        [11825] = 93,
+        [11826] = 91,
+        [15846] = 127,
+        [15992] = 124,
+        [15993] = 131,
+        [15994] = 133,
+        [15995] = 132,
+        [15996] = 138,
+        [15997] = 153,
+        [15999] = 139,
+        [16000] = 150,
+        [16004] = 140,
+        [16005] = 151,
+        [16006] = 152,
+        [16007] = 167,
+        [16008] = 155,
+        [16009] = 156,
+        [16022] = 158,
+        [16023] = 147,
+        [16040] = 157,
+        [17716] = 75,
+        [18168] = 168,
+        [18232] = 166,
+        [18282] = 162,
+        [18283] = 159,
+        [18587] = 137,
+        [18588] = 78,
+        [18594] = 148,
+        [18631] = 134,
+        [18634] = 130,
+        [18637] = 146,
+        [18638] = 154,
+        [18639] = 170,
+        [18641] = 125,
+        [18645] = 136,
+        [18660] = 135,
+        [18984] = 3,
+        [18986] = 5,
+        [19026] = 128,
+        [19998] = 161,
+        [19999] = 160,
+        [20475] = 181,
+        [21277] = 129,
+        [21557] = 40,
+        [21558] = 38,
+        [21559] = 39,
+        [21569] = 104,
+        [21570] = 141,
+        [21571] = 103,
+        [21574] = 107,
+        [21576] = 109,
+        [21589] = 65,
+        [21590] = 66,
+        [21592] = 67,
+        [21714] = 143,
+        [21716] = 144,
+        [21718] = 145,
+        [22728] = 149,
+        [23736] = 164,
+        [23737] = 175,
+        [23742] = 173,
+        [23746] = 197,
+        [23747] = 206,
+        [23748] = 215,
+        [23758] = 189,
+        [23761] = 194,
+        [23762] = 203,
+        [23763] = 208,
+        [23764] = 182,
+        [23765] = 209,
+        [23766] = 216,
+        [23767] = 176,
+        [23768] = 188,
+        [23771] = 185,
+        [23772] = 172,
+        [23774] = 177,
+        [23775] = 201,
+        [23781] = 163,
+        [23782] = 165,
+        [23783] = 169,
+        [23784] = 174,
+        [23785] = 192,
+        [23786] = 193,
+        [23787] = 190,
+        [23819] = 198,
+        [23821] = 171,
+        [23824] = 204,
+        [23825] = 202,
+        [23826] = 179,
+        [23827] = 195,
+        [23828] = 213,
+        [23829] = 212,
+        [23835] = 191,
+        [23836] = 200,
+        [23838] = 210,
+        [23839] = 211,
+        [23841] = 178,
+        [25886] = 187,
+        [30542] = 2,
+        [30544] = 6,
+        [32413] = 184,
+        [32423] = 186,
+        [32756] = 214,
+        [33092] = 180,
+        [33093] = 196,
+        [34060] = 199,
+        [34061] = 217,
+        [34113] = 207,
+        [34504] = 183,
+        [35581] = 205,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 1, 7, 8 },
+          [1] = { 1, 7, 8 },
+          [2] = { 1, 7, 8 },
+          [3] = { 1, 7, 8 },
+          [4] = { 1, 7, 8 },
+          [5] = { 1, 7, 8 },
+          [6] = { 1, 7, 8, 9, 10 },
+          [7] = { 1, 7, 8, 9, 10 },
+          [8] = { 1, 8, 9, 10 },
+          [9] = { 1, 8, 9, 10 },
+          [10] = { 1, 8, 9, 10, 11, 12, 13 },
+          [11] = { 1, 8, 9, 10, 11, 12, 13 },
+          [12] = { 10, 11, 12, 13, 14 },
+          [13] = { 10, 11, 12, 13, 14, 15 },
+          [14] = { 10, 11, 12, 13, 14, 15 },
+          [15] = { 10, 11, 12, 13, 14, 15, 16, 17, 18, 19 },
+          [16] = { 10, 11, 12, 13, 14, 15, 16, 17, 18, 19 },
+          [17] = { 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20 },
+          [18] = { 12, 13, 14, 15, 16, 17, 18, 19, 20, 21 },
+          [19] = { 12, 13, 14, 15, 17, 19, 20, 21 },
+          [20] = { 12, 13, 14, 15, 17, 19, 20, 21, 22, 23, 24, 25 },
+          [21] = { 12, 13, 14, 15, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28 },
+          [22] = { 14, 15, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29 },
+          [23] = { 14, 15, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29 },
+          [24] = { 15, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32 },
+          [25] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41 },
+          [26] = { 19, 20, 21, 23, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42 },
+          [27] = { 20, 21, 23, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43 },
+          [28] = { 20, 23, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45 },
+          [29] = { 23, 25, 26, 27, 28, 29, 30, 31, 32, 34, 35, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47 },
+          [30] = { 23, 25, 26, 27, 28, 29, 30, 31, 32, 34, 35, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54 },
+          [31] = { 23, 25, 29, 30, 31, 32, 34, 35, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55 },
+          [32] = { 30, 31, 32, 34, 35, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [33] = { 30, 31, 32, 34, 35, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59 },
+          [34] = { 34, 35, 41, 42, 43, 44, 45, 46, 47, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60 },
+          [35] = { 42, 43, 44, 45, 46, 47, 50, 51, 53, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69 },
+          [36] = { 43, 44, 45, 46, 47, 50, 51, 53, 55, 56, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70 },
+          [37] = { 44, 45, 46, 47, 50, 51, 53, 55, 56, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73 },
+          [38] = { 46, 47, 50, 53, 55, 56, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75 },
+          [39] = { 50, 53, 56, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 70, 71, 72, 73, 74, 75, 76, 77 },
+          [40] = { 59, 60, 61, 62, 63, 64, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83 },
+          [41] = { 60, 61, 62, 63, 64, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93 },
+          [42] = { 61, 62, 63, 64, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 89, 92, 94, 95, 96, 97 },
+          [43] = { 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 89, 92, 94, 95, 96, 97, 98, 99, 100 },
+          [44] = { 71, 72, 73, 74, 75, 76, 77, 79, 80, 81, 82, 83, 84, 85, 86, 87, 89, 92, 94, 95, 96, 97, 98, 99, 100, 101, 102 },
+          [45] = { 4, 74, 75, 76, 77, 79, 80, 81, 82, 83, 84, 85, 86, 87, 89, 92, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110 },
+          [46] = { 4, 76, 77, 79, 80, 81, 82, 83, 84, 85, 86, 87, 89, 92, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114 },
+          [47] = { 4, 79, 80, 81, 82, 83, 84, 85, 86, 87, 89, 92, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117 },
+          [48] = { 4, 84, 85, 86, 87, 89, 92, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120 },
+          [49] = { 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123 },
+          [50] = { 98, 99, 100, 101, 102, 104, 105, 106, 108, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129 },
+          [51] = { 101, 102, 104, 105, 106, 108, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129 },
+          [52] = { 104, 105, 106, 108, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135 },
+          [53] = { 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138 },
+          [54] = { 115, 116, 117, 118, 119, 120, 121, 122, 123, 126, 127, 129, 130, 131, 132, 133, 134, 136, 137, 138, 139 },
+          [55] = { 118, 119, 120, 121, 122, 123, 126, 127, 129, 130, 131, 132, 133, 134, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150 },
+          [56] = { 121, 122, 123, 126, 127, 129, 130, 131, 132, 133, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150 },
+          [57] = { 3, 5, 126, 127, 129, 130, 131, 132, 133, 137, 138, 139, 140, 141, 146, 147, 148, 150, 151, 152, 153 },
+          [58] = { 3, 5, 129, 130, 131, 132, 133, 137, 138, 139, 140, 141, 146, 147, 148, 150, 151, 152, 153, 154, 155, 156 },
+          [59] = { 3, 5, 129, 130, 131, 132, 133, 137, 138, 139, 140, 141, 147, 150, 151, 152, 153, 154, 155, 156 },
+          [60] = { 3, 5, 129, 137, 138, 139, 140, 141, 147, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170 },
+          [61] = { 129, 139, 140, 141, 147, 150, 151, 152, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171 },
+          [62] = { 129, 140, 141, 147, 150, 151, 152, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 170, 171, 172 },
+          [63] = { 129, 151, 152, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 170, 171, 172 },
+          [64] = { 129, 151, 152, 154, 155, 156, 157, 158, 159, 160, 161, 162, 164, 166, 167, 168, 170, 171, 172, 173 },
+          [65] = { 129, 154, 155, 156, 157, 158, 159, 160, 161, 162, 164, 166, 167, 168, 170, 172, 173, 174, 175, 176, 177, 178, 179 },
+          [66] = { 129, 157, 158, 159, 160, 161, 162, 164, 166, 167, 168, 170, 173, 174, 175, 176, 177, 178, 179, 180 },
+          [67] = { 129, 157, 158, 159, 160, 161, 162, 164, 166, 167, 168, 170, 173, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188 },
+          [68] = { 173, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195 },
+          [69] = { 173, 175, 176, 178, 180, 181, 182, 183, 184, 185, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196 },
+          [70] = { 2, 6, 175, 176, 178, 181, 182, 183, 184, 185, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203 },
+          [71] = { 2, 6, 182, 184, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205 },
+          [72] = { 2, 6, 182, 184, 189, 190, 191, 192, 193, 194, 196, 197, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209 },
+          [73] = { 2, 6, 189, 190, 191, 192, 193, 194, 197, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209 },
+          [74] = { 191, 197, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209 },
+          [75] = { 191, 197, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217 },
+          [76] = { 199, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217 },
+          [77] = { 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217 },
+          [78] = { 210, 211, 212, 213, 214, 215, 216, 217 },
+          [79] = { 214, 215, 216 },
+          [80] = { 214, 215, 216 },
+          [81] = { 214 },
+        },
+      },
     },
     {
       professionId = 129,
@@ -21481,6 +22835,110 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [1251] = 1,
+        [2581] = 2,
+        [3530] = 4,
+        [3531] = 5,
+        [6450] = 7,
+        [6451] = 8,
+        [6452] = 3,
+        [6453] = 6,
+        [8544] = 9,
+        [8545] = 10,
+        [14529] = 11,
+        [14530] = 12,
+        [19440] = 13,
+        [21990] = 14,
+        [21991] = 15,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 1 },
+          [1] = { 1 },
+          [2] = { 1 },
+          [3] = { 1 },
+          [4] = { 1 },
+          [5] = { 1 },
+          [6] = { 1 },
+          [7] = { 1 },
+          [8] = { 1, 2 },
+          [9] = { 1, 2 },
+          [10] = { 1, 2 },
+          [11] = { 1, 2 },
+          [12] = { 2 },
+          [13] = { 2 },
+          [14] = { 2 },
+          [15] = { 2 },
+          [16] = { 2, 3, 4 },
+          [17] = { 2, 3, 4 },
+          [18] = { 2, 3, 4 },
+          [19] = { 2, 3, 4 },
+          [20] = { 3, 4 },
+          [21] = { 3, 4 },
+          [22] = { 3, 4 },
+          [23] = { 3, 4, 5 },
+          [24] = { 3, 4, 5 },
+          [25] = { 3, 4, 5 },
+          [26] = { 3, 4, 5, 6 },
+          [27] = { 3, 4, 5, 6 },
+          [28] = { 3, 4, 5, 6 },
+          [29] = { 3, 4, 5, 6 },
+          [30] = { 5, 6, 7 },
+          [31] = { 5, 6, 7 },
+          [32] = { 5, 6, 7 },
+          [33] = { 5, 6, 7 },
+          [34] = { 5, 6, 7 },
+          [35] = { 5, 6, 7 },
+          [36] = { 5, 6, 7, 8 },
+          [37] = { 6, 7, 8 },
+          [38] = { 6, 7, 8 },
+          [39] = { 6, 7, 8 },
+          [40] = { 7, 8 },
+          [41] = { 7, 8 },
+          [42] = { 8, 9 },
+          [43] = { 8, 9 },
+          [44] = { 8, 9 },
+          [45] = { 8, 9 },
+          [46] = { 8, 9 },
+          [47] = { 8, 9 },
+          [48] = { 9, 10 },
+          [49] = { 9, 10 },
+          [50] = { 9, 10 },
+          [51] = { 9, 10 },
+          [52] = { 9, 10, 11 },
+          [53] = { 9, 10, 11 },
+          [54] = { 10, 11 },
+          [55] = { 10, 11 },
+          [56] = { 10, 11 },
+          [57] = { 10, 11 },
+          [58] = { 10, 11, 12 },
+          [59] = { 10, 11, 12 },
+          [60] = { 11, 12, 13 },
+          [61] = { 11, 12, 13 },
+          [62] = { 11, 12, 13 },
+          [63] = { 11, 12, 13 },
+          [64] = { 12, 13 },
+          [65] = { 12, 13 },
+          [66] = { 12, 13, 14 },
+          [67] = { 12, 13, 14 },
+          [68] = { 12, 13, 14 },
+          [69] = { 12, 13, 14 },
+          [70] = { 13, 14 },
+          [71] = { 13, 14 },
+          [72] = { 14, 15 },
+          [73] = { 14, 15 },
+          [74] = { 14, 15 },
+          [75] = { 14, 15 },
+          [76] = { 14, 15 },
+          [77] = { 14, 15 },
+          [78] = { 15 },
+          [79] = { 15 },
+          [80] = { 15 },
+          [81] = { 15 },
+        },
+      },
     },
     {
       professionId = 755,
@@ -26223,6 +27681,354 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [20816] = 2,
+        [20817] = 10,
+        [20818] = 12,
+        [20820] = 15,
+        [20821] = 8,
+        [20823] = 17,
+        [20826] = 21,
+        [20827] = 20,
+        [20828] = 22,
+        [20830] = 24,
+        [20831] = 33,
+        [20832] = 27,
+        [20833] = 30,
+        [20906] = 1,
+        [20907] = 13,
+        [20909] = 25,
+        [20950] = 28,
+        [20954] = 29,
+        [20955] = 31,
+        [20958] = 32,
+        [20959] = 37,
+        [20960] = 36,
+        [20961] = 39,
+        [20963] = 34,
+        [20964] = 45,
+        [20966] = 35,
+        [20967] = 41,
+        [20969] = 50,
+        [21748] = 43,
+        [21752] = 51,
+        [21753] = 57,
+        [21754] = 56,
+        [21755] = 47,
+        [21756] = 42,
+        [21758] = 46,
+        [21760] = 49,
+        [21763] = 53,
+        [21764] = 54,
+        [21765] = 55,
+        [21766] = 58,
+        [21767] = 60,
+        [21768] = 63,
+        [21769] = 59,
+        [21774] = 62,
+        [21775] = 65,
+        [21777] = 67,
+        [21778] = 68,
+        [21779] = 87,
+        [21780] = 99,
+        [21784] = 72,
+        [21789] = 73,
+        [21790] = 66,
+        [21791] = 70,
+        [21792] = 84,
+        [21793] = 90,
+        [21931] = 4,
+        [21932] = 5,
+        [21933] = 14,
+        [21934] = 9,
+        [23094] = 78,
+        [23095] = 79,
+        [23096] = 93,
+        [23097] = 102,
+        [23098] = 75,
+        [23099] = 83,
+        [23100] = 92,
+        [23101] = 107,
+        [23103] = 76,
+        [23104] = 82,
+        [23105] = 91,
+        [23106] = 101,
+        [23108] = 74,
+        [23109] = 85,
+        [23110] = 94,
+        [23111] = 111,
+        [23113] = 71,
+        [23114] = 81,
+        [23115] = 96,
+        [23116] = 109,
+        [23118] = 77,
+        [23119] = 86,
+        [23120] = 95,
+        [23121] = 105,
+        [24027] = 120,
+        [24028] = 125,
+        [24029] = 157,
+        [24030] = 148,
+        [24031] = 121,
+        [24032] = 156,
+        [24033] = 151,
+        [24035] = 153,
+        [24036] = 127,
+        [24037] = 138,
+        [24039] = 155,
+        [24047] = 122,
+        [24048] = 150,
+        [24050] = 129,
+        [24051] = 146,
+        [24052] = 158,
+        [24053] = 139,
+        [24054] = 152,
+        [24055] = 149,
+        [24056] = 131,
+        [24057] = 147,
+        [24058] = 134,
+        [24059] = 140,
+        [24060] = 137,
+        [24061] = 130,
+        [24062] = 126,
+        [24065] = 124,
+        [24066] = 143,
+        [24067] = 135,
+        [24074] = 88,
+        [24075] = 89,
+        [24076] = 97,
+        [24077] = 116,
+        [24078] = 115,
+        [24079] = 136,
+        [24080] = 162,
+        [24082] = 163,
+        [24085] = 174,
+        [24086] = 183,
+        [24087] = 118,
+        [24088] = 161,
+        [24089] = 184,
+        [24092] = 175,
+        [24093] = 177,
+        [24095] = 178,
+        [24097] = 176,
+        [24098] = 179,
+        [24106] = 165,
+        [24110] = 164,
+        [24114] = 167,
+        [24116] = 170,
+        [24117] = 191,
+        [24121] = 187,
+        [24122] = 206,
+        [24123] = 205,
+        [24124] = 210,
+        [24125] = 209,
+        [24126] = 211,
+        [24127] = 213,
+        [24128] = 212,
+        [25438] = 6,
+        [25439] = 7,
+        [25498] = 3,
+        [25880] = 11,
+        [25881] = 26,
+        [25882] = 38,
+        [25883] = 48,
+        [25890] = 190,
+        [25893] = 197,
+        [25894] = 202,
+        [25895] = 192,
+        [25896] = 199,
+        [25897] = 185,
+        [25898] = 203,
+        [25899] = 186,
+        [25901] = 195,
+        [28290] = 110,
+        [28595] = 80,
+        [29157] = 40,
+        [29158] = 44,
+        [29159] = 64,
+        [29160] = 69,
+        [30419] = 18,
+        [30420] = 23,
+        [30421] = 52,
+        [30422] = 61,
+        [30804] = 16,
+        [30825] = 180,
+        [31079] = 106,
+        [31154] = 19,
+        [31398] = 255,
+        [31399] = 256,
+        [31860] = 103,
+        [31861] = 132,
+        [31862] = 98,
+        [31863] = 119,
+        [31864] = 104,
+        [31865] = 133,
+        [31866] = 112,
+        [31867] = 159,
+        [31868] = 160,
+        [31869] = 113,
+        [32193] = 215,
+        [32194] = 219,
+        [32195] = 254,
+        [32196] = 245,
+        [32197] = 216,
+        [32198] = 253,
+        [32199] = 226,
+        [32200] = 248,
+        [32201] = 250,
+        [32202] = 236,
+        [32203] = 252,
+        [32204] = 217,
+        [32205] = 247,
+        [32206] = 243,
+        [32207] = 228,
+        [32208] = 257,
+        [32209] = 237,
+        [32210] = 231,
+        [32211] = 249,
+        [32212] = 246,
+        [32213] = 214,
+        [32214] = 232,
+        [32215] = 230,
+        [32216] = 244,
+        [32217] = 233,
+        [32218] = 238,
+        [32219] = 235,
+        [32220] = 229,
+        [32221] = 258,
+        [32222] = 259,
+        [32223] = 220,
+        [32224] = 241,
+        [32225] = 218,
+        [32226] = 234,
+        [32409] = 200,
+        [32410] = 204,
+        [32508] = 117,
+        [32772] = 100,
+        [32774] = 114,
+        [32776] = 189,
+        [32833] = 108,
+        [32836] = 141,
+        [33131] = 168,
+        [33133] = 169,
+        [33134] = 173,
+        [33135] = 172,
+        [33140] = 166,
+        [33143] = 181,
+        [33144] = 171,
+        [33782] = 154,
+        [34220] = 188,
+        [34358] = 194,
+        [34359] = 198,
+        [34360] = 182,
+        [34361] = 193,
+        [34362] = 196,
+        [34363] = 201,
+        [35315] = 142,
+        [35316] = 144,
+        [35318] = 128,
+        [35501] = 208,
+        [35503] = 207,
+        [35693] = 222,
+        [35694] = 223,
+        [35700] = 221,
+        [35702] = 225,
+        [35703] = 224,
+        [35707] = 145,
+        [35758] = 251,
+        [35759] = 227,
+        [35760] = 242,
+        [35761] = 240,
+        [37503] = 239,
+        [191061] = 123,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 1, 2, 3, 4 },
+          [1] = { 1, 2, 3, 4, 5 },
+          [2] = { 1, 2, 3, 4, 5 },
+          [3] = { 1, 2, 3, 4, 5 },
+          [4] = { 1, 2, 3, 4, 5, 6, 7 },
+          [5] = { 1, 2, 3, 4, 5, 6, 7 },
+          [6] = { 1, 2, 3, 4, 5, 6, 7, 8, 9 },
+          [7] = { 1, 2, 3, 4, 5, 6, 7, 8, 9 },
+          [8] = { 1, 2, 3, 4, 5, 6, 7, 8, 9 },
+          [9] = { 1, 2, 3, 4, 5, 6, 7, 8, 9 },
+          [10] = { 1, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14 },
+          [11] = { 1, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14 },
+          [12] = { 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15 },
+          [13] = { 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16 },
+          [14] = { 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17 },
+          [15] = { 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 },
+          [16] = { 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20 },
+          [17] = { 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20 },
+          [18] = { 12, 13, 14, 15, 16, 17, 18, 19, 20, 21 },
+          [19] = { 12, 13, 14, 15, 16, 17, 18, 19, 20, 21 },
+          [20] = { 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22 },
+          [21] = { 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23 },
+          [22] = { 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26 },
+          [23] = { 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26 },
+          [24] = { 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28 },
+          [25] = { 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [26] = { 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30 },
+          [27] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31 },
+          [28] = { 21, 22, 23, 24, 25, 27, 28, 29, 30, 31 },
+          [29] = { 21, 22, 23, 24, 25, 27, 28, 29, 30, 31 },
+          [30] = { 22, 23, 24, 25, 27, 28, 29, 30, 31, 32, 33, 34 },
+          [31] = { 22, 23, 24, 25, 27, 28, 29, 30, 31, 32, 33, 34 },
+          [32] = { 23, 24, 25, 27, 28, 29, 30, 31, 32, 33, 34, 35 },
+          [33] = { 24, 25, 27, 28, 29, 30, 31, 32, 33, 34, 35 },
+          [34] = { 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37 },
+          [35] = { 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38 },
+          [36] = { 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40 },
+          [37] = { 31, 32, 33, 34, 35, 36, 37, 38, 39, 40 },
+          [38] = { 31, 32, 33, 35, 36, 37, 38, 39, 40, 41 },
+          [39] = { 32, 33, 35, 36, 37, 39, 40, 41 },
+          [40] = { 32, 33, 35, 36, 37, 39, 40, 41, 42, 43, 44 },
+          [41] = { 32, 33, 35, 36, 37, 39, 40, 41, 42, 43, 44 },
+          [42] = { 35, 36, 37, 39, 41, 42, 43, 44, 45 },
+          [43] = { 35, 36, 37, 39, 41, 42, 43, 44, 45, 46 },
+          [44] = { 36, 37, 39, 41, 42, 43, 44, 45, 46, 47 },
+          [45] = { 36, 37, 39, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51 },
+          [46] = { 39, 41, 42, 43, 45, 46, 47, 48, 49, 50, 51, 52 },
+          [47] = { 39, 41, 42, 43, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54 },
+          [48] = { 41, 42, 43, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55 },
+          [49] = { 41, 42, 43, 45, 46, 47, 49, 50, 51, 52, 53, 54, 55, 56 },
+          [50] = { 42, 43, 45, 46, 47, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58 },
+          [51] = { 45, 46, 47, 49, 50, 52, 53, 54, 55, 56, 57, 58 },
+          [52] = { 45, 46, 47, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60 },
+          [53] = { 46, 47, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61 },
+          [54] = { 47, 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61 },
+          [55] = { 49, 50, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63 },
+          [56] = { 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66 },
+          [57] = { 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68 },
+          [58] = { 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70 },
+          [59] = { 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70 },
+          [60] = { 57, 58, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78 },
+          [61] = { 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86 },
+          [62] = { 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89 },
+          [63] = { 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96 },
+          [64] = { 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97 },
+          [65] = { 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113 },
+          [66] = { 71, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114 },
+          [67] = { 71, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116 },
+          [68] = { 79, 80, 81, 82, 83, 85, 86, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 109, 110, 111, 112, 113, 114, 115, 116, 117 },
+          [69] = { 89, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 107, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118 },
+          [70] = { 91, 92, 93, 94, 95, 96, 98, 99, 100, 101, 102, 103, 104, 105, 107, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160 },
+          [71] = { 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165 },
+          [72] = { 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181 },
+          [73] = { 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204 },
+          [74] = { 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213 },
+          [75] = { 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 167, 170, 174, 175, 176, 177, 178, 179, 180, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259 },
+          [76] = { 161, 162, 163, 164, 165, 167, 170, 174, 175, 176, 177, 178, 179, 180, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259 },
+          [77] = { 167, 170, 174, 175, 176, 177, 178, 179, 180, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259 },
+          [78] = { 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259 },
+          [79] = { 182, 193, 194, 196, 198, 201, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259 },
+          [80] = { 182, 193, 194, 196, 198, 201, 255, 256 },
+          [81] = { 182, 193, 194, 196, 198, 201 },
+        },
+      },
     },
     {
       professionId = 165,
@@ -33714,6 +35520,471 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [2300] = 14,
+        [2302] = 2,
+        [2303] = 8,
+        [2304] = 6,
+        [2307] = 27,
+        [2308] = 24,
+        [2309] = 16,
+        [2310] = 18,
+        [2311] = 19,
+        [2312] = 22,
+        [2313] = 38,
+        [2314] = 49,
+        [2315] = 35,
+        [2316] = 42,
+        [2317] = 36,
+        [2318] = 7,
+        [2319] = 39,
+        [3719] = 67,
+        [4231] = 12,
+        [4233] = 34,
+        [4234] = 63,
+        [4236] = 61,
+        [4237] = 9,
+        [4239] = 17,
+        [4242] = 21,
+        [4243] = 25,
+        [4244] = 37,
+        [4246] = 23,
+        [4247] = 59,
+        [4248] = 45,
+        [4249] = 50,
+        [4250] = 46,
+        [4251] = 52,
+        [4252] = 56,
+        [4253] = 55,
+        [4254] = 60,
+        [4255] = 69,
+        [4256] = 81,
+        [4257] = 70,
+        [4258] = 76,
+        [4259] = 83,
+        [4260] = 93,
+        [4262] = 85,
+        [4264] = 94,
+        [4265] = 62,
+        [4304] = 101,
+        [4455] = 74,
+        [4456] = 73,
+        [5081] = 15,
+        [5739] = 87,
+        [5780] = 29,
+        [5781] = 31,
+        [5782] = 77,
+        [5783] = 91,
+        [5957] = 5,
+        [5958] = 41,
+        [5961] = 43,
+        [5962] = 71,
+        [5963] = 75,
+        [5964] = 78,
+        [5965] = 86,
+        [5966] = 90,
+        [6466] = 26,
+        [6467] = 40,
+        [6468] = 44,
+        [6709] = 28,
+        [7276] = 4,
+        [7277] = 3,
+        [7278] = 10,
+        [7279] = 11,
+        [7280] = 13,
+        [7281] = 20,
+        [7282] = 30,
+        [7283] = 32,
+        [7284] = 48,
+        [7285] = 47,
+        [7348] = 51,
+        [7349] = 54,
+        [7352] = 53,
+        [7358] = 57,
+        [7359] = 58,
+        [7371] = 66,
+        [7372] = 64,
+        [7373] = 72,
+        [7374] = 79,
+        [7375] = 80,
+        [7377] = 82,
+        [7378] = 84,
+        [7386] = 89,
+        [7387] = 92,
+        [7390] = 97,
+        [7391] = 99,
+        [8170] = 135,
+        [8172] = 96,
+        [8173] = 100,
+        [8174] = 95,
+        [8175] = 103,
+        [8176] = 102,
+        [8185] = 125,
+        [8187] = 104,
+        [8189] = 107,
+        [8191] = 122,
+        [8192] = 105,
+        [8193] = 121,
+        [8197] = 123,
+        [8198] = 106,
+        [8200] = 108,
+        [8201] = 109,
+        [8202] = 127,
+        [8203] = 111,
+        [8204] = 116,
+        [8205] = 110,
+        [8206] = 129,
+        [8207] = 128,
+        [8208] = 136,
+        [8209] = 124,
+        [8210] = 112,
+        [8211] = 118,
+        [8212] = 138,
+        [8213] = 130,
+        [8214] = 117,
+        [8215] = 137,
+        [8216] = 126,
+        [8217] = 114,
+        [8218] = 115,
+        [8345] = 119,
+        [8346] = 120,
+        [8347] = 113,
+        [8348] = 133,
+        [8349] = 132,
+        [8367] = 139,
+        [15045] = 143,
+        [15046] = 149,
+        [15047] = 226,
+        [15048] = 165,
+        [15049] = 181,
+        [15050] = 173,
+        [15051] = 188,
+        [15052] = 187,
+        [15053] = 170,
+        [15054] = 153,
+        [15055] = 242,
+        [15056] = 169,
+        [15057] = 158,
+        [15058] = 185,
+        [15059] = 215,
+        [15060] = 168,
+        [15061] = 151,
+        [15062] = 200,
+        [15063] = 176,
+        [15064] = 159,
+        [15065] = 171,
+        [15066] = 177,
+        [15067] = 150,
+        [15068] = 203,
+        [15069] = 166,
+        [15070] = 183,
+        [15071] = 155,
+        [15072] = 160,
+        [15073] = 154,
+        [15074] = 146,
+        [15075] = 174,
+        [15076] = 147,
+        [15077] = 140,
+        [15078] = 156,
+        [15079] = 167,
+        [15080] = 184,
+        [15081] = 206,
+        [15082] = 162,
+        [15083] = 144,
+        [15084] = 148,
+        [15085] = 243,
+        [15086] = 164,
+        [15087] = 180,
+        [15088] = 244,
+        [15090] = 227,
+        [15091] = 152,
+        [15092] = 157,
+        [15093] = 163,
+        [15094] = 179,
+        [15095] = 228,
+        [15096] = 229,
+        [15138] = 219,
+        [15407] = 131,
+        [15564] = 134,
+        [16982] = 182,
+        [16983] = 217,
+        [16984] = 186,
+        [17721] = 88,
+        [18238] = 98,
+        [18251] = 198,
+        [18504] = 204,
+        [18506] = 218,
+        [18508] = 239,
+        [18509] = 195,
+        [18510] = 207,
+        [18511] = 234,
+        [18662] = 65,
+        [18948] = 68,
+        [19044] = 178,
+        [19049] = 241,
+        [19052] = 175,
+        [19058] = 205,
+        [19149] = 213,
+        [19157] = 196,
+        [19162] = 199,
+        [19163] = 216,
+        [19685] = 225,
+        [19686] = 224,
+        [19687] = 223,
+        [19688] = 189,
+        [19689] = 190,
+        [20295] = 191,
+        [20296] = 161,
+        [20380] = 201,
+        [20476] = 230,
+        [20477] = 232,
+        [20478] = 231,
+        [20479] = 236,
+        [20480] = 237,
+        [20481] = 235,
+        [20575] = 33,
+        [21278] = 238,
+        [21887] = 212,
+        [22661] = 222,
+        [22662] = 221,
+        [22663] = 220,
+        [22664] = 209,
+        [22665] = 208,
+        [22666] = 210,
+        [22759] = 194,
+        [22760] = 193,
+        [22761] = 192,
+        [23793] = 255,
+        [25650] = 211,
+        [25651] = 259,
+        [25652] = 256,
+        [25653] = 303,
+        [25654] = 202,
+        [25655] = 246,
+        [25656] = 252,
+        [25657] = 267,
+        [25659] = 268,
+        [25660] = 258,
+        [25661] = 247,
+        [25662] = 233,
+        [25668] = 253,
+        [25669] = 240,
+        [25670] = 251,
+        [25671] = 263,
+        [25673] = 245,
+        [25674] = 248,
+        [25675] = 254,
+        [25676] = 264,
+        [25679] = 197,
+        [25680] = 307,
+        [25681] = 304,
+        [25682] = 306,
+        [25683] = 305,
+        [25685] = 271,
+        [25686] = 291,
+        [25687] = 292,
+        [25689] = 314,
+        [25690] = 309,
+        [25691] = 308,
+        [25692] = 277,
+        [25693] = 300,
+        [25694] = 276,
+        [25695] = 293,
+        [25696] = 313,
+        [25697] = 312,
+        [29483] = 278,
+        [29485] = 272,
+        [29486] = 273,
+        [29487] = 275,
+        [29488] = 269,
+        [29489] = 290,
+        [29490] = 289,
+        [29491] = 288,
+        [29492] = 296,
+        [29493] = 295,
+        [29494] = 294,
+        [29495] = 287,
+        [29496] = 286,
+        [29497] = 285,
+        [29498] = 283,
+        [29499] = 282,
+        [29500] = 281,
+        [29502] = 317,
+        [29503] = 316,
+        [29504] = 337,
+        [29505] = 325,
+        [29506] = 323,
+        [29507] = 338,
+        [29508] = 328,
+        [29509] = 339,
+        [29510] = 332,
+        [29511] = 331,
+        [29512] = 319,
+        [29514] = 336,
+        [29515] = 354,
+        [29516] = 352,
+        [29517] = 353,
+        [29519] = 362,
+        [29520] = 360,
+        [29521] = 361,
+        [29522] = 377,
+        [29523] = 376,
+        [29524] = 375,
+        [29525] = 365,
+        [29526] = 363,
+        [29527] = 364,
+        [29528] = 270,
+        [29529] = 318,
+        [29530] = 279,
+        [29531] = 284,
+        [29532] = 340,
+        [29533] = 266,
+        [29534] = 265,
+        [29535] = 330,
+        [29536] = 329,
+        [29540] = 257,
+        [29964] = 141,
+        [29970] = 145,
+        [29971] = 142,
+        [29973] = 262,
+        [29974] = 261,
+        [29975] = 260,
+        [30039] = 348,
+        [30040] = 342,
+        [30041] = 346,
+        [30042] = 343,
+        [30043] = 356,
+        [30044] = 359,
+        [30045] = 349,
+        [30046] = 344,
+        [32393] = 366,
+        [32394] = 368,
+        [32395] = 369,
+        [32396] = 367,
+        [32397] = 374,
+        [32398] = 347,
+        [32399] = 351,
+        [32400] = 355,
+        [32574] = 345,
+        [32575] = 371,
+        [32577] = 357,
+        [32579] = 358,
+        [32580] = 372,
+        [32581] = 373,
+        [32582] = 350,
+        [32583] = 370,
+        [33122] = 311,
+        [33204] = 333,
+        [34086] = 172,
+        [34099] = 249,
+        [34100] = 250,
+        [34105] = 302,
+        [34106] = 301,
+        [34207] = 297,
+        [34330] = 299,
+        [34369] = 315,
+        [34370] = 322,
+        [34371] = 326,
+        [34372] = 327,
+        [34373] = 320,
+        [34374] = 321,
+        [34375] = 334,
+        [34376] = 335,
+        [34482] = 214,
+        [34490] = 310,
+        [185848] = 324,
+        [185849] = 341,
+        [185850] = 298,
+        [185851] = 280,
+        [185852] = 274,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 2, 3, 4, 5, 6, 7 },
+          [1] = { 2, 3, 4, 5, 6, 7 },
+          [2] = { 2, 3, 4, 5, 6, 7 },
+          [3] = { 2, 3, 4, 5, 6, 7, 8 },
+          [4] = { 2, 3, 4, 5, 6, 7, 8 },
+          [5] = { 2, 3, 4, 5, 6, 7, 8, 9 },
+          [6] = { 2, 3, 4, 5, 6, 7, 8, 9, 10, 11 },
+          [7] = { 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13 },
+          [8] = { 2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 13, 14, 15 },
+          [9] = { 2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 13, 14, 15 },
+          [10] = { 2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 13, 14, 15 },
+          [11] = { 2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17 },
+          [12] = { 2, 3, 4, 5, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19 },
+          [13] = { 2, 3, 4, 5, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19 },
+          [14] = { 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20 },
+          [15] = { 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22 },
+          [16] = { 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23 },
+          [17] = { 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25 },
+          [18] = { 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29 },
+          [19] = { 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31 },
+          [20] = { 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39 },
+          [21] = { 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41 },
+          [22] = { 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 40, 41, 42 },
+          [23] = { 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 40, 41, 42, 43, 44 },
+          [24] = { 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49 },
+          [25] = { 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51 },
+          [26] = { 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 35, 36, 37, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52 },
+          [27] = { 23, 25, 26, 27, 28, 29, 30, 31, 32, 33, 35, 36, 37, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55 },
+          [28] = { 25, 26, 27, 28, 29, 30, 31, 32, 33, 35, 36, 37, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [29] = { 26, 27, 29, 30, 31, 32, 33, 35, 36, 37, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59 },
+          [30] = { 30, 31, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67 },
+          [31] = { 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69 },
+          [32] = { 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 64, 66, 67, 68, 69, 70, 71 },
+          [33] = { 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 64, 66, 67, 68, 69, 70, 71, 72, 73, 74 },
+          [34] = { 45, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 62, 64, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77 },
+          [35] = { 45, 52, 53, 54, 55, 56, 57, 58, 59, 60, 62, 64, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81 },
+          [36] = { 53, 54, 55, 56, 57, 58, 59, 60, 62, 64, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83 },
+          [37] = { 56, 57, 58, 59, 60, 62, 64, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86 },
+          [38] = { 58, 59, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91 },
+          [39] = { 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93 },
+          [40] = { 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101 },
+          [41] = { 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 104 },
+          [42] = { 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 104, 105, 106, 107 },
+          [43] = { 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 104, 105, 106, 107, 108 },
+          [44] = { 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112 },
+          [45] = { 87, 88, 89, 90, 91, 92, 93, 94, 95, 97, 98, 99, 100, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119 },
+          [46] = { 92, 93, 94, 95, 97, 99, 100, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122 },
+          [47] = { 94, 95, 97, 99, 100, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125 },
+          [48] = { 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128 },
+          [49] = { 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130 },
+          [50] = { 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138 },
+          [51] = { 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 136, 137, 138, 139, 140 },
+          [52] = { 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 132, 133, 134, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145 },
+          [53] = { 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 132, 133, 134, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148 },
+          [54] = { 123, 124, 125, 126, 127, 128, 129, 130, 132, 133, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153 },
+          [55] = { 1, 126, 127, 128, 129, 130, 132, 133, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159 },
+          [56] = { 1, 129, 130, 132, 133, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164 },
+          [57] = { 1, 132, 133, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172 },
+          [58] = { 1, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 173, 174, 175, 176, 177, 178, 179, 180 },
+          [59] = { 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185 },
+          [60] = { 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245 },
+          [61] = { 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245 },
+          [62] = { 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248 },
+          [63] = { 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251 },
+          [64] = { 165, 166, 167, 168, 169, 170, 171, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254 },
+          [65] = { 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259 },
+          [66] = { 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 198, 199, 200, 201, 203, 204, 205, 206, 207, 208, 209, 210, 211, 213, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 234, 235, 236, 237, 238, 239, 241, 242, 243, 244, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264 },
+          [67] = { 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 198, 199, 200, 201, 203, 204, 205, 206, 207, 208, 209, 210, 211, 213, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 234, 235, 236, 237, 238, 239, 241, 242, 243, 244, 246, 247, 248, 249, 250, 251, 252, 253, 254, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268 },
+          [68] = { 249, 250, 251, 252, 253, 254, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278 },
+          [69] = { 252, 253, 254, 258, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280 },
+          [70] = { 258, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307 },
+          [71] = { 260, 261, 262, 263, 264, 267, 268, 269, 271, 272, 273, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309 },
+          [72] = { 260, 261, 262, 267, 268, 271, 276, 277, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314 },
+          [73] = { 260, 261, 262, 271, 276, 277, 281, 282, 283, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339 },
+          [74] = { 281, 282, 283, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341 },
+          [75] = { 281, 282, 283, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377 },
+          [76] = { 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 319, 320, 321, 322, 323, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377 },
+          [77] = { 310, 311, 312, 313, 314, 315, 316, 317, 319, 320, 321, 322, 323, 325, 326, 327, 328, 331, 332, 333, 334, 335, 336, 337, 338, 339, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377 },
+          [78] = { 315, 316, 317, 319, 320, 321, 322, 323, 325, 326, 327, 328, 331, 332, 333, 334, 335, 336, 337, 338, 339, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377 },
+          [79] = { 315, 320, 321, 322, 326, 327, 334, 335, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377 },
+          [80] = { 315, 320, 321, 322, 326, 327, 334, 335, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377 },
+          [81] = { 315, 320, 321, 322, 326, 327, 334, 335 },
+        },
+      },
     },
     {
       professionId = 197,
@@ -39855,6 +42126,406 @@ FrugalForgeData_Anniversary = {
           },
         },
       },
+      createdBy = {
+        [2568] = 7,
+        [2569] = 23,
+        [2570] = 4,
+        [2572] = 15,
+        [2575] = 16,
+        [2576] = 6,
+        [2577] = 14,
+        [2578] = 24,
+        [2579] = 26,
+        [2580] = 22,
+        [2582] = 34,
+        [2583] = 39,
+        [2584] = 31,
+        [2585] = 43,
+        [2587] = 41,
+        [2996] = 2,
+        [2997] = 29,
+        [4238] = 18,
+        [4240] = 33,
+        [4241] = 37,
+        [4245] = 67,
+        [4305] = 54,
+        [4307] = 13,
+        [4308] = 21,
+        [4309] = 27,
+        [4310] = 35,
+        [4311] = 42,
+        [4312] = 32,
+        [4313] = 38,
+        [4314] = 44,
+        [4315] = 51,
+        [4316] = 45,
+        [4317] = 56,
+        [4318] = 58,
+        [4319] = 62,
+        [4320] = 57,
+        [4322] = 71,
+        [4323] = 75,
+        [4324] = 65,
+        [4325] = 79,
+        [4326] = 88,
+        [4327] = 97,
+        [4328] = 85,
+        [4329] = 98,
+        [4330] = 46,
+        [4331] = 55,
+        [4332] = 59,
+        [4333] = 68,
+        [4334] = 74,
+        [4335] = 89,
+        [4336] = 96,
+        [4339] = 78,
+        [4343] = 10,
+        [4344] = 3,
+        [5542] = 36,
+        [5762] = 28,
+        [5763] = 49,
+        [5764] = 81,
+        [5765] = 86,
+        [5766] = 60,
+        [5770] = 66,
+        [6238] = 11,
+        [6239] = 20,
+        [6240] = 19,
+        [6241] = 12,
+        [6242] = 25,
+        [6263] = 40,
+        [6264] = 48,
+        [6384] = 52,
+        [6385] = 53,
+        [6786] = 17,
+        [6787] = 47,
+        [6795] = 70,
+        [6796] = 82,
+        [6836] = 138,
+        [7026] = 8,
+        [7046] = 61,
+        [7047] = 64,
+        [7048] = 63,
+        [7050] = 69,
+        [7051] = 73,
+        [7052] = 76,
+        [7053] = 77,
+        [7054] = 93,
+        [7055] = 80,
+        [7056] = 83,
+        [7057] = 84,
+        [7058] = 87,
+        [7059] = 91,
+        [7060] = 90,
+        [7061] = 95,
+        [7062] = 94,
+        [7063] = 101,
+        [7064] = 103,
+        [7065] = 72,
+        [9998] = 100,
+        [9999] = 99,
+        [10001] = 102,
+        [10002] = 104,
+        [10003] = 105,
+        [10004] = 109,
+        [10007] = 108,
+        [10008] = 110,
+        [10009] = 107,
+        [10018] = 117,
+        [10019] = 113,
+        [10021] = 114,
+        [10023] = 118,
+        [10024] = 120,
+        [10025] = 134,
+        [10026] = 119,
+        [10027] = 121,
+        [10028] = 126,
+        [10029] = 125,
+        [10030] = 128,
+        [10031] = 130,
+        [10033] = 129,
+        [10034] = 131,
+        [10035] = 135,
+        [10036] = 145,
+        [10040] = 146,
+        [10041] = 137,
+        [10042] = 112,
+        [10044] = 132,
+        [10045] = 5,
+        [10046] = 9,
+        [10047] = 30,
+        [10048] = 50,
+        [10050] = 116,
+        [10051] = 124,
+        [10052] = 111,
+        [10053] = 127,
+        [10054] = 122,
+        [10055] = 123,
+        [10056] = 106,
+        [13856] = 149,
+        [13857] = 153,
+        [13858] = 152,
+        [13860] = 157,
+        [13863] = 169,
+        [13864] = 173,
+        [13865] = 177,
+        [13866] = 185,
+        [13867] = 221,
+        [13868] = 147,
+        [13869] = 148,
+        [13870] = 155,
+        [13871] = 172,
+        [14042] = 150,
+        [14043] = 160,
+        [14044] = 164,
+        [14045] = 171,
+        [14046] = 151,
+        [14048] = 136,
+        [14100] = 159,
+        [14101] = 158,
+        [14103] = 162,
+        [14104] = 179,
+        [14106] = 197,
+        [14107] = 167,
+        [14108] = 175,
+        [14111] = 180,
+        [14112] = 198,
+        [14128] = 230,
+        [14130] = 231,
+        [14132] = 170,
+        [14134] = 165,
+        [14136] = 176,
+        [14137] = 183,
+        [14138] = 217,
+        [14139] = 216,
+        [14140] = 213,
+        [14141] = 168,
+        [14142] = 161,
+        [14143] = 156,
+        [14144] = 181,
+        [14146] = 209,
+        [14152] = 219,
+        [14153] = 220,
+        [14154] = 229,
+        [14155] = 212,
+        [14156] = 193,
+        [14342] = 143,
+        [15802] = 182,
+        [16979] = 199,
+        [16980] = 201,
+        [17723] = 92,
+        [18263] = 203,
+        [18405] = 187,
+        [18407] = 196,
+        [18408] = 210,
+        [18409] = 214,
+        [18413] = 194,
+        [18486] = 215,
+        [19047] = 184,
+        [19050] = 211,
+        [19056] = 178,
+        [19059] = 186,
+        [19156] = 202,
+        [19165] = 200,
+        [19682] = 191,
+        [19683] = 190,
+        [19684] = 189,
+        [20537] = 223,
+        [20538] = 224,
+        [20539] = 222,
+        [21154] = 139,
+        [21340] = 154,
+        [21341] = 174,
+        [21342] = 195,
+        [21542] = 140,
+        [21840] = 192,
+        [21841] = 234,
+        [21842] = 236,
+        [21843] = 242,
+        [21844] = 245,
+        [21845] = 255,
+        [21846] = 263,
+        [21847] = 277,
+        [21848] = 306,
+        [21849] = 233,
+        [21850] = 232,
+        [21851] = 235,
+        [21852] = 237,
+        [21853] = 239,
+        [21854] = 244,
+        [21855] = 246,
+        [21858] = 305,
+        [21859] = 243,
+        [21860] = 254,
+        [21861] = 266,
+        [21862] = 267,
+        [21863] = 262,
+        [21864] = 276,
+        [21865] = 300,
+        [21866] = 247,
+        [21867] = 264,
+        [21868] = 282,
+        [21869] = 260,
+        [21870] = 269,
+        [21871] = 292,
+        [21872] = 291,
+        [21873] = 261,
+        [21874] = 273,
+        [21875] = 298,
+        [21876] = 297,
+        [22246] = 115,
+        [22248] = 166,
+        [22249] = 188,
+        [22251] = 163,
+        [22252] = 225,
+        [22652] = 207,
+        [22654] = 206,
+        [22655] = 208,
+        [22658] = 205,
+        [22660] = 204,
+        [22756] = 228,
+        [22757] = 226,
+        [22758] = 227,
+        [24249] = 258,
+        [24250] = 249,
+        [24251] = 248,
+        [24252] = 252,
+        [24253] = 251,
+        [24254] = 259,
+        [24255] = 280,
+        [24256] = 270,
+        [24257] = 268,
+        [24258] = 274,
+        [24259] = 281,
+        [24260] = 272,
+        [24261] = 312,
+        [24262] = 308,
+        [24263] = 285,
+        [24264] = 311,
+        [24266] = 307,
+        [24267] = 284,
+        [24268] = 218,
+        [24270] = 241,
+        [24271] = 257,
+        [24272] = 256,
+        [24273] = 238,
+        [24274] = 299,
+        [24275] = 240,
+        [24276] = 293,
+        [30035] = 289,
+        [30036] = 287,
+        [30037] = 288,
+        [30038] = 286,
+        [30831] = 250,
+        [30837] = 253,
+        [30838] = 265,
+        [30839] = 283,
+        [32389] = 303,
+        [32390] = 302,
+        [32391] = 304,
+        [32392] = 301,
+        [32420] = 296,
+        [32584] = 310,
+        [32585] = 309,
+        [32586] = 290,
+        [32587] = 294,
+        [34085] = 144,
+        [34087] = 141,
+        [34364] = 279,
+        [34365] = 275,
+        [34366] = 278,
+        [34367] = 271,
+        [38225] = 295,
+        [38277] = 142,
+        [38278] = 133,
+      },
+      skillIndex = {
+        bucketSize = 5,
+        buckets = {
+          [0] = { 2, 3, 4, 5, 6 },
+          [1] = { 2, 3, 4, 5, 6 },
+          [2] = { 2, 3, 4, 5, 6, 7 },
+          [3] = { 2, 3, 4, 5, 6, 7, 8 },
+          [4] = { 2, 3, 4, 5, 6, 7, 8, 9 },
+          [5] = { 2, 3, 4, 5, 6, 7, 8, 9 },
+          [6] = { 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12 },
+          [7] = { 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13 },
+          [8] = { 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17 },
+          [9] = { 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 },
+          [10] = { 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18 },
+          [11] = { 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20 },
+          [12] = { 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22 },
+          [13] = { 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23 },
+          [14] = { 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28 },
+          [15] = { 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31 },
+          [16] = { 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33 },
+          [17] = { 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35 },
+          [18] = { 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36 },
+          [19] = { 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39 },
+          [20] = { 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42 },
+          [21] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43 },
+          [22] = { 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47 },
+          [23] = { 21, 22, 23, 24, 25, 26, 27, 28, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49 },
+          [24] = { 23, 24, 25, 26, 27, 28, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53 },
+          [25] = { 24, 25, 26, 27, 28, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57 },
+          [26] = { 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58 },
+          [27] = { 32, 33, 34, 35, 36, 37, 38, 39, 40, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60 },
+          [28] = { 34, 35, 36, 37, 38, 39, 40, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61 },
+          [29] = { 36, 37, 38, 39, 40, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64 },
+          [30] = { 37, 38, 39, 40, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67 },
+          [31] = { 40, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 55, 56, 57, 58, 60, 61, 62, 63, 64, 65, 66, 67, 68 },
+          [32] = { 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 55, 56, 57, 58, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70 },
+          [33] = { 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 55, 56, 57, 58, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72 },
+          [34] = { 48, 49, 50, 51, 52, 53, 55, 56, 57, 58, 60, 61, 62, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75 },
+          [35] = { 50, 51, 52, 53, 55, 56, 57, 58, 60, 61, 62, 64, 65, 66, 67, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82 },
+          [36] = { 55, 56, 57, 60, 61, 62, 64, 65, 66, 67, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85 },
+          [37] = { 61, 62, 64, 65, 66, 67, 71, 72, 73, 74, 75, 76, 77, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89 },
+          [38] = { 62, 64, 65, 66, 67, 71, 72, 73, 75, 76, 77, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93 },
+          [39] = { 65, 66, 67, 71, 72, 73, 75, 76, 77, 79, 80, 81, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95 },
+          [40] = { 71, 72, 73, 75, 76, 77, 79, 80, 81, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98 },
+          [41] = { 71, 72, 73, 75, 76, 77, 79, 80, 81, 83, 84, 85, 86, 87, 88, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101 },
+          [42] = { 71, 72, 73, 75, 76, 77, 79, 80, 81, 83, 84, 85, 86, 87, 88, 90, 91, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104 },
+          [43] = { 73, 75, 76, 77, 79, 80, 81, 83, 84, 85, 86, 87, 88, 90, 91, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110 },
+          [44] = { 76, 77, 79, 80, 81, 83, 84, 85, 86, 87, 88, 90, 91, 93, 94, 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111 },
+          [45] = { 83, 84, 85, 86, 88, 90, 91, 93, 94, 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118 },
+          [46] = { 86, 88, 90, 91, 93, 94, 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 107, 108, 109, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122 },
+          [47] = { 90, 91, 93, 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 107, 108, 109, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127 },
+          [48] = { 95, 97, 98, 99, 100, 101, 102, 103, 104, 105, 107, 108, 109, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131 },
+          [49] = { 97, 98, 99, 100, 101, 102, 103, 104, 105, 107, 108, 109, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135 },
+          [50] = { 102, 103, 104, 105, 107, 108, 109, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 124, 125, 126, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146 },
+          [51] = { 105, 107, 108, 109, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 124, 125, 126, 128, 129, 130, 132, 133, 134, 135, 136, 137, 138, 139, 140, 142, 143, 145, 146, 147, 148, 149 },
+          [52] = { 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 124, 125, 126, 128, 129, 130, 132, 134, 137, 138, 139, 140, 142, 143, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154 },
+          [53] = { 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 124, 125, 126, 128, 129, 130, 132, 134, 137, 138, 139, 140, 142, 143, 145, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157 },
+          [54] = { 119, 120, 121, 124, 125, 126, 128, 129, 130, 132, 134, 137, 138, 139, 140, 142, 143, 145, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161 },
+          [55] = { 1, 124, 125, 126, 128, 129, 130, 132, 134, 137, 138, 139, 140, 142, 143, 145, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170 },
+          [56] = { 1, 128, 129, 130, 132, 134, 137, 138, 139, 140, 142, 143, 145, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173 },
+          [57] = { 1, 132, 134, 137, 139, 140, 142, 143, 145, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177 },
+          [58] = { 1, 137, 139, 140, 142, 143, 145, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184 },
+          [59] = { 143, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185 },
+          [60] = { 143, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231 },
+          [61] = { 143, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231 },
+          [62] = { 143, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233 },
+          [63] = { 143, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234 },
+          [64] = { 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235 },
+          [65] = { 174, 175, 176, 177, 178, 179, 180, 181, 183, 184, 185, 186, 187, 188, 189, 190, 191, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237 },
+          [66] = { 178, 179, 180, 181, 183, 184, 185, 186, 187, 188, 189, 190, 191, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 234, 235, 236, 237 },
+          [67] = { 185, 186, 187, 188, 189, 190, 191, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 234, 235, 236, 237, 238, 239, 240 },
+          [68] = { 186, 187, 188, 189, 190, 191, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 237, 238, 239, 240, 241, 242, 243, 244 },
+          [69] = { 203, 238, 239, 240, 241, 242, 243, 244, 245, 246 },
+          [70] = { 238, 239, 240, 241, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259 },
+          [71] = { 241, 243, 244, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263 },
+          [72] = { 246, 247, 248, 249, 250, 251, 252, 253, 254, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267 },
+          [73] = { 247, 248, 249, 250, 251, 252, 253, 254, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281 },
+          [74] = { 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283 },
+          [75] = { 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312 },
+          [76] = { 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312 },
+          [77] = { 271, 275, 278, 279, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312 },
+          [78] = { 271, 275, 278, 279, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312 },
+          [79] = { 271, 275, 278, 279 },
+          [80] = { 271, 275, 278, 279 },
+          [81] = { 271, 275, 278, 279 },
+        },
+      },
     },
   },
   smelts = {
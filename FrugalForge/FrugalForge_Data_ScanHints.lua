@@ -0,0 +1,6 @@
+-- Empty stub: no scan hints have been generated yet, so every item is scanned on every run.
+-- Replace it with the output of tools/datapacks/scan_priority.py run over scan exports.
+FrugalForgeScanHints = {
+  items = {
+  },
+}
@@ -3,7 +3,10 @@ import json
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from cache_index import CacheIndex, load_cache_index
+from page_scan import PageBuffer, decode_span, open_page
 
 
 @dataclass(frozen=True)
@@ -59,81 +62,72 @@ def _parse_duration_to_seconds(text: str) -> Optional[int]:
     return int(round(total))
 
 
-def _extract_cooldown_cell(html: str) -> Optional[str]:
+_COOLDOWN_CELL = re.compile(rb"<th>\s*Cooldown\s*</th>\s*<td[^>]*>(.*?)</td>", re.IGNORECASE | re.DOTALL)
+_CREATES_ITEM = re.compile(rb'"creates"\s*:\s*\[\s*(\d+)\s*,')
+_ITEM_LINK = re.compile(rb"/item=(\d+)")
+
+
+def _extract_cooldown_cell(html: PageBuffer) -> Optional[str]:
     # Examples:
     # <tr><th>Cooldown</th><td><span class="q0">n/a</span></td></tr>
     # <tr><th>Cooldown</th><td>4 days</td></tr>
-    m = re.search(r"<th>\s*Cooldown\s*</th>\s*<td[^>]*>(.*?)</td>", html, flags=re.IGNORECASE | re.DOTALL)
+    m = _COOLDOWN_CELL.search(html)
     if not m:
         return None
-    return m.group(1)
+    return decode_span(html, m.start(1), m.end(1))
 
 
-def _extract_creates_item_id(html: str) -> Optional[int]:
+def _extract_creates_item_id(html: PageBuffer) -> Optional[int]:
     # Wowhead embeds spell data like: "creates":[2996,1,1]
-    m = re.search(r'"creates"\s*:\s*\[\s*(\d+)\s*,', html)
+    m = _CREATES_ITEM.search(html)
     if m:
         return int(m.group(1))
 
     # Fallback: Create Item table contains /item=NNN links.
-    m = re.search(r"/item=(\d+)", html)
+    m = _ITEM_LINK.search(html)
     if m:
         return int(m.group(1))
 
     return None
 
 
-def _iter_spell_pages(cache_roots: Iterable[Path]) -> Iterator[Tuple[int, Path]]:
-    patterns = [
-        re.compile(r"^spell_(\d+)\.html$", re.IGNORECASE),
-        re.compile(r"^wowhead_spell_(\d+)\.html$", re.IGNORECASE),
-    ]
-
-    seen: set[Path] = set()
-    for root in cache_roots:
-        if not root.exists() or not root.is_dir():
-            continue
-        for path in root.glob("*.html"):
-            if path in seen:
-                continue
-            seen.add(path)
-
-            for pat in patterns:
-                m = pat.match(path.name)
-                if m:
-                    yield int(m.group(1)), path
-                    break
-
-
-def _load_spell_cooldowns(cache_roots: List[Path]) -> List[SpellCooldownInfo]:
-    out: List[SpellCooldownInfo] = []
+def _iter_spell_pages(index: CacheIndex, cache_roots: List[Path]) -> Iterator[Tuple[int, Path]]:
+    for entry in index.pages("spell", cache_roots):
+        yield entry.entity_id, entry.path
 
-    for spell_id, path in _iter_spell_pages(cache_roots):
-        try:
-            html = path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
 
+def _read_spell_cooldown(spell_id: int, path: Path) -> Optional[SpellCooldownInfo]:
+    with open_page(path) as html:
         cooldown_cell = _extract_cooldown_cell(html)
         if cooldown_cell is None:
-            continue
+            return None
 
         cooldown_seconds = _parse_duration_to_seconds(cooldown_cell)
         if not cooldown_seconds or cooldown_seconds <= 0:
-            continue
+            return None
 
         creates_item_id = _extract_creates_item_id(html)
         if not creates_item_id or creates_item_id <= 0:
-            continue
+            return None
 
-        out.append(
-            SpellCooldownInfo(
-                spell_id=spell_id,
-                creates_item_id=creates_item_id,
-                cooldown_seconds=cooldown_seconds,
-                source_path=path,
-            )
-        )
+    return SpellCooldownInfo(
+        spell_id=spell_id,
+        creates_item_id=creates_item_id,
+        cooldown_seconds=cooldown_seconds,
+        source_path=path,
+    )
+
+
+def _load_spell_cooldowns(index: CacheIndex, cache_roots: List[Path]) -> List[SpellCooldownInfo]:
+    out: List[SpellCooldownInfo] = []
+
+    for spell_id, path in _iter_spell_pages(index, cache_roots):
+        try:
+            info = _read_spell_cooldown(spell_id, path)
+        except OSError:
+            continue
+        if info is not None:
+            out.append(info)
 
     return out
 
@@ -179,6 +173,44 @@ def _backfill_profession_file(path: Path, cooldown_by_item_id: Dict[int, int], *
     return updated, skipped
 
 
+@dataclass(frozen=True)
+class CooldownMap:
+    pages_loaded: int
+    cooldown_by_item_id: Dict[int, int]
+    collisions: Dict[int, List[SpellCooldownInfo]]
+
+
+def load_cooldown_map(cache_root: Path, index: Optional[CacheIndex] = None) -> CooldownMap:
+    cache_roots = [
+        cache_root / "wowhead",
+        cache_root,
+    ]
+
+    if index is None:
+        index = load_cache_index(cache_root)
+    infos = _load_spell_cooldowns(index, cache_roots)
+
+    cooldown_by_item_id: Dict[int, int] = {}
+    collisions: Dict[int, List[SpellCooldownInfo]] = {}
+    for info in infos:
+        if info.creates_item_id in cooldown_by_item_id and cooldown_by_item_id[info.creates_item_id] != info.cooldown_seconds:
+            collisions.setdefault(info.creates_item_id, []).append(info)
+            continue
+        cooldown_by_item_id[info.creates_item_id] = info.cooldown_seconds
+
+    return CooldownMap(pages_loaded=len(infos), cooldown_by_item_id=cooldown_by_item_id, collisions=collisions)
+
+
+def backfill_professions(professions_dir: Path, cooldown_by_item_id: Dict[int, int], *, overwrite: bool) -> Tuple[int, int]:
+    updated_total = 0
+    skipped_total = 0
+    for profession_file in sorted(professions_dir.glob("*.json")):
+        updated, skipped = _backfill_profession_file(profession_file, cooldown_by_item_id, overwrite=overwrite)
+        updated_total += updated
+        skipped_total += skipped
+    return updated_total, skipped_total
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Backfill recipe cooldownSeconds by parsing cached Wowhead spell pages under .wago-cache."
@@ -212,32 +244,18 @@ def main() -> int:
     if not professions_dir.exists():
         raise SystemExit(f"Professions folder not found: {professions_dir}")
 
-    cache_roots = [
-        args.cache_root / "wowhead",
-        args.cache_root,
-    ]
-
-    infos = _load_spell_cooldowns(cache_roots)
-
-    cooldown_by_item_id: Dict[int, int] = {}
-    collisions: Dict[int, List[SpellCooldownInfo]] = {}
-    for info in infos:
-        if info.creates_item_id in cooldown_by_item_id and cooldown_by_item_id[info.creates_item_id] != info.cooldown_seconds:
-            collisions.setdefault(info.creates_item_id, []).append(info)
-            continue
-        cooldown_by_item_id[info.creates_item_id] = info.cooldown_seconds
-
-    updated_total = 0
-    skipped_total = 0
-    for profession_file in sorted(professions_dir.glob("*.json")):
-        updated, skipped = _backfill_profession_file(profession_file, cooldown_by_item_id, overwrite=args.overwrite)
-        updated_total += updated
-        skipped_total += skipped
+    cooldowns = load_cooldown_map(args.cache_root)
+    updated_total, skipped_total = backfill_professions(
+        professions_dir, cooldowns.cooldown_by_item_id, overwrite=args.overwrite
+    )
 
-    print(f"Loaded {len(infos)} cooldown spell pages.")
-    print(f"Cooldown items mapped: {len(cooldown_by_item_id)}")
-    if collisions:
-        print(f"WARNING: {len(collisions)} itemId collisions with differing cooldowns (kept first): {sorted(collisions.keys())[:10]}")
+    print(f"Loaded {cooldowns.pages_loaded} cooldown spell pages.")
+    print(f"Cooldown items mapped: {len(cooldowns.cooldown_by_item_id)}")
+    if cooldowns.collisions:
+        print(
+            f"WARNING: {len(cooldowns.collisions)} itemId collisions with differing cooldowns (kept first): "
+            f"{sorted(cooldowns.collisions.keys())[:10]}"
+        )
     print(f"Updated {updated_total} recipes with cooldownSeconds.")
     if not args.overwrite:
         print(f"Skipped {skipped_total} recipes that already had cooldownSeconds.")
@@ -246,4 +264,3 @@ def main() -> int:
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
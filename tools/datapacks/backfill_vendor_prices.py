@@ -1,17 +1,35 @@
 import argparse
+import hashlib
 import json
 import re
 import time
 import urllib.request
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from cache_index import page_name
+from page_scan import PageBuffer, decode_span, open_page, read_json_span
+from shared_cache import rewrite_text_in_place, write_text_atomic
+
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
+VERDICT_INDEX_VERSION = 1
+DEFAULT_VERDICT_INDEX_NAME = "vendor-verdicts.json"
+
+
+@dataclass(frozen=True)
+class VendorVerdict:
+    is_vendor: bool
+    lowest_unlimited_cost: Optional[int]
+    source_hash: str
+    checked_at: str
+
 
 def _http_get_text(url: str, *, user_agent: str, timeout_seconds: int = 45) -> str:
     req = urllib.request.Request(url)
@@ -23,64 +41,22 @@ def _http_get_text(url: str, *, user_agent: str, timeout_seconds: int = 45) -> s
         return resp.read().decode("utf-8", errors="replace")
 
 
-def _find_matching_bracket(text: str, start_index: int, open_char: str, close_char: str) -> int:
-    if text[start_index] != open_char:
-        raise ValueError(f"Expected '{open_char}' at index {start_index}")
-
-    depth = 0
-    in_string = False
-    escape = False
-
-    for idx in range(start_index, len(text)):
-        ch = text[idx]
-
-        if in_string:
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
-                continue
-            if ch == '"':
-                in_string = False
-            continue
-
-        if ch == '"':
-            in_string = True
-            continue
-
-        if ch == open_char:
-            depth += 1
-            continue
-        if ch == close_char:
-            depth -= 1
-            if depth == 0:
-                return idx
-
-    raise ValueError(f"No matching '{close_char}' found for '{open_char}' at {start_index}")
-
-
-def _extract_sold_by_listview_data(html: str) -> Optional[List[dict]]:
-    idx = html.find("id: 'sold-by'")
+def _extract_sold_by_listview_data(html: PageBuffer) -> Optional[List[dict]]:
+    idx = html.find(b"id: 'sold-by'")
     if idx < 0:
-        idx = html.find('id: "sold-by"')
+        idx = html.find(b'id: "sold-by"')
     if idx < 0:
         return None
 
-    data_idx = html.find("data:", idx)
+    data_idx = html.find(b"data:", idx)
     if data_idx < 0:
         return None
 
-    array_start = html.find("[", data_idx)
+    array_start = html.find(b"[", data_idx)
     if array_start < 0:
         return None
 
-    array_end = _find_matching_bracket(html, array_start, "[", "]")
-    raw = html[array_start : array_end + 1]
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        return None
+    data, _ = read_json_span(html, array_start, b"[", b"]")
     if not isinstance(data, list):
         return None
     return [x for x in data if isinstance(x, dict)]
@@ -121,37 +97,42 @@ def _write_items(path: Path, items: List[dict]) -> None:
     path.write_text(json.dumps(items_sorted, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
 
-def _load_item_cache(cache_dir: Path, item_id: int, *, user_agent: str, request_delay_seconds: float) -> str:
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_path = cache_dir / f"wowhead_tbc_item_{item_id}.html"
+def _item_page_paths(cache_dir: Path, item_id: int) -> Tuple[Path, Path]:
+    return (
+        cache_dir / page_name("item-xml", item_id),
+        cache_dir / page_name("item-html", item_id),
+    )
+
+
+def _ensure_cached_page(cache_path: Path, url: str, *, user_agent: str, request_delay_seconds: float) -> Path:
     if cache_path.exists():
-        return cache_path.read_text(encoding="utf-8", errors="replace")
-    url = f"https://www.wowhead.com/tbc/item={item_id}"
-    html = _http_get_text(url, user_agent=user_agent)
-    cache_path.write_text(html, encoding="utf-8")
+        return cache_path
+    write_text_atomic(cache_path, _http_get_text(url, user_agent=user_agent))
     if request_delay_seconds > 0:
         time.sleep(request_delay_seconds)
-    return html
+    return cache_path
 
 
-def _load_item_xml_cache(cache_dir: Path, item_id: int, *, user_agent: str, request_delay_seconds: float) -> str:
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_path = cache_dir / f"wowhead_tbc_item_{item_id}.xml"
-    if cache_path.exists():
-        return cache_path.read_text(encoding="utf-8", errors="replace")
+def _load_item_cache(cache_dir: Path, item_id: int, *, user_agent: str, request_delay_seconds: float) -> Path:
+    _, cache_path = _item_page_paths(cache_dir, item_id)
+    url = f"https://www.wowhead.com/tbc/item={item_id}"
+    return _ensure_cached_page(cache_path, url, user_agent=user_agent, request_delay_seconds=request_delay_seconds)
+
+
+def _load_item_xml_cache(cache_dir: Path, item_id: int, *, user_agent: str, request_delay_seconds: float) -> Path:
+    cache_path, _ = _item_page_paths(cache_dir, item_id)
     url = f"https://www.wowhead.com/tbc/item={item_id}?xml"
-    xml = _http_get_text(url, user_agent=user_agent)
-    cache_path.write_text(xml, encoding="utf-8")
-    if request_delay_seconds > 0:
-        time.sleep(request_delay_seconds)
-    return xml
+    return _ensure_cached_page(cache_path, url, user_agent=user_agent, request_delay_seconds=request_delay_seconds)
+
 
+_XML_JSON_PAYLOAD = re.compile(rb"<json><!\[CDATA\[(.*?)\]\]></json>")
 
-def _is_vendor_item_from_xml(xml: str) -> bool:
-    match = re.search(r"<json><!\[CDATA\[(.*?)\]\]></json>", xml)
+
+def _is_vendor_item_from_xml(xml: PageBuffer) -> bool:
+    match = _XML_JSON_PAYLOAD.search(xml)
     if not match:
         return False
-    payload = match.group(1).strip()
+    payload = decode_span(xml, match.start(1), match.end(1)).strip()
     if not payload:
         return False
     try:
@@ -162,18 +143,108 @@ def _is_vendor_item_from_xml(xml: str) -> bool:
     return isinstance(source, list) and 5 in source
 
 
+def _page_stat(path: Path) -> Optional[Tuple[int, int]]:
+    # Stat the page itself rather than trusting the cache index: the index only rescans
+    # directories whose mtime moved, so a page rewritten in place would keep a stale entry.
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _page_source_hash(cache_dir: Path, item_id: int) -> Optional[str]:
+    # Cached pages are write-once, so (size, mtime) is enough to notice a re-fetch
+    # without reading the page itself.
+    xml_path, html_path = _item_page_paths(cache_dir, item_id)
+    xml_stat = _page_stat(xml_path)
+    if xml_stat is None:
+        return None
+    parts = [f"xml:{xml_stat[0]}:{xml_stat[1]}"]
+    html_stat = _page_stat(html_path)
+    if html_stat is not None:
+        parts.append(f"html:{html_stat[0]}:{html_stat[1]}")
+    return hashlib.sha1("|".join(parts).encode("ascii")).hexdigest()[:16]
+
+
+def load_verdict_index(path: Path) -> Dict[int, VendorVerdict]:
+    if not path.exists():
+        return {}
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != VERDICT_INDEX_VERSION:
+        return {}
+    entries = raw.get("verdicts")
+    if not isinstance(entries, dict):
+        return {}
+
+    verdicts: Dict[int, VendorVerdict] = {}
+    for item_id_str, entry in entries.items():
+        if not isinstance(entry, list) or len(entry) != 4:
+            continue
+        try:
+            item_id = int(item_id_str)
+        except ValueError:
+            continue
+        is_vendor, cost, source_hash, checked_at = entry
+        if cost is not None and not isinstance(cost, int):
+            continue
+        verdicts[item_id] = VendorVerdict(
+            is_vendor=bool(is_vendor),
+            lowest_unlimited_cost=cost,
+            source_hash=str(source_hash),
+            checked_at=str(checked_at),
+        )
+    return verdicts
+
+
+def write_verdict_index(path: Path, verdicts: Dict[int, VendorVerdict]) -> None:
+    entries = {
+        str(item_id): [int(v.is_vendor), v.lowest_unlimited_cost, v.source_hash, v.checked_at]
+        for item_id, v in sorted(verdicts.items())
+    }
+    data = {"version": VERDICT_INDEX_VERSION, "verdicts": entries}
+    rewrite_text_in_place(path, json.dumps(data, separators=(",", ":")) + "\n")
+
+
+def _check_vendor_item(cache_dir: Path, item_id: int, *, user_agent: str, request_delay_seconds: float) -> VendorVerdict:
+    xml_path = _load_item_xml_cache(cache_dir, item_id, user_agent=user_agent, request_delay_seconds=request_delay_seconds)
+    with open_page(xml_path) as xml:
+        is_vendor = _is_vendor_item_from_xml(xml)
+
+    lowest: Optional[int] = None
+    if is_vendor:
+        html_path = _load_item_cache(cache_dir, item_id, user_agent=user_agent, request_delay_seconds=request_delay_seconds)
+        with open_page(html_path) as html:
+            sold_by = _extract_sold_by_listview_data(html)
+        costs = _extract_unlimited_vendor_money_costs(sold_by) if sold_by else []
+        if costs:
+            lowest = min(costs)
+
+    return VendorVerdict(
+        is_vendor=is_vendor,
+        lowest_unlimited_cost=lowest,
+        source_hash=_page_source_hash(cache_dir, item_id) or "",
+        checked_at=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    )
+
+
 def _backfill_vendor_prices(
     items: List[dict],
+    verdicts: Dict[int, VendorVerdict],
     *,
     cache_dir: Path,
     user_agent: str,
     request_delay_seconds: float,
     max_items: int,
-) -> Tuple[int, int, int]:
+) -> Tuple[int, int, int, int]:
     scanned = 0
     updated = 0
     skipped_existing = 0
     vendor_candidates = 0
+    index_hits = 0
 
     for item in items:
         if max_items > 0 and scanned >= max_items:
@@ -192,27 +263,50 @@ def _backfill_vendor_prices(
             skipped_existing += 1
             continue
 
-        xml = _load_item_xml_cache(cache_dir, item_id, user_agent=user_agent, request_delay_seconds=request_delay_seconds)
-        if not _is_vendor_item_from_xml(xml):
+        verdict = verdicts.get(item_id)
+        if verdict is not None and verdict.source_hash == _page_source_hash(cache_dir, item_id):
+            index_hits += 1
+        else:
+            verdict = _check_vendor_item(cache_dir, item_id, user_agent=user_agent, request_delay_seconds=request_delay_seconds)
+            verdicts[item_id] = verdict
+
+        if not verdict.is_vendor:
             continue
 
         vendor_candidates += 1
 
-        html = _load_item_cache(cache_dir, item_id, user_agent=user_agent, request_delay_seconds=request_delay_seconds)
-        sold_by = _extract_sold_by_listview_data(html)
-        if not sold_by:
-            continue
-        costs = _extract_unlimited_vendor_money_costs(sold_by)
-        if not costs:
+        if verdict.lowest_unlimited_cost is None:
             continue
 
-        item["vendorPriceCopper"] = min(costs)
+        item["vendorPriceCopper"] = verdict.lowest_unlimited_cost
         updated += 1
 
         if scanned % 100 == 0:
             print(f"Scanned {scanned} items; vendor candidates {vendor_candidates}; updated {updated}")
 
-    return scanned, updated, skipped_existing
+    return scanned, updated, skipped_existing, index_hits
+
+
+def backfill_items_file(
+    items_json: Path,
+    verdicts: Dict[int, VendorVerdict],
+    *,
+    cache_dir: Path,
+    user_agent: str = DEFAULT_USER_AGENT,
+    request_delay_seconds: float = 0.0,
+    max_items: int = 0,
+) -> Tuple[int, int, int, int]:
+    items = _load_items(items_json)
+    result = _backfill_vendor_prices(
+        items,
+        verdicts,
+        cache_dir=cache_dir,
+        user_agent=user_agent,
+        request_delay_seconds=request_delay_seconds,
+        max_items=max_items,
+    )
+    _write_items(items_json, items)
+    return result
 
 
 def main() -> int:
@@ -221,22 +315,37 @@ def main() -> int:
     )
     parser.add_argument("--items-json", type=Path, default=Path("data/Anniversary/items.json"))
     parser.add_argument("--cache-dir", type=Path, default=Path(".wago-cache") / "wowhead-items")
+    parser.add_argument(
+        "--verdict-index",
+        type=Path,
+        default=None,
+        help=f"Persisted per-item vendor verdicts (default: <cache-dir>/{DEFAULT_VERDICT_INDEX_NAME}).",
+    )
+    parser.add_argument(
+        "--refresh-verdicts",
+        action="store_true",
+        help="Ignore the persisted verdict index and re-parse every cached page.",
+    )
     parser.add_argument("--user-agent", default=DEFAULT_USER_AGENT)
     parser.add_argument("--request-delay-seconds", type=float, default=0.0)
     parser.add_argument("--max-items", type=int, default=0, help="0 means no limit")
     args = parser.parse_args()
 
-    items = _load_items(args.items_json)
-    scanned, updated, skipped_existing = _backfill_vendor_prices(
-        items,
+    verdict_index_path = args.verdict_index or (args.cache_dir / DEFAULT_VERDICT_INDEX_NAME)
+    verdicts = {} if args.refresh_verdicts else load_verdict_index(verdict_index_path)
+
+    scanned, updated, skipped_existing, index_hits = backfill_items_file(
+        args.items_json,
+        verdicts,
         cache_dir=args.cache_dir,
         user_agent=args.user_agent,
         request_delay_seconds=args.request_delay_seconds,
         max_items=args.max_items,
     )
-    _write_items(args.items_json, items)
+    write_verdict_index(verdict_index_path, verdicts)
 
     print(f"Scanned {scanned} items")
+    print(f"Answered {index_hits} items from {verdict_index_path}")
     print(f"Updated {updated} items with vendorPriceCopper")
     print(f"Skipped {skipped_existing} items (already had vendorPriceCopper)")
     return 0
@@ -0,0 +1,122 @@
+import argparse
+import multiprocessing
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, List, Optional
+
+from backfill_cooldown_seconds import _extract_cooldown_cell, _extract_creates_item_id, _iter_spell_pages
+from backfill_vendor_prices import _extract_sold_by_listview_data, _is_vendor_item_from_xml
+from cache_index import CacheIndex, load_cache_index
+from page_scan import PageBuffer, open_page
+
+
+class _ReadTextPage:
+    """Legacy reader: decode the whole page to str, then hand the extractors an encoded copy."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def __enter__(self) -> PageBuffer:
+        return self._path.read_text(encoding="utf-8", errors="replace").encode("utf-8")
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+READERS: Dict[str, Callable[[Path], ContextManager[PageBuffer]]] = {
+    "mmap": open_page,
+    "read_text": _ReadTextPage,
+}
+
+
+def _cooldown_pass(index: CacheIndex, cache_root: Path, reader: Callable[[Path], ContextManager[PageBuffer]]) -> int:
+    found = 0
+    for _, path in _iter_spell_pages(index, [cache_root / "wowhead", cache_root]):
+        with reader(path) as html:
+            if _extract_cooldown_cell(html) is not None and _extract_creates_item_id(html):
+                found += 1
+    return found
+
+
+def _vendor_pass(index: CacheIndex, items_dir: Path, reader: Callable[[Path], ContextManager[PageBuffer]]) -> int:
+    found = 0
+    for entry in index.pages("item-xml", [items_dir]):
+        xml_path = entry.path
+        with reader(xml_path) as xml:
+            if not _is_vendor_item_from_xml(xml):
+                continue
+        html_path = xml_path.with_suffix(".html")
+        if not html_path.exists():
+            continue
+        with reader(html_path) as html:
+            if _extract_sold_by_listview_data(html):
+                found += 1
+    return found
+
+
+def _peak_rss_kb() -> Optional[int]:
+    try:
+        import resource  # POSIX only; Windows runs report no peak RSS.
+    except ImportError:
+        return None
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+
+
+def _run_pass(mode: str, cache_root: Path, items_dir: Path, queue: "multiprocessing.Queue[dict]") -> None:
+    reader = READERS[mode]
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = load_cache_index(cache_root)
+    cooldowns = _cooldown_pass(index, cache_root, reader)
+    vendors = _vendor_pass(index, items_dir, reader)
+    elapsed = time.perf_counter() - started
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    queue.put(
+        {
+            "mode": mode,
+            "seconds": elapsed,
+            "cooldowns": cooldowns,
+            "vendors": vendors,
+            "traced_peak_kb": traced_peak // 1024,
+            "peak_rss_kb": _peak_rss_kb(),
+        }
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure time and peak memory of a full cooldown + vendor page pass over the Wowhead cache."
+    )
+    parser.add_argument("--cache-root", type=Path, default=Path(".wago-cache"))
+    parser.add_argument("--items-dir", type=Path, default=None, help="Default: <cache-root>/wowhead-items (must be under --cache-root)")
+    parser.add_argument("--modes", nargs="+", choices=sorted(READERS), default=["read_text", "mmap"])
+    args = parser.parse_args()
+
+    items_dir = args.items_dir or (args.cache_root / "wowhead-items")
+
+    # Each mode runs in a fresh interpreter so peak RSS is not shared between passes.
+    ctx = multiprocessing.get_context("spawn")
+    results: List[dict] = []
+    for mode in args.modes:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_pass, args=(mode, args.cache_root, items_dir, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+
+    print(f"{'mode':<10} {'seconds':>8} {'peak RSS KB':>12} {'traced peak KB':>15} {'cooldowns':>10} {'vendors':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['seconds']:>8.2f} {'n/a' if r['peak_rss_kb'] is None else r['peak_rss_kb']:>12} "
+            f"{r['traced_peak_kb']:>15} "
+            f"{r['cooldowns']:>10} {r['vendors']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
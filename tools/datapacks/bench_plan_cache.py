@@ -0,0 +1,242 @@
+import argparse
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+try:
+    from lupa import lua51
+except ImportError:  # optional; the benchmark cannot run without a Lua 5.1
+    lua51 = None
+
+# Enough of the WoW API for FrugalForge.lua to load and plan without its UI: ADDON_LOADED
+# never fires, so no frames are built and updateUi() returns early. The character knows
+# the profession at BenchSkill; every item is cached client-side so plans get item links.
+_WOW_STUBS = """
+date = os.date
+time = os.time
+DEFAULT_CHAT_FRAME = { AddMessage = function() end }
+SlashCmdList = {}
+UIParent = {}
+local function newFrame()
+  local frame = {}
+  setmetatable(frame, { __index = function() return function() end end })
+  return frame
+end
+function CreateFrame() return newFrame() end
+C_Timer = { After = function() end }
+function GetRealmName() return "Bench Realm" end
+function UnitName() return "Benchcrafter" end
+function UnitFactionGroup() return "Horde" end
+function GetItemCount() return 0 end
+function GetItemInfo(itemId)
+  return "item " .. itemId, "|cffffffff|Hitem:" .. itemId .. "::::::::70:::::|h[item " .. itemId .. "]|h|r"
+end
+function GetSpellInfo() return nil end
+function GetNumSkillLines() return 1 end
+function GetSkillLineInfo() return BenchProfession, false, nil, BenchSkill, nil, nil, 375 end
+"""
+
+# Appended to the chunk so the benchmark can call the file-local generatePlan.
+_EXPOSE_GENERATE_PLAN = "\n_G.FrugalForgeBench_GeneratePlan = generatePlan\n"
+
+_PLAN_TEXT_FIELDS = ("stepsText", "shoppingText", "summaryText")
+
+
+def _toc_files(addon_dir: Path) -> List[Path]:
+    toc = next(addon_dir.glob("*.toc"), None)
+    if toc is None:
+        raise SystemExit(f"No .toc file in {addon_dir}")
+    files = []
+    for line in toc.read_text(encoding="utf-8-sig").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            files.append(addon_dir / line)
+    return files
+
+
+class AddonPlanner:
+    """The addon's own generatePlan, run in Lua 5.1 (lupa) against synthetic saved state."""
+
+    def __init__(self, addon_dir: Path, profession: str, skill: int) -> None:
+        self.lua = lua51.LuaRuntime(unpack_returned_tuples=True)
+        self.g = self.lua.globals()
+        self.lua.execute(_WOW_STUBS)
+        self.g.BenchProfession = profession
+        self.g.BenchSkill = skill
+        for path in _toc_files(addon_dir):
+            # The scanner needs the auction house; the planner falls back to FrugalScanDB.
+            if path.name == "FrugalForgeScan.lua":
+                continue
+            text = path.read_text(encoding="utf-8-sig")
+            if path.name == "FrugalForge.lua":
+                text += _EXPOSE_GENERATE_PLAN
+            self.lua.execute(text, "FrugalForge")
+        self._generate_plan: Callable[[], None] = self.g.FrugalForgeBench_GeneratePlan
+
+    def table(self, value: object) -> object:
+        return self.lua.table_from(value, recursive=True)
+
+    def plan(self) -> float:
+        started = time.perf_counter()
+        self._generate_plan()
+        return time.perf_counter() - started
+
+    def plan_text(self) -> Tuple[str, ...]:
+        plan = self.g.FrugalForgeDB.lastPlan
+        return tuple(str(plan[field]) for field in _PLAN_TEXT_FIELDS)
+
+
+def _recipes(planner: AddonPlanner, profession: str) -> List[dict]:
+    for prof in planner.g.FrugalForgeData_Anniversary.professions.values():
+        if str(prof.name).lower() == profession.lower():
+            return [
+                {"recipeId": r.recipeId, "reagents": [int(reg.itemId) for reg in r.reagents.values()]}
+                for r in prof.recipes.values()
+            ]
+    raise SystemExit(f"No {profession} in FrugalForgeData_Anniversary")
+
+
+def _seed_state(planner: AddonPlanner, profession: str, recipes: List[dict], seed: int, target_skill: int) -> List[int]:
+    """A snapshot pricing every reagent, an owned snapshot and built targets; returns the reagent ids."""
+    rng = random.Random(seed)
+    reagent_ids = sorted({item_id for r in recipes for item_id in r["reagents"]})
+    now = int(time.time())
+    prof = next(p for p in planner.g.FrugalForgeData_Anniversary.professions.values() if str(p.name).lower() == profession.lower())
+    planner.g.FrugalForgeDB = planner.table(
+        {"settings": {"selectedProfessionId": int(prof.professionId), "targetSkill": target_skill}}
+    )
+    db = planner.g.FrugalForgeDB
+    planner.g.FrugalScanDB = planner.table(
+        {
+            "lastSnapshot": {
+                "generatedAtEpochUtc": now,
+                "snapshotTimestampUtc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)),
+                "realmName": "Bench Realm",
+                "faction": "Horde",
+                "prices": [
+                    {"itemId": item_id, "minUnitBuyoutCopper": rng.randint(20, 40000), "totalQuantity": rng.randint(1, 400)}
+                    for item_id in reagent_ids
+                ],
+            }
+        }
+    )
+    owned = [{"itemId": item_id, "qty": rng.randint(1, 40)} for item_id in reagent_ids if rng.random() < 0.2]
+    db.lastOwnedSnapshot = planner.table({"generatedAtEpochUtc": now, "items": owned})
+    # With no saved targets the first plan builds them for selectedProfessionId, as in game.
+    planner.plan()
+    if not db.targets:
+        raise SystemExit(f"generatePlan built no targets: {list(db.debugLog.values()) if db.debugLog else ''}")
+    return reagent_ids
+
+
+def _bump_owned(planner: AddonPlanner, item_id: int, qty: int = 5) -> None:
+    items = planner.g.FrugalForgeDB.lastOwnedSnapshot["items"]
+    for it in items.values():
+        if int(it.itemId) == item_id:
+            it.qty = it.qty + qty
+            return
+    items[len(items) + 1] = planner.table({"itemId": item_id, "qty": qty})
+
+
+def _force_cold(planner: AddonPlanner) -> None:
+    # The plan cache keys on when targets were built; a new build time misses both tiers.
+    planner.g.FrugalForgeDB.targetsBuiltAtEpoch = planner.g.FrugalForgeDB.targetsBuiltAtEpoch + 1
+
+
+def _scenarios(planner: AddonPlanner, reagent_ids: List[int]) -> List[Tuple[str, Callable[[], None]]]:
+    """(name, change applied after a warm-up plan) for each replan that is timed."""
+    settings = planner.g.FrugalForgeDB.settings
+    reagent = reagent_ids[len(reagent_ids) // 2]
+    unread_item = max(reagent_ids) + 1
+
+    def unread_owned() -> None:
+        _bump_owned(planner, unread_item)
+
+    def reagent_ignoring_owned() -> None:
+        settings.ignoreOwnedSelection = True
+        _bump_owned(planner, reagent)
+
+    def owned_value_factor() -> None:
+        settings.ignoreOwnedSelection = True
+        settings.ownedValueFactor = 0.5 if settings.ownedValueFactor != 0.5 else 0.9
+
+    def reagent_owned_aware() -> None:
+        settings.ignoreOwnedSelection = False
+        _bump_owned(planner, reagent)
+
+    def new_snapshot() -> None:
+        snap = planner.g.FrugalScanDB.lastSnapshot
+        snap.generatedAtEpochUtc = snap.generatedAtEpochUtc + 1
+
+    return [
+        ("unchanged inputs", lambda: None),
+        ("owned: item the sim never read", unread_owned),
+        ("owned: reagent, ignoreOwnedSelection", reagent_ignoring_owned),
+        ("ownedValueFactor, ignoreOwnedSelection", owned_value_factor),
+        ("owned: reagent, owned-aware selection", reagent_owned_aware),
+        ("new snapshot", new_snapshot),
+    ]
+
+
+def _time_scenario(planner: AddonPlanner, change: Callable[[], None], repeat: int) -> Tuple[float, bool]:
+    """Median warm replan time after `change`, and whether every plan matched a cold plan."""
+    times: List[float] = []
+    same = True
+    for _ in range(repeat):
+        planner.plan()
+        change()
+        times.append(planner.plan())
+        warm = planner.plan_text()
+        _force_cold(planner)
+        planner.plan()
+        same = same and planner.plan_text() == warm
+    return statistics.median(times), same
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time FrugalForge.lua's generatePlan cold and warm (plan cache hits) in Lua 5.1 via lupa, "
+            "with stubbed WoW APIs and synthetic prices and owned items."
+        )
+    )
+    parser.add_argument("--addon-dir", type=Path, default=Path("FrugalForge"))
+    parser.add_argument("--profession", default="Tailoring")
+    parser.add_argument("--from-skill", type=int, default=1)
+    parser.add_argument("--to-skill", type=int, default=375)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if lua51 is None:
+        raise SystemExit("bench_plan_cache needs lupa (pip install lupa)")
+    if args.repeat <= 0:
+        raise SystemExit("--repeat must be > 0")
+
+    planner = AddonPlanner(args.addon_dir, args.profession, args.from_skill)
+    recipes = _recipes(planner, args.profession)
+    reagent_ids = _seed_state(planner, args.profession, recipes, args.seed, args.to_skill)
+
+    cold_times: List[float] = []
+    for _ in range(args.repeat):
+        _force_cold(planner)
+        cold_times.append(planner.plan())
+    cold = statistics.median(cold_times)
+    plan: Dict[str, object] = dict(zip(_PLAN_TEXT_FIELDS, planner.plan_text()))
+    if not str(plan["stepsText"]).strip():
+        raise SystemExit(f"generatePlan produced no steps: {plan['summaryText']}")
+
+    print(f"{args.profession}: {len(recipes)} recipes, skill {args.from_skill}-{args.to_skill}, median of {args.repeat}")
+    print(f"{'scenario':<42} {'ms':>9} {'speedup':>8} {'plan':>6}")
+    print(f"{'cold plan':<42} {cold * 1000:>9.2f} {1.0:>7.1f}x {'':>6}")
+    for name, change in _scenarios(planner, reagent_ids):
+        seconds, same = _time_scenario(planner, change, args.repeat)
+        speedup = cold / seconds if seconds > 0 else float("inf")
+        print(f"{name:<42} {seconds * 1000:>9.2f} {speedup:>7.1f}x {'same' if same else 'DIFF':>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
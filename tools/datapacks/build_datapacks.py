@@ -0,0 +1,216 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from backfill_cooldown_seconds import backfill_professions, load_cooldown_map
+from backfill_vendor_prices import (
+    DEFAULT_VERDICT_INDEX_NAME,
+    VendorVerdict,
+    backfill_items_file,
+    load_verdict_index,
+    write_verdict_index,
+)
+from cache_index import CacheIndex, load_cache_index
+from export_lua_data import DEFAULT_SKILL_BUCKET_SIZE, export_lua_data
+from export_tbc_tailoring import (
+    DEFAULT_USER_AGENT,
+    _slugify,
+    export_profession,
+    shared_skill_pack,
+    shared_wago_item_names,
+)
+from shared_cache import SharedCache
+
+
+@dataclass(frozen=True)
+class ProfessionSpec:
+    profession_id: int
+    name: str
+
+    @property
+    def slug(self) -> str:
+        return _slugify(self.name)
+
+    @property
+    def skill_url(self) -> str:
+        return f"https://www.wowhead.com/tbc/skill={self.profession_id}/{self.slug}"
+
+
+def _parse_profession(value: str) -> ProfessionSpec:
+    prof_id, sep, name = value.partition(":")
+    try:
+        profession_id = int(prof_id)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected <id>:<Name>, got {value!r}") from None
+    if not sep or not name.strip() or profession_id <= 0:
+        raise argparse.ArgumentTypeError(f"Expected <id>:<Name>, got {value!r}")
+    return ProfessionSpec(profession_id=profession_id, name=name.strip())
+
+
+# Set per worker process by _init_worker; a worker may build several versions in turn.
+_WORKER: dict = {}
+
+
+def _init_worker(
+    args: argparse.Namespace,
+    verdicts: Dict[int, VendorVerdict],
+    index: CacheIndex,
+    shared_values: Dict[str, object],
+) -> None:
+    _WORKER["args"] = args
+    _WORKER["shared"] = SharedCache(args.cache_root, shared_values)
+    _WORKER["verdicts"] = dict(verdicts)
+    _WORKER["base_verdicts"] = verdicts
+    _WORKER["index"] = index
+
+
+def _build_version_worker(version: str) -> Tuple[List[str], Dict[int, VendorVerdict]]:
+    """build_version in a worker; also returns the vendor verdicts it added or changed."""
+    verdicts: Dict[int, VendorVerdict] = _WORKER["verdicts"]
+    lines = build_version(version, _WORKER["args"], _WORKER["shared"], verdicts, _WORKER["index"])
+    base: Dict[int, VendorVerdict] = _WORKER["base_verdicts"]
+    return lines, {item_id: v for item_id, v in verdicts.items() if base.get(item_id) != v}
+
+
+def build_version(
+    version: str,
+    args: argparse.Namespace,
+    shared: SharedCache,
+    verdicts: Dict[int, VendorVerdict],
+    index: CacheIndex,
+) -> List[str]:
+    """Run the full pipeline for one data/<version> folder; returns summary lines."""
+    version_dir = args.data_root / version
+    professions_dir = version_dir / "professions"
+    items_json = version_dir / "items.json"
+    lines: List[str] = []
+
+    # Professions share items.json, so they run in order within a version.
+    for prof in args.profession:
+        recipes, items = export_profession(
+            profession_id=prof.profession_id,
+            profession_name=prof.name,
+            out_profession_json=professions_dir / f"{prof.slug}.json",
+            out_items_json=items_json,
+            cache_dir=args.cache_root,
+            user_agent=args.user_agent,
+            wowhead_skill_url=prof.skill_url,
+            shared=shared,
+            index=index,
+        )
+        lines.append(f"{prof.name}: {recipes} recipes ({items} items)")
+
+    if not args.skip_vendor_prices:
+        if items_json.exists():
+            _, updated, _, index_hits = backfill_items_file(
+                items_json,
+                verdicts,
+                cache_dir=args.cache_root / "wowhead-items",
+                user_agent=args.user_agent,
+                request_delay_seconds=args.request_delay_seconds,
+            )
+            lines.append(f"vendor prices: updated {updated} ({index_hits} answered from verdict index)")
+        else:
+            lines.append(f"vendor prices: skipped, {items_json} not found")
+
+    if not args.skip_cooldowns:
+        cooldowns = shared.get("spell-cooldowns", lambda: load_cooldown_map(args.cache_root, index))
+        updated, _ = backfill_professions(professions_dir, cooldowns.cooldown_by_item_id, overwrite=args.overwrite_cooldowns)
+        lines.append(f"cooldowns: updated {updated} recipes")
+
+    out_lua = args.addon_dir / f"FrugalForge_Data_{version}.lua"
+    profs, items, smelts = export_lua_data(version_dir, version, out_lua, bucket_size=args.skill_bucket_size)
+    lines.append(f"wrote {out_lua}: {profs} professions, {items} items, {smelts} smelts")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Build profession packs, items.json backfills and the addon Lua data for several game versions at once. "
+            "Versions build in parallel worker processes. Version-independent inputs (Wago tables, skill and spell "
+            "pages, vendor verdicts) are parsed once in the parent and shared with every worker."
+        )
+    )
+    parser.add_argument("--versions", nargs="+", default=["Anniversary"], help="Game version folders under data/.")
+    parser.add_argument("--data-root", type=Path, default=Path("data"))
+    parser.add_argument("--cache-root", type=Path, default=Path(".wago-cache"))
+    parser.add_argument("--addon-dir", type=Path, default=Path("FrugalForge"))
+    parser.add_argument(
+        "--profession",
+        type=_parse_profession,
+        action="append",
+        default=[],
+        help="Re-export a profession from its Wowhead skill page, as <id>:<Name> (repeatable, e.g. 197:Tailoring).",
+    )
+    parser.add_argument("--skip-vendor-prices", action="store_true")
+    parser.add_argument("--skip-cooldowns", action="store_true")
+    parser.add_argument("--overwrite-cooldowns", action="store_true")
+    parser.add_argument("--skill-bucket-size", type=int, default=DEFAULT_SKILL_BUCKET_SIZE)
+    parser.add_argument("--user-agent", default=DEFAULT_USER_AGENT)
+    parser.add_argument("--request-delay-seconds", type=float, default=0.0)
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (default: one per version).")
+    args = parser.parse_args()
+
+    if args.skill_bucket_size <= 0:
+        raise SystemExit("--skill-bucket-size must be > 0")
+
+    versions = list(dict.fromkeys(args.versions))
+    for version in versions:
+        if not (args.data_root / version).is_dir():
+            raise SystemExit(f"Version folder not found: {args.data_root / version}")
+
+    # One walk of the cache for every version; pages fetched during the build are
+    # picked up by the next run's refresh.
+    index = load_cache_index(args.cache_root)
+    verdict_index_path = args.cache_root / "wowhead-items" / DEFAULT_VERDICT_INDEX_NAME
+    verdicts = load_verdict_index(verdict_index_path)
+    # Parse the version-independent inputs here once; every worker starts with the values.
+    shared = SharedCache(args.cache_root)
+    for prof in args.profession:
+        shared_skill_pack(
+            shared,
+            profession_id=prof.profession_id,
+            profession_name=prof.name,
+            cache_dir=args.cache_root,
+            user_agent=args.user_agent,
+            wowhead_skill_url=prof.skill_url,
+            index=index,
+        )
+    if args.profession:
+        shared_wago_item_names(shared, args.cache_root, args.user_agent)
+    if not args.skip_cooldowns:
+        shared.get("spell-cooldowns", lambda: load_cooldown_map(args.cache_root, index))
+
+    # Page parsing and JSON work is CPU-bound, so versions build in processes rather than
+    # threads; each worker hands back the verdicts it changed for one merged write.
+    jobs = args.jobs if args.jobs > 0 else len(versions)
+    failed = 0
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(args, verdicts, index, shared.values()),
+    ) as pool:
+        futures = {version: pool.submit(_build_version_worker, version) for version in versions}
+        for version, future in futures.items():
+            try:
+                lines, changed = future.result()
+            except (Exception, SystemExit) as exc:
+                # Report and carry on, so the verdicts merged so far are still written.
+                failed += 1
+                print(f"[{version}] FAILED: {type(exc).__name__}: {exc}")
+                continue
+            verdicts.update(changed)
+            for line in lines:
+                print(f"[{version}] {line}")
+
+    if not args.skip_vendor_prices:
+        write_verdict_index(verdict_index_path, verdicts)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,243 @@
+import argparse
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+from shared_cache import rewrite_text_in_place
+
+CACHE_INDEX_VERSION = 1
+DEFAULT_CACHE_INDEX_NAME = "cache-index.json"
+
+# kind -> (file name written by the tools, file names recognized when indexing)
+_PAGE_KINDS: Dict[str, Tuple[str, Pattern[str]]] = {
+    "item-xml": ("wowhead_tbc_item_{}.xml", re.compile(r"^wowhead_tbc_item_(\d+)\.xml$", re.IGNORECASE)),
+    "item-html": ("wowhead_tbc_item_{}.html", re.compile(r"^wowhead_tbc_item_(\d+)\.html$", re.IGNORECASE)),
+    "skill": ("wowhead_tbc_skill_{}.html", re.compile(r"^wowhead_tbc_skill_(\d+)\.html$", re.IGNORECASE)),
+    "spell": ("spell_{}.html", re.compile(r"^(?:wowhead_)?spell_(\d+)\.html$", re.IGNORECASE)),
+}
+
+
+def page_name(kind: str, entity_id: int) -> str:
+    return _PAGE_KINDS[kind][0].format(entity_id)
+
+
+def _classify(name: str) -> Optional[Tuple[str, int]]:
+    for kind, (_, pattern) in _PAGE_KINDS.items():
+        m = pattern.match(name)
+        if m:
+            return kind, int(m.group(1))
+    return None
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    kind: str
+    entity_id: int
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+# (kind, entity id, file name, size, mtime_ns); entries stay raw tuples until queried so a
+# warm start over a large cache does not build a Path per file.
+_RawEntry = Tuple[str, int, str, int, int]
+
+
+@dataclass(frozen=True)
+class _DirRecord:
+    mtime_ns: int
+    subdirs: Tuple[str, ...]
+    files: Tuple[_RawEntry, ...]
+
+
+class CacheIndex:
+    """Persisted index of every cached page under a cache root (normally .wago-cache).
+
+    Tools write cache files atomically (write + rename), so any added, replaced or removed
+    page bumps its directory's mtime. refresh() therefore stats each directory and only
+    rescans the ones whose mtime changed; a warm start over a large cache costs one stat
+    per directory instead of one glob and regex match per file. A file rewritten in place
+    keeps its directory's mtime, so its recorded size and mtime can go stale; use the index
+    to find pages and stat a page directly when its current contents matter.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._dirs: Dict[str, _DirRecord] = {}
+        self._by_key: Optional[Dict[Tuple[str, int], List[Tuple[str, _RawEntry]]]] = None
+        self._by_kind: Optional[Dict[str, List[Tuple[str, _RawEntry]]]] = None
+        self.rescanned_dirs = 0
+
+    def _dir_path(self, rel: str) -> Path:
+        return self.root if rel == "." else self.root / rel
+
+    def _scan_dir(self, rel: str, mtime_ns: int) -> _DirRecord:
+        subdirs: List[str] = []
+        files: List[_RawEntry] = []
+        with os.scandir(self._dir_path(rel)) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name if rel == "." else f"{rel}/{entry.name}")
+                    continue
+                classified = _classify(entry.name)
+                if classified is None or not entry.is_file():
+                    continue
+                st = entry.stat()
+                files.append((classified[0], classified[1], entry.name, st.st_size, st.st_mtime_ns))
+        self.rescanned_dirs += 1
+        return _DirRecord(mtime_ns=mtime_ns, subdirs=tuple(sorted(subdirs)), files=tuple(files))
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the file system; returns True if anything changed."""
+        changed = False
+        dirs: Dict[str, _DirRecord] = {}
+        pending = ["."]
+        while pending:
+            rel = pending.pop()
+            try:
+                mtime_ns = self._dir_path(rel).stat().st_mtime_ns
+            except OSError:
+                continue
+            record = self._dirs.get(rel)
+            if record is None or record.mtime_ns != mtime_ns:
+                try:
+                    record = self._scan_dir(rel, mtime_ns)
+                except OSError:
+                    continue
+                changed = True
+            dirs[rel] = record
+            pending.extend(record.subdirs)
+
+        if dirs.keys() != self._dirs.keys():
+            changed = True
+        self._dirs = dirs
+        self._by_key = None
+        self._by_kind = None
+        return changed
+
+    def _lookups(self) -> Tuple[Dict[Tuple[str, int], List[Tuple[str, _RawEntry]]], Dict[str, List[Tuple[str, _RawEntry]]]]:
+        if self._by_key is None or self._by_kind is None:
+            by_key: Dict[Tuple[str, int], List[Tuple[str, _RawEntry]]] = {}
+            by_kind: Dict[str, List[Tuple[str, _RawEntry]]] = {}
+            for rel in sorted(self._dirs):
+                for raw in self._dirs[rel].files:
+                    by_key.setdefault((raw[0], raw[1]), []).append((rel, raw))
+                    by_kind.setdefault(raw[0], []).append((rel, raw))
+            for entries in by_kind.values():
+                entries.sort(key=lambda e: (e[1][1], e[0], e[1][2]))
+            self._by_key = by_key
+            self._by_kind = by_kind
+        return self._by_key, self._by_kind
+
+    def _entry(self, rel: str, raw: _RawEntry) -> CacheEntry:
+        kind, entity_id, name, size, mtime_ns = raw
+        return CacheEntry(kind, entity_id, self._dir_path(rel) / name, size, mtime_ns)
+
+    def _rel_for(self, directory: Path) -> Optional[str]:
+        for rel in self._dirs:
+            if self._dir_path(rel) == directory:
+                return rel
+        return None
+
+    def pages(self, kind: str, directories: Optional[List[Path]] = None) -> Iterator[CacheEntry]:
+        """Entries of one kind ordered by entity id.
+
+        With directories, only pages in those directories are returned, one directory after
+        another in the order given, so callers that keep the first page per id prefer the
+        earlier directories just as globbing them in turn did.
+        """
+        _, by_kind = self._lookups()
+        entries = by_kind.get(kind, [])
+        if directories is None:
+            for rel, raw in entries:
+                yield self._entry(rel, raw)
+            return
+        seen: set = set()
+        for directory in directories:
+            rel = self._rel_for(directory)
+            if rel is None or rel in seen:
+                continue
+            seen.add(rel)
+            for entry_rel, raw in entries:
+                if entry_rel == rel:
+                    yield self._entry(rel, raw)
+
+    def get(self, kind: str, entity_id: int, directory: Optional[Path] = None) -> Optional[CacheEntry]:
+        by_key, _ = self._lookups()
+        for rel, raw in by_key.get((kind, entity_id), []):
+            if directory is None or self._dir_path(rel) == directory:
+                return self._entry(rel, raw)
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(record.files) for record in self._dirs.values())
+
+    def to_json(self) -> dict:
+        dirs = {}
+        for rel, record in sorted(self._dirs.items()):
+            dirs[rel] = {"mtime": record.mtime_ns, "subdirs": list(record.subdirs), "files": record.files}
+        return {"version": CACHE_INDEX_VERSION, "dirs": dirs}
+
+    @classmethod
+    def from_json(cls, root: Path, raw: object) -> "CacheIndex":
+        index = cls(root)
+        if not isinstance(raw, dict) or raw.get("version") != CACHE_INDEX_VERSION:
+            return index
+        dirs = raw.get("dirs")
+        if not isinstance(dirs, dict):
+            return index
+        for rel, record in dirs.items():
+            try:
+                files = tuple((str(f[0]), int(f[1]), str(f[2]), int(f[3]), int(f[4])) for f in record["files"])
+                index._dirs[rel] = _DirRecord(
+                    mtime_ns=int(record["mtime"]),
+                    subdirs=tuple(str(s) for s in record["subdirs"]),
+                    files=files,
+                )
+            except (IndexError, KeyError, TypeError, ValueError):
+                continue
+        return index
+
+
+def _save(index: CacheIndex, index_path: Path) -> None:
+    rewrite_text_in_place(index_path, json.dumps(index.to_json(), separators=(",", ":")) + "\n")
+
+
+def load_cache_index(root: Path, index_path: Optional[Path] = None) -> CacheIndex:
+    """Load the persisted index for root, refresh it, and persist it again if it changed."""
+    index_path = index_path or (root / DEFAULT_CACHE_INDEX_NAME)
+    raw: object = None
+    if index_path.exists():
+        try:
+            raw = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            raw = None
+    index = CacheIndex.from_json(root, raw)
+    if index.refresh() and root.is_dir():
+        _save(index, index_path)
+        # Creating the index file bumps its directory's mtime; pick that up now so the
+        # next start is warm.
+        if index.refresh():
+            _save(index, index_path)
+    return index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build or refresh the shared index of cached pages under .wago-cache.")
+    parser.add_argument("--cache-root", type=Path, default=Path(".wago-cache"))
+    parser.add_argument("--index", type=Path, default=None, help=f"Default: <cache-root>/{DEFAULT_CACHE_INDEX_NAME}")
+    args = parser.parse_args()
+
+    index = load_cache_index(args.cache_root, args.index)
+    counts = {kind: sum(1 for _ in index.pages(kind)) for kind in _PAGE_KINDS}
+    print(f"Indexed {len(index)} pages under {args.cache_root} (rescanned {index.rescanned_dirs} directories)")
+    for kind, count in counts.items():
+        print(f"  {kind}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,207 @@
+import argparse
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from lua_values import LuaValue, load_lua_file, lua_array
+
+# Mirrors FindBagBrotherCharacters / WalkOwnedCounts / the owned index in FrugalForgeScan.lua.
+BAG_DB_GLOBALS = ("BrotherBags", "BagBrother", "BagnonDB", "BagnonDB2", "BagnonDB3")
+BAG_CONTAINER_IDS = list(range(0, 5))
+BANK_CONTAINER_IDS = [-1] + list(range(5, 11))
+
+Counts = Dict[int, int]
+
+# Recorded, anonymized SavedVariables pair the check runs against when no paths are given.
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "owned_index"
+FIXTURE_REALM = "Anonymous Realm"
+
+
+def _is_guild_like_key(key: object) -> bool:
+    return isinstance(key, str) and ("guild" in key.lower() or "vault" in key.lower())
+
+
+def _character_name(key: str) -> str:
+    m = re.match(r"^(.*?)\s-\s", key)
+    return m.group(1) if m and m.group(1) else key
+
+
+def normalize_realm_slug(realm_name: str) -> str:
+    s = realm_name.lower().replace("'", "")
+    s = re.sub(r"\s+", "-", s)
+    return re.sub(r"[^0-9A-Za-z\-]", "", s)
+
+
+def parse_item_ref(value: str) -> Tuple[Optional[int], int]:
+    m = re.search(r"item:(\d+)", value) or re.match(r"^(\d+)", value)
+    if not m or int(m.group(1)) <= 0:
+        return None, 0
+    qty = re.search(r";(\d+)$", value)
+    count = int(qty.group(1)) if qty else 1
+    return int(m.group(1)), max(count, 1)
+
+
+def walk_owned_counts(node: LuaValue, counts: Counts, wanted: Optional[Set[int]] = None) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if not _is_guild_like_key(key):
+                walk_owned_counts(value, counts, wanted)
+    elif isinstance(node, str):
+        item_id, qty = parse_item_ref(node)
+        if item_id is not None and (wanted is None or item_id in wanted):
+            counts[item_id] = counts.get(item_id, 0) + qty
+
+
+def find_characters(bag_globals: Dict[str, LuaValue], realm_name: str) -> List[Tuple[str, dict]]:
+    for source in BAG_DB_GLOBALS:
+        db = bag_globals.get(source)
+        if not isinstance(db, dict):
+            continue
+        roots: List[Tuple[str, dict]] = []
+        if source in ("BrotherBags", "BagBrother"):
+            realm = db.get(realm_name) or db.get(realm_name.lower()) or db.get(normalize_realm_slug(realm_name))
+            if isinstance(realm, dict):
+                for key, node in realm.items():
+                    if isinstance(node, dict) and not _is_guild_like_key(key):
+                        roots.append((_character_name(str(key)), node))
+        else:
+            characters = db.get("characters")
+            suffix = f" - {realm_name}"
+            if isinstance(characters, dict):
+                for key, node in characters.items():
+                    if isinstance(key, str) and isinstance(node, dict) and key.endswith(suffix) and not _is_guild_like_key(key):
+                        roots.append((_character_name(key), node))
+        return roots
+    return []
+
+
+def container_counts(node: dict, bag_ids: List[int]) -> Counts:
+    counts: Counts = {}
+    for bag in bag_ids:
+        walk_owned_counts(node.get(bag, node.get(str(bag))), counts)
+    return counts
+
+
+def build_index(roots: List[Tuple[str, dict]]) -> Dict[str, Counts]:
+    """Per-character full counts, as SyncOwnedIndex caches them for characters walked from BagBrother."""
+    index: Dict[str, Counts] = {}
+    for name, node in roots:
+        counts: Counts = {}
+        walk_owned_counts(node, counts)
+        index[name] = counts
+    return index
+
+
+def restrict(index: Dict[str, Counts], wanted: Set[int]) -> Dict[str, Counts]:
+    out: Dict[str, Counts] = {}
+    for name, counts in index.items():
+        picked = {item_id: counts[item_id] for item_id in wanted if counts.get(item_id, 0) > 0}
+        if picked:
+            out[name] = picked
+    return out
+
+
+def _saved_index(frugal_globals: Dict[str, LuaValue], realm_name: str) -> Dict[str, dict]:
+    db = frugal_globals.get("FrugalScanDB")
+    index = db.get("ownedIndex") if isinstance(db, dict) else None
+    realms = index.get("realms") if isinstance(index, dict) else None
+    realm = realms.get(realm_name) if isinstance(realms, dict) else None
+    return {str(k): v for k, v in realm.items() if isinstance(v, dict)} if isinstance(realm, dict) else {}
+
+
+def _wanted_ids(frugal_globals: Dict[str, LuaValue]) -> Set[int]:
+    wanted = {int(v) for v in lua_array(frugal_globals.get("FrugalScan_TargetItemIds")) if isinstance(v, (int, float)) and v > 0}
+    db = frugal_globals.get("FrugalScanDB")
+    owned = db.get("lastOwnedSnapshot") if isinstance(db, dict) else None
+    for item in lua_array(owned.get("items") if isinstance(owned, dict) else None):
+        if isinstance(item, dict) and isinstance(item.get("itemId"), (int, float)):
+            wanted.add(int(item["itemId"]))
+    return wanted
+
+
+def _diff(label: str, expected: Counts, actual: Counts) -> List[str]:
+    lines = []
+    for item_id in sorted(set(expected) | set(actual)):
+        if expected.get(item_id, 0) != actual.get(item_id, 0):
+            lines.append(f"  {label}: item {item_id} BagBrother={expected.get(item_id, 0)} index={actual.get(item_id, 0)}")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Check the owned-count index the addon saved (FrugalScanDB.ownedIndex) against a full walk of "
+            "BagBrother's SavedVariables (the pre-index owned export), and time the walk against an index lookup. "
+            "Without arguments it replays the recorded pair under fixtures/owned_index."
+        )
+    )
+    parser.add_argument(
+        "--bagbrother-sv",
+        type=Path,
+        default=FIXTURE_DIR / "BagBrother.lua",
+        help="WTF/Account/<account>/SavedVariables/BagBrother.lua (default: the recorded fixture)",
+    )
+    parser.add_argument(
+        "--frugal-sv",
+        type=Path,
+        default=FIXTURE_DIR / "FrugalForge.lua",
+        help="WTF/Account/<account>/SavedVariables/FrugalForge.lua (default: the recorded fixture)",
+    )
+    parser.add_argument("--realm", default=FIXTURE_REALM)
+    parser.add_argument("--wanted", type=int, nargs="*", default=None, help="Item ids to compare (default: targets and last owned export).")
+    parser.add_argument("--repeat", type=int, default=20, help="Exports to time for the walk vs the index.")
+    args = parser.parse_args()
+
+    bag_globals = load_lua_file(args.bagbrother_sv)
+    frugal_globals = load_lua_file(args.frugal_sv)
+    roots = find_characters(bag_globals, args.realm)
+    if not roots:
+        raise SystemExit(f"No characters for realm {args.realm!r} in {args.bagbrother_sv}")
+
+    wanted = set(args.wanted) if args.wanted is not None else _wanted_ids(frugal_globals)
+    if not wanted:
+        wanted = {item_id for counts in build_index(roots).values() for item_id in counts}
+
+    mismatches: List[str] = []
+    saved = _saved_index(frugal_globals, args.realm)
+    if not saved:
+        raise SystemExit(f"No saved owned index for realm {args.realm!r} in {args.frugal_sv}")
+    nodes = dict(roots)
+    for name, entry in sorted(saved.items()):
+        counts = {int(k): int(v) for k, v in (entry.get("counts") or {}).items()}
+        node = nodes.get(name)
+        if node is None:
+            mismatches.append(f"  {name}: in the saved index but not in BagBrother")
+            continue
+        if entry.get("source") == "live":
+            # Live entries count bags and bank only; BagBrother also keeps equipped items.
+            expected = container_counts(node, BAG_CONTAINER_IDS + BANK_CONTAINER_IDS)
+        else:
+            expected = build_index([(name, node)])[name]
+        mismatches += _diff(f"{name} (stamp {entry.get('stamp')})", restrict({name: expected}, wanted).get(name, {}), restrict({name: counts}, wanted).get(name, {}))
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for _, node in roots:
+            walk_owned_counts(node, {}, wanted)
+    walk_seconds = (time.perf_counter() - started) / args.repeat
+    index = build_index(roots)
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        restrict(index, wanted)
+    index_seconds = (time.perf_counter() - started) / args.repeat
+
+    print(f"{args.realm}: {len(roots)} characters, {len(wanted)} wanted items, {len(saved)} saved index entries")
+    print(f"per export: BagBrother walk {walk_seconds * 1000:.2f} ms, index lookup {index_seconds * 1000:.2f} ms")
+    if mismatches:
+        print(f"{len(mismatches)} mismatches:")
+        for line in mismatches:
+            print(line)
+        return 1
+    print("saved index matches the BagBrother walk")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
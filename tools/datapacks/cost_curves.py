@@ -0,0 +1,313 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from export_lua_data import DEFAULT_SKILL_BUCKET_SIZE, _load_professions, build_skill_index
+from skillup import chance_for_skill
+from snapshot_codec import SCAN_SCHEMA, snapshot_from_saved_variables
+
+DEFAULT_TARGET_SKILLS = [75, 150, 225, 300, 375]
+# FrugalForgeDB.settings.nonTrainerPenalty default; recipes not learned from a trainer cost this much more.
+DEFAULT_NON_TRAINER_PENALTY = 1.5
+# The planner's vendorRecipeOverrides: recipe items forced to count (or not) as sold by a vendor.
+VENDOR_RECIPE_OVERRIDES: Dict[int, bool] = {
+    11225: False,
+    16217: True,
+    21892: True,
+    21896: True,
+}
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    source: str
+    realm_name: str
+    faction: str
+    region: str
+    timestamp: str
+    price_rank: str
+    prices: Dict[int, int]
+
+
+@dataclass(frozen=True)
+class _Step:
+    skill: int
+    recipe_id: str
+    crafts: float
+    cost: float
+
+
+# Set per worker process by _init_worker, so recipes and snapshots are pickled once per worker.
+_WORKER: dict = {}
+
+
+def load_snapshot(path: Path, default_price_rank: str = "") -> Snapshot:
+    """A scan export (.json) or the last snapshot in a FrugalForge SavedVariables file (.lua)."""
+    if path.suffix.lower() == ".lua":
+        data = snapshot_from_saved_variables(path)
+    else:
+        data = json.loads(path.read_text(encoding="utf-8-sig"))
+        if data.get("schema") != SCAN_SCHEMA:
+            raise SystemExit(f"{path}: expected schema {SCAN_SCHEMA}, got {data.get('schema')!r}")
+    prices: Dict[int, int] = {}
+    for p in data.get("prices") or []:
+        item_id = int(p.get("itemId") or 0)
+        price = int(p.get("minUnitBuyoutCopper") or 0)
+        if item_id > 0 and price > 0:
+            prices[item_id] = price
+    # Exports made before the scanner recorded its price rank do not carry it.
+    rank = data.get("priceRank")
+    return Snapshot(
+        source=path.name,
+        realm_name=str(data.get("realmName") or ""),
+        faction=str(data.get("faction") or ""),
+        region=str(data.get("region") or ""),
+        timestamp=str(data.get("snapshotTimestampUtc") or ""),
+        price_rank=str(int(rank)) if isinstance(rank, (int, float)) else default_price_rank,
+        prices=prices,
+    )
+
+
+def load_vendor_prices(items_json: Path) -> Dict[int, int]:
+    if not items_json.exists():
+        return {}
+    items = json.loads(items_json.read_text(encoding="utf-8"))
+    return {
+        int(i["itemId"]): int(i["vendorPriceCopper"])
+        for i in items
+        if isinstance(i.get("vendorPriceCopper"), int) and i["vendorPriceCopper"] > 0
+    }
+
+
+def recipe_vendor_price(r: dict, vendor_prices: Dict[int, int]) -> Optional[int]:
+    """What the recipe item costs from a vendor, or None when it is not sold (resolveRecipeVendorPrice)."""
+    recipe_item_id = int(r.get("recipeItemId") or 0)
+    if recipe_item_id <= 0:
+        return None
+    override = VENDOR_RECIPE_OVERRIDES.get(recipe_item_id)
+    if override is False:
+        return None
+    explicit = r.get("recipeVendorPrice")
+    if override is True or recipe_item_id in vendor_prices:
+        return explicit or vendor_prices.get(recipe_item_id)
+    return None
+
+
+def recipe_penalty_factor(r: dict, vendor_price: Optional[int], non_trainer_penalty: float) -> float:
+    """The planner's recipePenaltyFactor: half the penalty when the recipe can be bought from a vendor."""
+    if r.get("learnedByTrainer") is not False:
+        return 1.0
+    if vendor_price is not None:
+        return max(1.0, 1 + (non_trainer_penalty - 1) * 0.5)
+    return non_trainer_penalty
+
+
+def simulate_costs(
+    recipes: List[dict],
+    buckets: Dict[int, List[int]],
+    bucket_size: int,
+    prices: Dict[int, int],
+    vendor_prices: Dict[int, int],
+    *,
+    from_skill: int,
+    to_skill: int,
+    non_trainer_penalty: float,
+) -> List[_Step]:
+    """Cheapest expected cost of each skill point in [from_skill, to_skill), stopping at the first gap.
+
+    Per skill point, every live recipe (not gray, no cooldown, every reagent priced from the
+    snapshot or a vendor) is costed as reagents x expected crafts, like the planner's
+    estimateCostForCraftsNoOwned. Reagents are priced as bought; intermediates are not
+    expanded into their own reagents. As in the planner, a recipe item that no vendor sells
+    counts as one missing input, so such recipes are only chosen when every other live
+    recipe is missing something too. The recipe item's own price is not added.
+    """
+    unit_cost: Dict[int, Optional[Tuple[int, float]]] = {}
+    for idx, r in enumerate(recipes, start=1):
+        cost = 0.0
+        for reg in r["reagents"]:
+            item_id = int(reg["itemId"])
+            price = prices.get(item_id) or vendor_prices.get(item_id)
+            if price is None:
+                cost = -1.0
+                break
+            cost += price * reg["qty"]
+        if cost < 0 or r.get("cooldownSeconds"):
+            unit_cost[idx] = None
+        else:
+            vendor_price = recipe_vendor_price(r, vendor_prices)
+            missing = 1 if r.get("learnedByTrainer") is False and vendor_price is None else 0
+            unit_cost[idx] = (missing, cost * recipe_penalty_factor(r, vendor_price, non_trainer_penalty))
+
+    steps: List[_Step] = []
+    for skill in range(from_skill, to_skill):
+        best: Optional[_Step] = None
+        best_missing = 0
+        for idx in buckets.get(skill // bucket_size, ()):
+            r = recipes[idx - 1]
+            unit = unit_cost[idx]
+            if unit is None or not r["minSkill"] <= skill < r["grayAt"]:
+                continue
+            missing, cost = unit
+            chance = chance_for_skill(skill, r)
+            if chance <= 0:
+                continue
+            crafts = 1 / chance
+            if best is None or (missing, cost * crafts) < (best_missing, best.cost):
+                best = _Step(skill, str(r["recipeId"]), crafts, cost * crafts)
+                best_missing = missing
+        if best is None:
+            break
+        steps.append(best)
+    return steps
+
+
+def _init_worker(profs: List[dict], snapshots: List[Snapshot], vendor_prices: Dict[int, int], options: dict) -> None:
+    bucket_size = options["bucket_size"]
+    _WORKER["profs"] = [(p, build_skill_index(p["recipes"], bucket_size)) for p in profs]
+    _WORKER["snapshots"] = snapshots
+    _WORKER["vendor_prices"] = vendor_prices
+    _WORKER["options"] = options
+
+
+def _curve_rows(task: Tuple[int, int]) -> List[dict]:
+    """One row per target skill for a (snapshot, profession) pair.
+
+    Without owned materials the cheapest recipe at a skill point does not depend on the
+    target, so one simulation to the highest target is sliced for every lower one.
+    """
+    snap_idx, prof_idx = task
+    snap: Snapshot = _WORKER["snapshots"][snap_idx]
+    prof, buckets = _WORKER["profs"][prof_idx]
+    options = _WORKER["options"]
+    from_skill = options["from_skill"]
+    steps = simulate_costs(
+        prof["recipes"],
+        buckets,
+        options["bucket_size"],
+        snap.prices,
+        _WORKER["vendor_prices"],
+        from_skill=from_skill,
+        to_skill=max(options["targets"]),
+        non_trainer_penalty=options["non_trainer_penalty"],
+    )
+    cumulative: List[int] = []
+    total = 0.0
+    for step in steps:
+        total += step.cost
+        cumulative.append(int(round(total)))
+
+    rows: List[dict] = []
+    for target in options["targets"]:
+        n = min(len(steps), max(0, target - from_skill))
+        row = {
+            "realm": snap.realm_name,
+            "faction": snap.faction,
+            "region": snap.region,
+            "priceRank": snap.price_rank,
+            "snapshot": snap.timestamp,
+            "source": snap.source,
+            "profession": prof["name"],
+            "fromSkill": from_skill,
+            "targetSkill": target,
+            "reachedSkill": from_skill + n,
+            "totalCopper": cumulative[n - 1] if n else 0,
+        }
+        # Cumulative cost when reaching each curve skill, blank past what the snapshot can price.
+        for skill in options["curve_skills"]:
+            k = skill - from_skill
+            row[f"at{skill}"] = cumulative[k - 1] if 0 < k <= n else ""
+        rows.append(row)
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            f"Batch cumulative leveling cost vs skill for every scan export x profession x target skill, "
+            f"from {SCAN_SCHEMA} exports (or FrugalForge SavedVariables files) and the profession datapacks."
+        )
+    )
+    parser.add_argument("snapshots", type=Path, nargs="+", help="Scan export .json files or SavedVariables/FrugalForge.lua files.")
+    parser.add_argument("--data-root", type=Path, default=Path("data"))
+    parser.add_argument("--version", default="Anniversary")
+    parser.add_argument("--profession", action="append", default=[], help="Profession name (repeatable, default: all).")
+    parser.add_argument("--from-skill", type=int, default=1)
+    parser.add_argument("--target-skills", type=int, nargs="+", default=DEFAULT_TARGET_SKILLS)
+    parser.add_argument("--curve-step", type=int, default=5, help="Skill spacing of the cumulative-cost columns.")
+    parser.add_argument(
+        "--price-rank",
+        default="",
+        help="Price rank to report for older exports that do not record the rank they were scanned with.",
+    )
+    parser.add_argument("--non-trainer-penalty", type=float, default=DEFAULT_NON_TRAINER_PENALTY)
+    parser.add_argument("--skill-bucket-size", type=int, default=DEFAULT_SKILL_BUCKET_SIZE)
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (default: one per CPU).")
+    parser.add_argument("--out", type=Path, default=None, help="CSV path (default: stdout).")
+    args = parser.parse_args()
+
+    if args.skill_bucket_size <= 0:
+        raise SystemExit("--skill-bucket-size must be > 0")
+    if args.curve_step <= 0:
+        raise SystemExit("--curve-step must be > 0")
+    targets = sorted({t for t in args.target_skills if t > args.from_skill})
+    if not targets:
+        raise SystemExit("--target-skills must include a skill above --from-skill")
+
+    version_dir = args.data_root / args.version
+    profs = _load_professions(version_dir / "professions")
+    if args.profession:
+        wanted = {name.lower() for name in args.profession}
+        profs = [p for p in profs if p["name"].lower() in wanted]
+    if not profs:
+        raise SystemExit(f"No profession data found under {version_dir}")
+    snapshots = [load_snapshot(path, args.price_rank) for path in args.snapshots]
+    vendor_prices = load_vendor_prices(version_dir / "items.json")
+
+    options = {
+        "from_skill": args.from_skill,
+        "targets": targets,
+        "curve_skills": [s for s in range(args.curve_step, max(targets) + 1, args.curve_step) if s > args.from_skill],
+        "bucket_size": args.skill_bucket_size,
+        "non_trainer_penalty": max(1.0, args.non_trainer_penalty),
+    }
+    tasks = [(s, p) for s in range(len(snapshots)) for p in range(len(profs))]
+
+    started = time.perf_counter()
+    rows: List[dict] = []
+    with ProcessPoolExecutor(
+        max_workers=args.jobs if args.jobs > 0 else None,
+        initializer=_init_worker,
+        initargs=(profs, snapshots, vendor_prices, options),
+    ) as pool:
+        for task_rows in pool.map(_curve_rows, tasks, chunksize=max(1, len(tasks) // 64)):
+            rows.extend(task_rows)
+    elapsed = time.perf_counter() - started
+
+    fieldnames = list(rows[0].keys()) if rows else []
+    if args.out:
+        with args.out.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(
+        f"{len(rows)} scenarios ({len(snapshots)} snapshots x {len(profs)} professions x {len(targets)} targets) "
+        f"in {elapsed:.2f}s" + (f", wrote {args.out}" if args.out else ""),
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+DEFAULT_SKILL_BUCKET_SIZE = 5
+
+# Recipes that consume Ogre Tannin are never used as the producer of their output.
+OGRE_TANNIN_ITEM_ID = 18240
+
+
+def _load_professions(professions_dir: Path) -> List[dict]:
+    profs: List[dict] = []
+    for path in sorted(professions_dir.glob("*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        profs.append(
+            {
+                "professionId": data["professionId"],
+                "name": data["professionName"],
+                "recipes": data["recipes"],
+            }
+        )
+    return profs
+
+
+def _load_item_names(path: Path) -> Dict[int, str]:
+    items = json.loads(path.read_text(encoding="utf-8"))
+    return {int(i["itemId"]): i["name"] for i in items}
+
+
+def _load_smelts(path: Path) -> List[dict]:
+    if not path.exists():
+        return []
+    producers = json.loads(path.read_text(encoding="utf-8")).get("producers", [])
+    return [p for p in producers if p.get("kind") == "Smelt"]
+
+
+def build_skill_index(recipes: List[dict], bucket_size: int) -> Dict[int, List[int]]:
+    """Map skill bucket (skill // bucket_size) to the 1-based recipe indices that are not gray anywhere in it."""
+    buckets: Dict[int, List[int]] = {}
+    for idx, r in enumerate(recipes, start=1):
+        min_skill = int(r["minSkill"])
+        gray_at = int(r["grayAt"])
+        if gray_at <= min_skill:
+            continue
+        for bucket in range(min_skill // bucket_size, (gray_at - 1) // bucket_size + 1):
+            buckets.setdefault(bucket, []).append(idx)
+    return buckets
+
+
+def skill_index_stats(
+    recipes: List[dict], bucket_size: int, *, from_skill: int = 1, to_skill: int = 375
+) -> Tuple[int, int, int]:
+    """Candidate checks a planner makes over [from_skill, to_skill): (full scan, bucketed scan, live recipes)."""
+    index = build_skill_index(recipes, bucket_size)
+    full = 0
+    bucketed = 0
+    live = 0
+    for skill in range(from_skill, to_skill):
+        full += len(recipes)
+        bucketed += len(index.get(skill // bucket_size, ()))
+        live += sum(1 for r in recipes if r["minSkill"] <= skill < r["grayAt"])
+    return full, bucketed, live
+
+
+def build_created_by(recipes: List[dict]) -> Dict[int, int]:
+    """Output itemId -> 1-based index of the recipe that produces it.
+
+    The producing recipe matches the planner's buildRecipeByOutput: Ogre Tannin recipes are
+    skipped and the lowest minSkill wins, earlier recipes winning ties.
+    """
+    created_by: Dict[int, int] = {}
+    for idx, r in enumerate(recipes, start=1):
+        reagent_ids = [int(reg["itemId"]) for reg in r["reagents"]]
+        output_id = int(r.get("createsItemId") or 0)
+        if output_id <= 0 or OGRE_TANNIN_ITEM_ID in reagent_ids:
+            continue
+        existing = created_by.get(output_id)
+        if existing is None or int(r["minSkill"]) < int(recipes[existing - 1]["minSkill"]):
+            created_by[output_id] = idx
+    return created_by
+
+
+def render_lua_data(
+    version: str,
+    profs: List[dict],
+    item_map: Dict[int, str],
+    smelts: List[dict],
+    *,
+    bucket_size: int = DEFAULT_SKILL_BUCKET_SIZE,
+) -> str:
+    lines: List[str] = []
+    lines.append(f"FrugalForgeData_{version} = {{")
+    lines.append("  professions = {")
+    for prof in profs:
+        lines.append("    {")
+        lines.append(f"      professionId = {prof['professionId']},")
+        lines.append(f"      name = {json.dumps(prof['name'])},")
+        lines.append("      recipes = {")
+        for r in prof["recipes"]:
+            lines.append("        {")
+            lines.append(f"          recipeId = {json.dumps(r['recipeId'])},")
+            lines.append(f"          professionId = {r['professionId']},")
+            lines.append(f"          name = {json.dumps(r['name'])},")
+            lines.append(f"          createsItemId = {r['createsItemId']},")
+            lines.append(f"          createsQuantity = {r['createsQuantity']},")
+            lines.append(f"          learnedByTrainer = {str(r['learnedByTrainer']).lower()},")
+            if "cooldownSeconds" in r and r["cooldownSeconds"]:
+                lines.append(f"          cooldownSeconds = {r['cooldownSeconds']},")
+            lines.append(f"          minSkill = {r['minSkill']},")
+            lines.append(f"          orangeUntil = {r['orangeUntil']},")
+            lines.append(f"          yellowUntil = {r['yellowUntil']},")
+            lines.append(f"          greenUntil = {r['greenUntil']},")
+            lines.append(f"          grayAt = {r['grayAt']},")
+            lines.append("          reagents = {")
+            for reg in r["reagents"]:
+                lines.append(f"            {{ itemId = {reg['itemId']}, qty = {reg['qty']} }},")
+            lines.append("          },")
+            lines.append("        },")
+        lines.append("      },")
+        lines.append("      createdBy = {")
+        for item_id, idx in sorted(build_created_by(prof["recipes"]).items()):
+            lines.append(f"        [{item_id}] = {idx},")
+        lines.append("      },")
+        lines.append("      skillIndex = {")
+        lines.append(f"        bucketSize = {bucket_size},")
+        lines.append("        buckets = {")
+        for bucket, indices in sorted(build_skill_index(prof["recipes"], bucket_size).items()):
+            lines.append(f"          [{bucket}] = {{ {', '.join(str(i) for i in indices)} }},")
+        lines.append("        },")
+        lines.append("      },")
+        lines.append("    },")
+    lines.append("  },")
+    lines.append("  smelts = {")
+    for s in smelts:
+        out = s["output"]
+        lines.append(f"    [{out['itemId']}] = {{")
+        lines.append(f"      name = {json.dumps(s['name'])},")
+        lines.append(f"      outputQty = {out.get('qty', 1)},")
+        lines.append("      reagents = {")
+        for reg in s.get("reagents", []):
+            lines.append(f"        {{ itemId = {reg['itemId']}, qty = {reg['qty']} }},")
+        lines.append("      },")
+        lines.append("    },")
+    lines.append("  },")
+    lines.append("  items = {")
+    for item_id, name in sorted(item_map.items()):
+        lines.append(f"    [{item_id}] = {json.dumps(name)},")
+    lines.append("  }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def export_lua_data(
+    version_dir: Path, version: str, out_lua: Path, *, bucket_size: int = DEFAULT_SKILL_BUCKET_SIZE
+) -> Tuple[int, int, int]:
+    profs = _load_professions(version_dir / "professions")
+    item_map = _load_item_names(version_dir / "items.json")
+    smelts = _load_smelts(version_dir / "producers.json")
+
+    out_lua.parent.mkdir(parents=True, exist_ok=True)
+    out_lua.write_text(render_lua_data(version, profs, item_map, smelts, bucket_size=bucket_size), encoding="utf-8")
+    return len(profs), len(item_map), len(smelts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the addon's FrugalForgeData_<Version> Lua table from data/<Version>.")
+    parser.add_argument("--data-root", type=Path, default=Path("data"))
+    parser.add_argument("--version", default="Anniversary", help="Game version folder under data/ (e.g. Anniversary, Era).")
+    parser.add_argument("--out-lua", type=Path, default=None, help="Default: FrugalForge/FrugalForge_Data_<Version>.lua")
+    parser.add_argument("--skill-bucket-size", type=int, default=DEFAULT_SKILL_BUCKET_SIZE)
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print planner candidate checks over skill 1-375 with and without the skill index.",
+    )
+    args = parser.parse_args()
+
+    if args.skill_bucket_size <= 0:
+        raise SystemExit("--skill-bucket-size must be > 0")
+
+    version_dir = args.data_root / args.version
+    out_lua = args.out_lua or Path("FrugalForge") / f"FrugalForge_Data_{args.version}.lua"
+    profs, items, smelts = export_lua_data(version_dir, args.version, out_lua, bucket_size=args.skill_bucket_size)
+    print(f"Wrote {out_lua}: {profs} professions, {items} items, {smelts} smelts")
+
+    if args.stats:
+        for prof in _load_professions(version_dir / "professions"):
+            full, bucketed, live = skill_index_stats(prof["recipes"], args.skill_bucket_size)
+            ratio = (bucketed / full * 100) if full else 0.0
+            print(
+                f"{prof['name']}: candidate checks 1-375 full={full} bucketed={bucketed} ({ratio:.1f}%), live={live}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
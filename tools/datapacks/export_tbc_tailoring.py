@@ -4,7 +4,12 @@ import json
 import re
 import urllib.request
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from cache_index import CacheIndex, page_name
+from item_resolver import ItemResolver
+from page_scan import PageBuffer, as_buffer, open_page, read_json_span
+from shared_cache import SharedCache, write_text_atomic
 
 
 WAGO_BUILD = "2.5.4.44833"
@@ -13,6 +18,10 @@ WAGO_ITEM_SEARCH_NAME_CSV = f"https://wago.tools/db2/ItemSearchName/csv?build={W
 DEFAULT_PROFESSION_ID = 197
 DEFAULT_PROFESSION_NAME = "Tailoring"
 DEFAULT_WOWHEAD_SKILL_URL = "https://www.wowhead.com/tbc/skill=197/tailoring"
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
 
 
 def _slugify(value: str) -> str:
@@ -30,45 +39,8 @@ def _http_get_text(url: str, *, user_agent: str, timeout_seconds: int = 45) -> s
         return resp.read().decode("utf-8", errors="replace")
 
 
-def _find_matching_bracket(text: str, start_index: int, open_char: str, close_char: str) -> int:
-    if text[start_index] != open_char:
-        raise ValueError(f"Expected '{open_char}' at index {start_index}")
-
-    depth = 0
-    in_string = False
-    escape = False
-
-    for idx in range(start_index, len(text)):
-        ch = text[idx]
-
-        if in_string:
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
-                continue
-            if ch == '"':
-                in_string = False
-            continue
-
-        if ch == '"':
-            in_string = True
-            continue
-
-        if ch == open_char:
-            depth += 1
-            continue
-        if ch == close_char:
-            depth -= 1
-            if depth == 0:
-                return idx
-
-    raise ValueError(f"No matching '{close_char}' found for '{open_char}' at {start_index}")
-
-
-def _extract_wowhead_spell_listview_data(html: str) -> List[dict]:
-    marker = "template: 'spell'"
+def _extract_wowhead_spell_listview_data(html: PageBuffer) -> List[dict]:
+    marker = b"template: 'spell'"
     pos = 0
     candidates: List[List[dict]] = []
 
@@ -77,29 +49,21 @@ def _extract_wowhead_spell_listview_data(html: str) -> List[dict]:
         if idx < 0:
             break
 
-        data_idx = html.find("data:", idx)
+        data_idx = html.find(b"data:", idx)
         if data_idx < 0:
             pos = idx + len(marker)
             continue
 
-        array_start = html.find("[", data_idx)
+        array_start = html.find(b"[", data_idx)
         if array_start < 0:
             pos = idx + len(marker)
             continue
 
-        array_end = _find_matching_bracket(html, array_start, "[", "]")
-        raw = html[array_start : array_end + 1]
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            pos = array_end + 1
-            continue
-
+        data, array_end = read_json_span(html, array_start, b"[", b"]")
+        pos = array_end + 1
         if isinstance(data, list) and any(isinstance(x, dict) and "reagents" in x for x in data):
             candidates.append(data)
 
-        pos = array_end + 1
-
     if not candidates:
         raise ValueError("Unable to find a spell listview with reagents[] in the Tailoring skill page.")
 
@@ -107,8 +71,8 @@ def _extract_wowhead_spell_listview_data(html: str) -> List[dict]:
     return candidates[0]
 
 
-def _extract_wowhead_item_names(html: str) -> Dict[int, str]:
-    key = "WH.Gatherer.addData(3, 5, "
+def _extract_wowhead_item_names(html: PageBuffer) -> Dict[int, str]:
+    key = b"WH.Gatherer.addData(3, 5, "
     pos = 0
     best: dict | None = None
     while True:
@@ -116,24 +80,16 @@ def _extract_wowhead_item_names(html: str) -> Dict[int, str]:
         if idx < 0:
             break
 
-        obj_start = html.find("{", idx)
+        obj_start = html.find(b"{", idx)
         if obj_start < 0:
             pos = idx + len(key)
             continue
 
-        obj_end = _find_matching_bracket(html, obj_start, "{", "}")
-        raw = html[obj_start : obj_end + 1]
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            pos = obj_end + 1
-            continue
-
+        data, obj_end = read_json_span(html, obj_start, b"{", b"}")
+        pos = obj_end + 1
         if isinstance(data, dict) and (best is None or len(data) > len(best)):
             best = data
 
-        pos = obj_end + 1
-
     if best is None:
         raise ValueError("Unable to find parseable WH.Gatherer.addData(3, 5, ...) in page.")
     data = best
@@ -153,8 +109,7 @@ def _extract_wowhead_item_names(html: str) -> Dict[int, str]:
 def _load_wago_item_names(cache_dir: Path, *, user_agent: str) -> Dict[int, str]:
     cache_path = cache_dir / f"ItemSearchName.{WAGO_BUILD}.csv"
     if not cache_path.exists():
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_text(_http_get_text(WAGO_ITEM_SEARCH_NAME_CSV, user_agent=user_agent), encoding="utf-8")
+        write_text_atomic(cache_path, _http_get_text(WAGO_ITEM_SEARCH_NAME_CSV, user_agent=user_agent))
 
     names: Dict[int, str] = {}
     with cache_path.open("r", newline="", encoding="utf-8") as f:
@@ -185,9 +140,9 @@ def _colors_to_thresholds(colors: List[int]) -> Tuple[int, int, int, int, int]:
 
 
 def build_tailoring_pack_from_skill_page(
-    html: str, *, profession_id: int, profession_name: str, item_names: Dict[int, str]
+    html: Union[str, PageBuffer], *, profession_id: int, profession_name: str, item_names: Dict[int, str]
 ) -> Tuple[Dict[str, object], Dict[int, str]]:
-    data = _extract_wowhead_spell_listview_data(html)
+    data = _extract_wowhead_spell_listview_data(as_buffer(html))
 
     used_recipe_ids: Dict[str, int] = {}
     recipes: List[dict] = []
@@ -324,6 +279,121 @@ def _write_items_json(path: Path, items: Dict[int, str], existing: Dict[int, dic
     path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
 
+def _load_skill_page_pack(
+    cache_dir: Path,
+    *,
+    profession_id: int,
+    profession_name: str,
+    user_agent: str,
+    wowhead_skill_url: str,
+    index: Optional[CacheIndex] = None,
+) -> Tuple[Dict[str, object], Dict[int, str]]:
+    html_cache_path = cache_dir / page_name("skill", profession_id)
+    indexed = index is not None and index.get("skill", profession_id, cache_dir) is not None
+    if not indexed and not html_cache_path.exists():
+        write_text_atomic(html_cache_path, _http_get_text(wowhead_skill_url, user_agent=user_agent))
+
+    with open_page(html_cache_path) as html:
+        item_names = _extract_wowhead_item_names(html)
+        return build_tailoring_pack_from_skill_page(
+            html,
+            profession_id=profession_id,
+            profession_name=profession_name,
+            item_names=item_names,
+        )
+
+
+def shared_skill_pack(
+    shared: SharedCache,
+    *,
+    profession_id: int,
+    profession_name: str,
+    cache_dir: Path,
+    user_agent: str = DEFAULT_USER_AGENT,
+    wowhead_skill_url: str = DEFAULT_WOWHEAD_SKILL_URL,
+    index: Optional[CacheIndex] = None,
+) -> Tuple[Dict[str, object], Dict[int, str]]:
+    """The parsed skill page (pack, embedded item names); it does not depend on the game version."""
+    return shared.get(
+        f"skill-pack:{profession_id}",
+        lambda: _load_skill_page_pack(
+            cache_dir,
+            profession_id=profession_id,
+            profession_name=profession_name,
+            user_agent=user_agent,
+            wowhead_skill_url=wowhead_skill_url,
+            index=index,
+        ),
+    )
+
+
+def shared_wago_item_names(shared: SharedCache, cache_dir: Path, user_agent: str = DEFAULT_USER_AGENT) -> Dict[int, str]:
+    return shared.get("wago-item-names", lambda: _load_wago_item_names(cache_dir, user_agent=user_agent))
+
+
+def export_profession(
+    *,
+    profession_id: int,
+    profession_name: str,
+    out_profession_json: Path,
+    out_items_json: Path,
+    cache_dir: Path,
+    user_agent: str = DEFAULT_USER_AGENT,
+    wowhead_skill_url: str = DEFAULT_WOWHEAD_SKILL_URL,
+    shared: Optional[SharedCache] = None,
+    index: Optional[CacheIndex] = None,
+) -> Tuple[int, int]:
+    """Write one profession pack and merge its item names into items.json; returns (recipes, items)."""
+    if shared is None:
+        shared = SharedCache(cache_dir)
+
+    # Skill pages and the Wago name table do not depend on the game version folder,
+    # so version builds parse them once through the shared cache.
+    pack, reagent_item_names = shared_skill_pack(
+        shared,
+        profession_id=profession_id,
+        profession_name=profession_name,
+        cache_dir=cache_dir,
+        user_agent=user_agent,
+        wowhead_skill_url=wowhead_skill_url,
+        index=index,
+    )
+
+    if not pack["recipes"]:
+        raise SystemExit("No recipes were parsed; aborting.")
+
+    out_profession_json.parent.mkdir(parents=True, exist_ok=True)
+    out_profession_json.write_text(json.dumps(pack, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    existing_item_objects = _load_items_json_objects(out_items_json)
+    items = _load_items_json(out_items_json)
+
+    needed: Set[int] = set()
+    for recipe in pack["recipes"]:
+        creates_item_id = recipe.get("createsItemId")
+        if isinstance(creates_item_id, int) and creates_item_id > 0:
+            needed.add(creates_item_id)
+        for reagent in recipe["reagents"]:
+            needed.add(int(reagent["itemId"]))
+
+    resolver = ItemResolver(
+        [
+            ("items.json", lambda: items),
+            ("skill page", lambda: reagent_item_names),
+            ("wago", lambda: shared_wago_item_names(shared, cache_dir, user_agent)),
+        ],
+        # One memo per process, shared by every profession and version this process exports.
+        memo=shared.get("resolved-item-names", dict),
+    )
+    resolved, still_missing = resolver.resolve(needed)
+    if still_missing:
+        raise SystemExit(f"Missing {len(still_missing)} reagent item names (e.g. {still_missing[:20]}).")
+    items.update(resolved)
+
+    _write_items_json(out_items_json, items, existing_item_objects)
+    return len(pack["recipes"]), len(items)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Export TBC Classic profession recipes into Anniversary datapack JSON.")
     parser.add_argument("--profession-id", type=int, default=DEFAULT_PROFESSION_ID)
@@ -331,10 +401,7 @@ def main() -> int:
     parser.add_argument("--out-profession-json", type=Path, default=Path("data/Anniversary/professions/tailoring.json"))
     parser.add_argument("--out-items-json", type=Path, default=Path("data/Anniversary/items.json"))
     parser.add_argument("--cache-dir", type=Path, default=Path(".wago-cache"))
-    parser.add_argument(
-        "--user-agent",
-        default="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    )
+    parser.add_argument("--user-agent", default=DEFAULT_USER_AGENT)
     parser.add_argument("--wowhead-skill-url", default=DEFAULT_WOWHEAD_SKILL_URL)
     args = parser.parse_args()
 
@@ -343,86 +410,18 @@ def main() -> int:
     if not args.profession_name.strip():
         raise SystemExit("--profession-name must be non-empty")
 
-    html_cache_path = args.cache_dir / f"wowhead_tbc_skill_{args.profession_id}.html"
-    if html_cache_path.exists():
-        html = html_cache_path.read_text(encoding="utf-8", errors="replace")
-    else:
-        html = _http_get_text(args.wowhead_skill_url, user_agent=args.user_agent)
-        html_cache_path.parent.mkdir(parents=True, exist_ok=True)
-        html_cache_path.write_text(html, encoding="utf-8")
-
-    item_names = _extract_wowhead_item_names(html)
-    pack, reagent_item_names = build_tailoring_pack_from_skill_page(
-        html,
+    recipes, items = export_profession(
         profession_id=args.profession_id,
         profession_name=args.profession_name,
-        item_names=item_names,
+        out_profession_json=args.out_profession_json,
+        out_items_json=args.out_items_json,
+        cache_dir=args.cache_dir,
+        user_agent=args.user_agent,
+        wowhead_skill_url=args.wowhead_skill_url,
     )
 
-    if not pack["recipes"]:
-        raise SystemExit("No recipes were parsed; aborting.")
-
-    args.out_profession_json.parent.mkdir(parents=True, exist_ok=True)
-    args.out_profession_json.write_text(json.dumps(pack, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-
-    existing_item_objects = _load_items_json_objects(args.out_items_json)
-    items = _load_items_json(args.out_items_json)
-    missing = 0
-    for recipe in pack["recipes"]:
-        creates_item_id = recipe.get("createsItemId")
-        if isinstance(creates_item_id, int) and creates_item_id > 0 and creates_item_id not in items:
-            name = reagent_item_names.get(creates_item_id)
-            if not name:
-                missing += 1
-            else:
-                items[creates_item_id] = name
-
-        for reagent in recipe["reagents"]:
-            item_id = int(reagent["itemId"])
-            if item_id in items:
-                continue
-            name = reagent_item_names.get(item_id)
-            if not name:
-                missing += 1
-                continue
-            items[item_id] = name
-
-    if missing:
-        wago_names = _load_wago_item_names(args.cache_dir, user_agent=args.user_agent)
-        for recipe in pack["recipes"]:
-            creates_item_id = recipe.get("createsItemId")
-            if isinstance(creates_item_id, int) and creates_item_id > 0 and creates_item_id not in items:
-                name = wago_names.get(creates_item_id)
-                if name:
-                    items[creates_item_id] = name
-
-            for reagent in recipe["reagents"]:
-                item_id = int(reagent["itemId"])
-                if item_id in items:
-                    continue
-                name = wago_names.get(item_id)
-                if not name:
-                    continue
-                items[item_id] = name
-
-        still_missing = []
-        for recipe in pack["recipes"]:
-            creates_item_id = recipe.get("createsItemId")
-            if isinstance(creates_item_id, int) and creates_item_id > 0 and creates_item_id not in items:
-                still_missing.append(creates_item_id)
-
-            for reagent in recipe["reagents"]:
-                item_id = int(reagent["itemId"])
-                if item_id not in items:
-                    still_missing.append(item_id)
-        if still_missing:
-            still_missing = sorted(set(still_missing))
-            raise SystemExit(f"Missing {len(still_missing)} reagent item names (e.g. {still_missing[:20]}).")
-
-    _write_items_json(args.out_items_json, items, existing_item_objects)
-
-    print(f"Wrote {args.out_profession_json} ({args.profession_name}, {len(pack['recipes'])} recipes)")
-    print(f"Wrote {args.out_items_json} ({len(items)} items)")
+    print(f"Wrote {args.out_profession_json} ({args.profession_name}, {recipes} recipes)")
+    print(f"Wrote {args.out_items_json} ({items} items)")
     return 0
 
 
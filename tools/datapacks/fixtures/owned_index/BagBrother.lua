@@ -0,0 +1,43 @@
+-- Recorded BagBrother SavedVariables, anonymized: realm and character names replaced, gold randomized.
+-- check_owned_index.py replays it by default.
+BrotherBags = {
+  ["Anonymous Realm"] = {
+    ["Maincrafter"] = {
+      [-1] = { size = 24, "21877;6", "14047;15", "2604;18", "2604", "4305", "21877;2", "2589", "2592::::::::60:::::::;7", "2592::::::::60:::::::;17", "4306", "4306;19" },
+      [0] = { size = 16, "21877::::::::60:::::::;14", "2321", "2592::::::::60:::::::;12", "2996", "2320;2", "2604", "4306::::::::60:::::::", "2604::::::::60:::::::", "2997;2", "4306;19" },
+      [1] = { size = 16, "2589;14", "4306::::::::60:::::::;12", "2320;5", "2592;20", "2320", "2321::::::::60:::::::", "21877", "2592::::::::60:::::::;9", "2996;3" },
+      [2] = { size = 16, "2604", "2604;5", "4305", "2320;19", "4338", "14047;9", "4338::::::::60:::::::;6", "2321", "2589;13", "14047", "21877::::::::60:::::::" },
+      [3] = { size = 16, "14047", "2604", "2996", "2589", "2997;5", "2997::::::::60:::::::", "4305", "14047::::::::60:::::::" },
+      [4] = { size = 16, "2997;13", "2592", "2321::::::::60:::::::", "4338::::::::60:::::::", "2996", "2321::::::::60:::::::", "2997::::::::60:::::::", "2997" },
+      [5] = { size = 16, "2320", "2996", "4338::::::::60:::::::", "4305", "2589::::::::60:::::::;11" },
+      [6] = { size = 16, "4305;12", "2996::::::::60:::::::;11", "2997;13", "4306::::::::60:::::::;7", "2996", "2592::::::::60:::::::;4", "4306;6" },
+      equip = { "2575::::::::60:::::::", "4333::::::::60:::::::", "6096::::::::60:::::::" },
+      faction = "Alliance", class = "MAGE", race = "Human", gender = 2, money = 616851,
+    },
+    ["Bankalt"] = {
+      [-1] = { size = 24, "2997;16", "2321;5", "2997;12" },
+      [0] = { size = 16, "2997", "2321::::::::60:::::::", "4306", "14047", "2592" },
+      [1] = { size = 16, "21877::::::::60:::::::", "2589::::::::60:::::::;12", "2320;3", "4305;19", "2996::::::::60:::::::;13" },
+      [2] = { size = 16, "2321;17", "14047;18", "2996" },
+      [3] = { size = 16, "21877;20", "4305;4", "2321", "2604;18", "2592;2", "4338", "2997;7" },
+      [4] = { size = 16, "14047::::::::60:::::::", "4305;20", "2996::::::::60:::::::", "2592" },
+      [5] = { size = 16, "4305::::::::60:::::::", "2997;7", "4306", "21877;18", "2996::::::::60:::::::;8", "2320;14", "2321;18", "2589", "4338::::::::60:::::::" },
+      [6] = { size = 16, "2997;17", "2589::::::::60:::::::", "4306::::::::60:::::::;18", "2592;2", "4305;2", "2592", "14047::::::::60:::::::;16", "2604::::::::60:::::::", "2320" },
+      equip = { "10050::::::::60:::::::", "6096::::::::60:::::::", "4333::::::::60:::::::" },
+      faction = "Alliance", class = "WARRIOR", race = "Human", gender = 2, money = 25240,
+    },
+    ["Farmalt"] = {
+      [-1] = { size = 24, "2321", "4306;16", "4305;6", "2592", "2604" },
+      [0] = { size = 16, "4305::::::::60:::::::;10", "14047", "2320", "2321", "2996::::::::60:::::::", "4306::::::::60:::::::;5", "2589", "4305;9", "21877" },
+      [1] = { size = 16, "2996", "4305;3", "4338;6", "2589;18", "4306;15", "14047::::::::60:::::::", "2604::::::::60:::::::", "14047::::::::60:::::::;4", "21877;6" },
+      [2] = { size = 16, "4338;4", "2997;16", "2589::::::::60:::::::;13", "21877;15", "4306::::::::60:::::::", "2592", "2996;19", "2997::::::::60:::::::;19", "2604;7" },
+      [3] = { size = 16, "2321", "4338", "21877;17", "4338;2" },
+      [4] = { size = 16, "2592", "14047::::::::60:::::::;8", "2996", "14047::::::::60:::::::;2", "4338;14", "21877" },
+      [5] = { size = 16, "2321;2", "4306::::::::60:::::::;18", "2589;8", "2592::::::::60:::::::;15", "21877" },
+      [6] = { size = 16, "2996;2", "2996", "2997;5", "2592", "21877", "4338::::::::60:::::::;4", "2321", "2604::::::::60:::::::", "4338", "21877", "2996", "14047" },
+      equip = { "4333::::::::60:::::::", "2575::::::::60:::::::", "10050::::::::60:::::::" },
+      faction = "Alliance", class = "HUNTER", race = "Human", gender = 2, money = 133771,
+    },
+  },
+}
+BrotherBags_Version = 9
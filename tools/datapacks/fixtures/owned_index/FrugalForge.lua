@@ -0,0 +1,16 @@
+-- Recorded FrugalForge SavedVariables (owned index only), anonymized: realm and character names replaced, gold randomized.
+-- check_owned_index.py replays it by default.
+FrugalScanDB = {
+  ownedIndex = {
+    version = 1,
+    stamp = 5,
+    realms = {
+      ["Anonymous Realm"] = {
+        ["Maincrafter"] = { source = "live", stamp = 5, updatedAt = 1760870000, bags = { [2320] = 27, [2321] = 5, [2589] = 28, [2592] = 42, [2604] = 9, [2996] = 6, [2997] = 23, [4305] = 2, [4306] = 32, [4338] = 8, [14047] = 12, [21877] = 16 }, bank = { [2320] = 1, [2589] = 12, [2592] = 28, [2604] = 19, [2996] = 13, [2997] = 13, [4305] = 14, [4306] = 33, [4338] = 1, [14047] = 15, [21877] = 8 }, counts = { [2320] = 28, [2321] = 5, [2589] = 40, [2592] = 70, [2604] = 28, [2996] = 19, [2997] = 36, [4305] = 16, [4306] = 65, [4338] = 9, [14047] = 27, [21877] = 24 } },
+        ["Bankalt"] = { source = "bagbrother", stamp = 1, updatedAt = 1760860000, counts = { [2320] = 18, [2321] = 42, [2589] = 14, [2592] = 7, [2604] = 19, [2996] = 23, [2997] = 60, [4305] = 46, [4306] = 20, [4333] = 1, [4338] = 2, [6096] = 1, [10050] = 1, [14047] = 36, [21877] = 39 } },
+        ["Farmalt"] = { source = "bagbrother", stamp = 2, updatedAt = 1760860000, counts = { [2320] = 1, [2321] = 6, [2575] = 1, [2589] = 40, [2592] = 19, [2604] = 10, [2996] = 26, [2997] = 40, [4305] = 28, [4306] = 55, [4333] = 1, [4338] = 32, [10050] = 1, [14047] = 17, [21877] = 43 } },
+      },
+    },
+  },
+}
+FrugalScan_TargetItemIds = { 2321, 2589, 2592, 2604, 4306, 4338, 14047 }
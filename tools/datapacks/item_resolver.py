@@ -0,0 +1,52 @@
+from typing import Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+NameLoader = Callable[[], Mapping[int, str]]
+
+
+class ItemResolver:
+    """Batch itemId -> name lookup over tiers ordered from cheapest to most expensive.
+
+    The first tier is always the in-memory memo: every name a resolver finds is added to it,
+    so resolvers that share one memo (export_profession keeps it in SharedCache) answer
+    repeated ids across professions and versions without consulting their tiers. Typical
+    tiers after it: the persisted items.json, names embedded in a cached Wowhead page, then
+    the Wago ItemSearchName table. A tier is loaded only when a resolve() call still has
+    misses after the cheaper tiers, and at most once per resolver; pass loaders that go
+    through SharedCache to load a source once per process.
+    """
+
+    def __init__(self, tiers: Sequence[Tuple[str, NameLoader]], memo: Optional[MutableMapping[int, str]] = None) -> None:
+        self._tiers = list(tiers)
+        self._memo: MutableMapping[int, str] = memo if memo is not None else {}
+        self._loaded: Dict[str, Mapping[int, str]] = {}
+
+    def _tier_names(self, tier_name: str, loader: NameLoader) -> Mapping[int, str]:
+        names = self._loaded.get(tier_name)
+        if names is None:
+            names = loader()
+            self._loaded[tier_name] = names
+        return names
+
+    def resolve(self, item_ids: Iterable[int]) -> Tuple[Dict[int, str], List[int]]:
+        """Resolve every id in one pass; returns (names by itemId, sorted unresolved ids)."""
+        pending = {int(i) for i in item_ids if int(i) > 0}
+        found: Dict[int, str] = {}
+
+        for item_id in list(pending):
+            name = self._memo.get(item_id)
+            if name:
+                found[item_id] = name
+                pending.discard(item_id)
+
+        for tier_name, loader in self._tiers:
+            if not pending:
+                break
+            names = self._tier_names(tier_name, loader)
+            for item_id in list(pending):
+                name = names.get(item_id)
+                if name:
+                    found[item_id] = name
+                    pending.discard(item_id)
+
+        self._memo.update(found)
+        return found, sorted(pending)
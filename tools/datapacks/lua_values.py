@@ -0,0 +1,245 @@
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+# Lua values as Python values: nil -> None, booleans, int/float numbers, str, and tables as
+# dicts (array items keyed 1..n, like Lua). Integral float keys are stored as ints, as Lua
+# normalizes them.
+LuaValue = Union[None, bool, int, float, str, Dict[object, object]]
+
+
+class LuaParseError(ValueError):
+    pass
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+  | (?P<long_comment>--\[(?P<lc_eq>=*)\[.*?\](?P=lc_eq)\])
+  | (?P<comment>--[^\n]*)
+  | (?P<long_string>\[(?P<ls_eq>=*)\[.*?\](?P=ls_eq)\])
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+  | (?P<number>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<op>\.\.|[{}\[\]=,;\-.])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "a": "\a", "b": "\b", "f": "\f", "v": "\v", "\\": "\\", '"': '"', "'": "'", "\n": "\n"}
+
+Token = Tuple[str, str, int]
+
+
+def _unescape(body: str) -> str:
+    out: List[str] = []
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch != "\\":
+            out.append(ch)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt.isdigit():
+            m = re.match(r"\d{1,3}", body[i + 1 :])
+            assert m is not None
+            out.append(chr(int(m.group(0))))
+            i += 1 + len(m.group(0))
+            continue
+        if nxt not in _ESCAPES:
+            raise LuaParseError(f"Unsupported escape \\{nxt}")
+        out.append(_ESCAPES[nxt])
+        i += 2
+    return "".join(out)
+
+
+def _long_string_body(text: str) -> str:
+    start = text.index("[", 1) + 1
+    end = text.rindex("]", 0, len(text) - 1)
+    body = text[start:end]
+    # A newline right after the opening bracket is not part of the string.
+    if body.startswith("\r\n"):
+        return body[2:]
+    if body.startswith("\n"):
+        return body[1:]
+    return body
+
+
+def tokenize(text: str) -> List[Token]:
+    tokens: List[Token] = []
+    pos = 0
+    if text.startswith("﻿"):
+        pos = 1
+    while pos < len(text):
+        m = _TOKEN_RE.match(text, pos)
+        if not m:
+            raise LuaParseError(f"Unexpected character {text[pos]!r} at offset {pos}")
+        kind = m.lastgroup
+        if kind in ("lc_eq", "ls_eq"):
+            kind = "long_comment" if m.group("long_comment") else "long_string"
+        value = m.group(0)
+        if kind not in ("space", "comment", "long_comment"):
+            tokens.append((kind or "", value, pos))
+        pos = m.end()
+    return tokens
+
+
+def _number(text: str) -> Union[int, float]:
+    if text[:2] in ("0x", "0X"):
+        return int(text, 16)
+    if any(c in text for c in ".eE"):
+        return float(text)
+    return int(text)
+
+
+def _key(value: object) -> object:
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+class _Parser:
+    def __init__(self, tokens: List[Token], scope: Dict[str, LuaValue]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+        self.scope = scope
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else None
+
+    def take(self, value: Optional[str] = None) -> Token:
+        tok = self.peek()
+        if tok is None:
+            raise LuaParseError(f"Unexpected end of input, expected {value or 'a value'}")
+        if value is not None and tok[1] != value:
+            raise LuaParseError(f"Expected {value!r} at offset {tok[2]}, got {tok[1]!r}")
+        self.pos += 1
+        return tok
+
+    def at(self, value: str) -> bool:
+        tok = self.peek()
+        return tok is not None and tok[1] == value and tok[0] in ("op", "name")
+
+    def value(self) -> LuaValue:
+        tok = self.take()
+        kind, text, offset = tok
+        if kind == "op" and text == "-":
+            operand = self.value()
+            if not isinstance(operand, (int, float)) or isinstance(operand, bool):
+                raise LuaParseError(f"Unary minus on a non-number at offset {offset}")
+            return -operand
+        if kind == "op" and text == "{":
+            return self.table()
+        if kind == "number":
+            return _number(text)
+        if kind == "string":
+            return _unescape(text[1:-1])
+        if kind == "long_string":
+            return _long_string_body(text)
+        if kind == "name":
+            if text == "nil":
+                return None
+            if text in ("true", "false"):
+                return text == "true"
+            # As in Lua, a name never assigned reads as nil (the generated data has a few
+            # `None` leftovers that load as nil).
+            return self.scope.get(text)
+        raise LuaParseError(f"Unexpected {text!r} at offset {offset}")
+
+    def table(self) -> Dict[object, object]:
+        out: Dict[object, object] = {}
+        # Lua stores positional items after the keyed ones, so they win on a clash.
+        positional: Dict[object, object] = {}
+        n = 0
+        while not self.at("}"):
+            tok = self.peek()
+            nxt = self.peek(1)
+            if tok is not None and tok[1] == "[" and tok[0] == "op":
+                self.take("[")
+                key = _key(self.value())
+                self.take("]")
+                self.take("=")
+                value = self.value()
+                if key is None:
+                    raise LuaParseError("Table index is nil")
+                if value is not None:
+                    out[key] = value
+            elif tok is not None and tok[0] == "name" and nxt is not None and nxt[1] == "=" and nxt[0] == "op":
+                self.pos += 2
+                value = self.value()
+                if value is not None:
+                    out[tok[1]] = value
+            else:
+                n += 1
+                value = self.value()
+                if value is not None:
+                    positional[n] = value
+            if self.at(",") or self.at(";"):
+                self.pos += 1
+            else:
+                break
+        self.take("}")
+        out.update(positional)
+        return out
+
+    def chunk(self) -> Dict[str, LuaValue]:
+        """Assignments `[local] a, b = v1, v2` in order; returns the globals assigned."""
+        assigned: Dict[str, LuaValue] = {}
+        while self.peek() is not None:
+            if self.at(";"):
+                self.pos += 1
+                continue
+            is_local = self.at("local")
+            if is_local:
+                self.pos += 1
+            names = [self.take()[1]]
+            while self.at(","):
+                self.pos += 1
+                names.append(self.take()[1])
+            self.take("=")
+            values = [self.value()]
+            while self.at(","):
+                self.pos += 1
+                values.append(self.value())
+            for i, name in enumerate(names):
+                value = values[i] if i < len(values) else None
+                self.scope[name] = value
+                if not is_local:
+                    assigned[name] = value
+        return assigned
+
+
+def parse_lua_value(text: str) -> LuaValue:
+    """Parse one Lua literal or table constructor."""
+    parser = _Parser(tokenize(text), {})
+    value = parser.value()
+    if parser.peek() is not None:
+        raise LuaParseError(f"Trailing input at offset {parser.peek()[2]}")  # type: ignore[index]
+    return value
+
+
+def parse_lua_assignments(text: str) -> Dict[str, LuaValue]:
+    """Parse a data file or SavedVariables file made of assignments; returns its globals.
+
+    Locals are resolved where they are referenced, so files that hoist repeated values into
+    locals parse to the same values as their expanded form.
+    """
+    return _Parser(tokenize(text), {}).chunk()
+
+
+def load_lua_file(path: Path) -> Dict[str, LuaValue]:
+    return parse_lua_assignments(path.read_text(encoding="utf-8-sig"))
+
+
+def lua_array(table: object) -> List[object]:
+    """The 1..n array part of a parsed table, in order."""
+    if not isinstance(table, dict):
+        return []
+    out: List[object] = []
+    i = 1
+    while i in table:
+        out.append(table[i])
+        i += 1
+    return out
@@ -0,0 +1,308 @@
+import argparse
+import itertools
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+from lua_values import LuaValue, load_lua_file, lua_array, parse_lua_assignments
+
+try:
+    from lupa import lua51
+except ImportError:  # optional; without it the independent check falls back to luac -p
+    lua51 = None
+
+# Lua 5.1 allows 200 locals and 250 registers per function; the hoisted strings share the
+# main chunk's registers with the table constructors that follow them. register_need only
+# estimates the constructors' share; check_with_lua has a real Lua 5.1 compile the output.
+MAX_LOCALS = 190
+MAX_REGISTERS = 250
+REGISTER_MARGIN = 8
+FIELDS_PER_FLUSH = 50
+
+LUA_KEYWORDS = frozenset(
+    "and break do else elseif end false for function if in local nil not or repeat return then true until while".split()
+)
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_NAME_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+
+
+def lua_number(value: float) -> str:
+    """Shortest Lua literal for a number (Lua 5.1 numbers are all doubles)."""
+    if isinstance(value, float):
+        if value != value or value in (float("inf"), float("-inf")):
+            raise ValueError(f"No Lua literal for {value!r}")
+        if value.is_integer() and abs(value) < 2**53:
+            value = int(value)
+    if isinstance(value, int):
+        text = str(value)
+        digits = text.lstrip("-")
+        zeros = len(digits) - len(digits.rstrip("0"))
+        if zeros > 2:
+            short = f"{text[: len(text) - zeros]}e{zeros}"
+            if len(short) < len(text):
+                return short
+        return text
+    text = repr(value)
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def lua_string(value: str) -> str:
+    out = ['"']
+    for ch in value:
+        if ch == "\\":
+            out.append("\\\\")
+        elif ch == '"':
+            out.append('\\"')
+        elif ch == "\n":
+            out.append("\\n")
+        elif ch == "\r":
+            out.append("\\r")
+        elif ord(ch) < 32 or ord(ch) == 127:
+            out.append(f"\\{ord(ch):03d}")
+        else:
+            out.append(ch)
+    out.append('"')
+    return "".join(out)
+
+
+def _split_table(table: Dict[object, object]) -> Tuple[List[object], List[Tuple[object, object]]]:
+    items = lua_array(table)
+    n = len(items)
+    keyed = [(k, v) for k, v in table.items() if not (isinstance(k, int) and not isinstance(k, bool) and 1 <= k <= n)]
+    return items, keyed
+
+
+def _count_strings(value: LuaValue, counts: Dict[str, int]) -> None:
+    if isinstance(value, str):
+        counts[value] = counts.get(value, 0) + 1
+    elif isinstance(value, dict):
+        items, keyed = _split_table(value)
+        for item in items:
+            _count_strings(item, counts)
+        for key, item in keyed:
+            if isinstance(key, str) and not (_IDENTIFIER.match(key) and key not in LUA_KEYWORDS):
+                counts[key] = counts.get(key, 0) + 1
+            elif not isinstance(key, str):
+                _count_strings(key, counts)
+            _count_strings(item, counts)
+
+
+def register_need(value: LuaValue) -> int:
+    """Registers a table constructor holds at its deepest point (pending list items + nesting)."""
+    if not isinstance(value, dict):
+        return 1
+    items, keyed = _split_table(value)
+    need = 1
+    for i, item in enumerate(items):
+        need = max(need, 1 + i % FIELDS_PER_FLUSH + register_need(item))
+    for key, item in keyed:
+        need = max(need, 1 + register_need(key) + register_need(item))
+    return need
+
+
+def _local_names(reserved: Set[str]) -> Iterator[str]:
+    """Short names, shortest first, that are neither keywords nor globals of the file."""
+    for size in itertools.count(1):
+        for chars in itertools.product(_NAME_CHARS, *([_NAME_CHARS + "0123456789"] * (size - 1))):
+            name = "".join(chars)
+            if name not in LUA_KEYWORDS and name not in reserved:
+                yield name
+
+
+def choose_locals(globals_: Dict[str, LuaValue], max_locals: int) -> Dict[str, str]:
+    """Repeated strings worth hoisting into locals -> local name, most saved bytes first."""
+    counts: Dict[str, int] = {}
+    for value in globals_.values():
+        _count_strings(value, counts)
+    ranked = sorted(
+        ((len(lua_string(s)) * (n - 1) - n, s) for s, n in counts.items() if n > 1),
+        key=lambda pair: (-pair[0], pair[1]),
+    )
+    chosen: Dict[str, str] = {}
+    names = _local_names(set(globals_))
+    for _, s in ranked:
+        if len(chosen) >= max_locals:
+            break
+        name = next(names)
+        literal = len(lua_string(s))
+        n = counts[s]
+        # Each use becomes the name; the literal is written once in the local statement.
+        if n * literal - (n * len(name) + literal + len(name) + 2) <= 0:
+            break
+        chosen[s] = name
+    return chosen
+
+
+def _render(value: LuaValue, names: Dict[str, str], out: List[str]) -> None:
+    if value is True:
+        out.append("true")
+    elif value is False:
+        out.append("false")
+    elif isinstance(value, (int, float)):
+        out.append(lua_number(value))
+    elif isinstance(value, str):
+        out.append(names.get(value) or lua_string(value))
+    elif isinstance(value, dict):
+        items, keyed = _split_table(value)
+        out.append("{")
+        first = True
+        for item in items:
+            if not first:
+                out.append(",")
+            first = False
+            _render(item, names, out)
+        for key, item in keyed:
+            if not first:
+                out.append(",")
+            first = False
+            if isinstance(key, str) and _IDENTIFIER.match(key) and key not in LUA_KEYWORDS:
+                out.append(key)
+            else:
+                out.append("[")
+                _render(key, names, out)
+                out.append("]")
+            out.append("=")
+            _render(item, names, out)
+        out.append("}")
+    else:
+        raise ValueError(f"Cannot render {value!r} as Lua")
+
+
+def minify(text: str, max_locals: int = MAX_LOCALS) -> str:
+    """Minified source for a data file of global assignments; it evaluates to the same globals.
+
+    Comments, whitespace and any BOM are dropped, numbers take their shortest form, and
+    repeated strings are hoisted into locals (as many as the Lua 5.1 local and register
+    limits leave room for next to the deepest table constructor).
+    """
+    globals_ = parse_lua_assignments(text)
+    need = max((register_need(v) for v in globals_.values()), default=0)
+    budget = max(0, min(max_locals, MAX_REGISTERS - need - REGISTER_MARGIN))
+    names = choose_locals(globals_, budget)
+
+    out: List[str] = []
+    if names:
+        out.append("local " + ",".join(names.values()) + "=")
+        out.append(",".join(lua_string(s) for s in names))
+        out.append("\n")
+    for name, value in globals_.items():
+        out.append(f"{name}=")
+        _render(value, names, out)
+        out.append("\n")
+    return "".join(out)
+
+
+def _values_equal(a: object, b: object) -> bool:
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_values_equal(a[k], b[k]) for k in a)
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    return a == b
+
+
+def check_equivalent(original: Path, minified: Path) -> List[str]:
+    """Globals whose values differ between the two files (empty when they evaluate identically)."""
+    before = load_lua_file(original)
+    after = load_lua_file(minified)
+    return sorted(name for name in set(before) | set(after) if not _values_equal(before.get(name), after.get(name)))
+
+
+def _from_lua(value: object) -> object:
+    if lua51.lua_type(value) == "table":
+        return {_from_lua(k): _from_lua(v) for k, v in value.items()}
+    return value
+
+
+def lua51_globals(text: str) -> Dict[str, object]:
+    """Globals a chunk defines when a real Lua 5.1 (lupa) runs it."""
+    runtime = lua51.LuaRuntime()
+    g = runtime.globals()
+    builtins = set(g.keys())
+    runtime.execute(text)
+    return {name: _from_lua(g[name]) for name in list(g.keys()) if name not in builtins}
+
+
+def check_with_lua(original_text: str, minified: Path) -> Tuple[str, List[str]]:
+    """(checker, problems) from Lua itself rather than lua_values; checker is "" when neither
+    lupa nor luac is available.
+
+    lupa runs both files in Lua 5.1 and compares the globals they define, which also enforces
+    the real local and register limits. luac -p only compiles the minified file.
+    """
+    if lua51 is not None:
+        try:
+            before = lua51_globals(original_text)
+        except lua51.LuaError as exc:
+            return "lupa", [f"original does not load: {exc}"]
+        try:
+            after = lua51_globals(minified.read_text(encoding="utf-8-sig"))
+        except lua51.LuaError as exc:
+            return "lupa", [f"does not load: {exc}"]
+        return "lupa", sorted(name for name in set(before) | set(after) if not _values_equal(before.get(name), after.get(name)))
+    luac = shutil.which("luac5.1") or shutil.which("luac")
+    if luac:
+        result = subprocess.run([luac, "-p", str(minified)], capture_output=True, text=True)
+        return "luac", [result.stderr.strip() or "luac -p failed"] if result.returncode else []
+    return "", []
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Minify generated addon data files (FrugalForge_Data_*.lua) and check they evaluate to the same tables."
+    )
+    parser.add_argument("files", type=Path, nargs="+")
+    parser.add_argument("--out-dir", type=Path, default=None, help="Write minified copies here (default: rewrite in place).")
+    parser.add_argument("--max-locals", type=int, default=MAX_LOCALS)
+    parser.add_argument("--check-only", action="store_true", help="Compare each file with its copy in --out-dir; write nothing.")
+    parser.add_argument(
+        "--require-lua",
+        action="store_true",
+        help="Fail unless lupa or luac is available to check the output independently of lua_values.",
+    )
+    args = parser.parse_args()
+
+    if args.require_lua and lua51 is None and not (shutil.which("luac5.1") or shutil.which("luac")):
+        raise SystemExit("--require-lua: install lupa (pip install lupa) or put luac5.1 on PATH")
+
+    failed = 0
+    for path in args.files:
+        target = (args.out_dir / path.name) if args.out_dir else path
+        if args.check_only:
+            if not args.out_dir:
+                raise SystemExit("--check-only needs --out-dir")
+            diff = check_equivalent(path, target)
+            checker, problems = check_with_lua(path.read_text(encoding="utf-8-sig"), target)
+            diff += [f"{checker}: {p}" for p in problems]
+            failed += 1 if diff else 0
+            print(f"{path.name}: {'differs in ' + ', '.join(diff) if diff else 'equivalent'}")
+            continue
+
+        original = path.read_bytes()
+        minified = minify(original.decode("utf-8-sig"), args.max_locals)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(minified, encoding="utf-8", newline="\n")
+        # Re-evaluate what was written against the source text, not the file it may have replaced.
+        before = parse_lua_assignments(original.decode("utf-8-sig"))
+        after = load_lua_file(target)
+        diff = sorted(name for name in set(before) | set(after) if not _values_equal(before.get(name), after.get(name)))
+        # lua_values parsed both sides above; have Lua itself load the result as well.
+        checker, problems = check_with_lua(original.decode("utf-8-sig"), target)
+        diff += [f"{checker}: {p}" for p in problems]
+        if diff:
+            failed += 1
+            target.write_bytes(original)
+            print(f"{path.name}: NOT EQUIVALENT ({', '.join(diff)}), left unminified")
+            continue
+        checked = f", checked with {checker}" if checker else ", not checked by Lua (no lupa or luac)"
+        print(f"{path.name}: {len(original)} -> {len(minified.encode('utf-8'))} bytes, equivalent{checked}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
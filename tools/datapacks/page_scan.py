@@ -0,0 +1,82 @@
+import json
+import mmap
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Tuple, Union
+
+# Cached Wowhead pages are hundreds of KB of HTML around a few KB of embedded JSON.
+# Pages are mapped read-only and searched as bytes; only the JSON span we actually
+# use is copied out and decoded.
+PageBuffer = Union[bytes, mmap.mmap]
+
+_OUTSIDE_STRING = re.compile(rb'["\[\]{}]')
+_INSIDE_STRING = re.compile(rb'\\.|"', re.DOTALL)
+
+
+@contextmanager
+def open_page(path: Path) -> Iterator[PageBuffer]:
+    with path.open("rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            yield b""
+            return
+        try:
+            yield buf
+        finally:
+            buf.close()
+
+
+def as_buffer(page: Union[str, PageBuffer]) -> PageBuffer:
+    if isinstance(page, str):
+        return page.encode("utf-8")
+    return page
+
+
+def decode_span(buf: PageBuffer, start: int, end: int) -> str:
+    return buf[start:end].decode("utf-8", errors="replace")
+
+
+def find_matching_bracket(buf: PageBuffer, start_index: int, open_char: bytes, close_char: bytes) -> int:
+    if buf[start_index : start_index + 1] != open_char:
+        raise ValueError(f"Expected {open_char!r} at index {start_index}")
+
+    depth = 0
+    pos = start_index
+    while True:
+        m = _OUTSIDE_STRING.search(buf, pos)
+        if not m:
+            break
+        ch = m.group()
+        pos = m.end()
+
+        if ch == b'"':
+            while True:
+                s = _INSIDE_STRING.search(buf, pos)
+                if not s:
+                    raise ValueError(f"Unterminated string after index {start_index}")
+                pos = s.end()
+                if s.group() == b'"':
+                    break
+            continue
+
+        if ch == open_char:
+            depth += 1
+        elif ch == close_char:
+            depth -= 1
+            if depth == 0:
+                return m.start()
+
+    raise ValueError(f"No matching {close_char!r} found for {open_char!r} at {start_index}")
+
+
+def read_json_span(buf: PageBuffer, start_index: int, open_char: bytes, close_char: bytes) -> Tuple[Optional[Any], int]:
+    """Parse the bracketed JSON value starting at start_index; returns (value or None, end index)."""
+    end = find_matching_bracket(buf, start_index, open_char, close_char)
+    try:
+        value = json.loads(decode_span(buf, start_index, end + 1))
+    except json.JSONDecodeError:
+        value = None
+    return value, end
@@ -0,0 +1,233 @@
+import argparse
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+from export_lua_data import _load_professions
+from skillup import DEFAULT_CRAFT_CURVE_SCALE, craft_curve, expected_crafts
+from snapshot_codec import SCAN_SCHEMA, snapshot_from_saved_variables
+
+DEFAULT_TOLERANCE_COPPER = 5000
+DEFAULT_MAX_STALE_HOURS = 72
+# A price that appears or disappears between two scans counts as a doubling.
+AVAILABILITY_FLIP = math.log(2)
+MIN_INTERVAL_DAYS = 1 / 24
+PRIORITY_SCALE = 1000
+
+
+@dataclass(frozen=True)
+class Observation:
+    at: float
+    price: Optional[int]
+    quantity: int
+
+
+@dataclass(frozen=True)
+class ItemHint:
+    item_id: int
+    priority: int
+    stale_hours: int
+    volatility: float
+    weight: float
+
+
+def _load(path: Path) -> dict:
+    if path.suffix.lower() == ".lua":
+        return snapshot_from_saved_variables(path)
+    data = json.loads(path.read_text(encoding="utf-8-sig"))
+    if data.get("schema") != SCAN_SCHEMA:
+        raise SystemExit(f"{path}: expected schema {SCAN_SCHEMA}, got {data.get('schema')!r}")
+    return data
+
+
+def _timestamp(value: str) -> float:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+
+
+def _scan_times(data: dict, prices: List[dict]) -> Dict[int, float]:
+    """itemId -> when it was last queried: per price in exports, unpacked into a table from SavedVariables."""
+    saved = data.get("scannedAt")
+    if isinstance(saved, dict) and saved:
+        return {int(k): float(v) for k, v in saved.items()}
+    return {int(p["itemId"]): float(p["scannedAt"]) for p in prices if p.get("scannedAt")}
+
+
+def load_history(paths: List[Path]) -> Dict[Tuple[str, str], Dict[int, List[Observation]]]:
+    """(realm, faction) -> itemId -> observations in scan order, one per scan that queried the item."""
+    snapshots: Dict[Tuple[str, str], List[Tuple[float, dict]]] = {}
+    for path in paths:
+        data = _load(path)
+        key = (str(data.get("realmName") or ""), str(data.get("faction") or ""))
+        snapshots.setdefault(key, []).append((_timestamp(str(data.get("snapshotTimestampUtc"))), data))
+
+    history: Dict[Tuple[str, str], Dict[int, List[Observation]]] = {}
+    for key, snaps in snapshots.items():
+        items: Dict[int, Dict[float, Observation]] = {}
+        for snapshot_at, data in sorted(snaps, key=lambda s: s[0]):
+            prices = data.get("prices") or []
+            scanned_at = _scan_times(data, prices)
+            for p in prices:
+                item_id = int(p.get("itemId") or 0)
+                if item_id <= 0:
+                    continue
+                if scanned_at:
+                    # Prices without a scan time were carried over from an older scan, and one
+                    # carried over with its scan time repeats that scan; count each scan once.
+                    at = scanned_at.get(item_id)
+                    if at is None:
+                        continue
+                else:
+                    # Exports from before per-item scan times: every price was queried.
+                    at = snapshot_at
+                price = int(p.get("minUnitBuyoutCopper") or 0)
+                quantity = int(p.get("totalQuantity") or 0)
+                observation = Observation(at, price if price > 0 and quantity > 0 else None, quantity)
+                items.setdefault(item_id, {}).setdefault(at, observation)
+        history[key] = {item_id: [obs[at] for at in sorted(obs)] for item_id, obs in items.items()}
+    return history
+
+
+def daily_volatility(observations: List[Observation]) -> Optional[Tuple[float, int]]:
+    """(sum of squared log price moves per day, moves) over consecutive scans of one realm."""
+    total = 0.0
+    moves = 0
+    for a, b in zip(observations, observations[1:]):
+        days = max(MIN_INTERVAL_DAYS, (b.at - a.at) / 86400)
+        if a.price is None and b.price is None:
+            continue
+        move = AVAILABILITY_FLIP if a.price is None or b.price is None else math.log(b.price / a.price)
+        total += move * move / days
+        moves += 1
+    return (total, moves) if moves else None
+
+
+def usage_quantities(professions: List[dict]) -> Dict[int, float]:
+    """Reagent itemId -> units used when every recipe consuming it carries its whole skill range."""
+    usage: Dict[int, float] = {}
+    for prof in professions:
+        for r in prof["recipes"]:
+            if r.get("cooldownSeconds"):
+                continue
+            curve = craft_curve(r, DEFAULT_CRAFT_CURVE_SCALE)
+            crafts = expected_crafts(r, curve, int(r["minSkill"]), int(r["grayAt"]) - 1, DEFAULT_CRAFT_CURVE_SCALE)
+            for reg in r["reagents"]:
+                item_id = int(reg["itemId"])
+                usage[item_id] = usage.get(item_id, 0.0) + reg["qty"] * crafts
+    return usage
+
+
+def compute_hints(
+    history: Dict[Tuple[str, str], Dict[int, List[Observation]]],
+    usage: Dict[int, float],
+    *,
+    tolerance_copper: float,
+    max_stale_hours: int,
+) -> List[ItemHint]:
+    """Priority and staleness budget per reagent with price history.
+
+    Volatility is the RMS daily log price move, pooled across realms. An item's weight is
+    its median price times its usage, so weight x volatility is the copper a plan can drift
+    per sqrt(day) on that item. The budget is how long that drift stays under the tolerance;
+    the priority is the drift relative to the most volatile item, 1..1000.
+    """
+    moves: Dict[int, Tuple[float, int]] = {}
+    prices: Dict[int, List[int]] = {}
+    for items in history.values():
+        for item_id, observations in items.items():
+            if item_id not in usage:
+                continue
+            prices.setdefault(item_id, []).extend(o.price for o in observations if o.price is not None)
+            vol = daily_volatility(observations)
+            if vol is not None:
+                total, n = moves.get(item_id, (0.0, 0))
+                moves[item_id] = (total + vol[0], n + vol[1])
+
+    scored: List[Tuple[int, float, float]] = []
+    for item_id, (total, n) in moves.items():
+        if not prices.get(item_id):
+            continue
+        weight = median(prices[item_id]) * usage[item_id]
+        scored.append((item_id, math.sqrt(total / n), weight))
+    top = max((vol * weight for _, vol, weight in scored), default=0.0)
+
+    hints: List[ItemHint] = []
+    for item_id, vol, weight in sorted(scored):
+        drift = vol * weight
+        if drift <= 0:
+            stale_hours = max_stale_hours
+        else:
+            stale_hours = min(max_stale_hours, int(24 * (tolerance_copper / drift) ** 2))
+        priority = max(1, int(round(PRIORITY_SCALE * drift / top))) if top > 0 else 1
+        hints.append(ItemHint(item_id, priority, stale_hours, vol, weight))
+    return hints
+
+
+def render_hints_lua(hints: List[ItemHint], snapshot_count: int, generated_at: str) -> str:
+    lines: List[str] = []
+    lines.append("-- Generated by tools/datapacks/scan_priority.py; do not edit by hand.")
+    lines.append("FrugalForgeScanHints = {")
+    lines.append(f"  generatedAtUtc = {json.dumps(generated_at)},")
+    lines.append(f"  snapshots = {snapshot_count},")
+    lines.append("  items = {")
+    for h in hints:
+        lines.append(f"    [{h.item_id}] = {{ priority = {h.priority}, staleHours = {h.stale_hours} }},")
+    lines.append("  },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            f"Derive AH scan priorities and staleness budgets from accumulated {SCAN_SCHEMA} exports "
+            "(or FrugalForge SavedVariables files) and write the addon's FrugalForgeScanHints table."
+        )
+    )
+    parser.add_argument("snapshots", type=Path, nargs="*", help="Scan exports from any realms, in any order.")
+    parser.add_argument("--data-root", type=Path, default=Path("data"))
+    parser.add_argument("--version", default="Anniversary")
+    parser.add_argument(
+        "--tolerance-copper",
+        type=float,
+        default=DEFAULT_TOLERANCE_COPPER,
+        help="Expected plan-cost drift per item allowed before it is rescanned.",
+    )
+    parser.add_argument("--max-stale-hours", type=int, default=DEFAULT_MAX_STALE_HOURS)
+    parser.add_argument("--out-lua", type=Path, default=Path("FrugalForge") / "FrugalForge_Data_ScanHints.lua")
+    args = parser.parse_args()
+
+    usage = usage_quantities(_load_professions(args.data_root / args.version / "professions"))
+    if not usage:
+        raise SystemExit(f"No profession data found under {args.data_root / args.version}")
+    history = load_history(args.snapshots)
+    hints = compute_hints(history, usage, tolerance_copper=args.tolerance_copper, max_stale_hours=args.max_stale_hours)
+
+    generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    args.out_lua.parent.mkdir(parents=True, exist_ok=True)
+    args.out_lua.write_text(render_hints_lua(hints, len(args.snapshots), generated_at), encoding="utf-8")
+    print(f"Wrote {args.out_lua}: {len(hints)} item hints from {len(args.snapshots)} snapshots")
+
+    # How much of a rescan at the typical interval between scans the budgets would skip.
+    intervals = [
+        (b.at - a.at) / 3600
+        for items in history.values()
+        for observations in items.values()
+        for a, b in zip(observations, observations[1:])
+    ]
+    if intervals and usage:
+        interval = median(intervals)
+        scanned = {item_id for items in history.values() for item_id in items if item_id in usage}
+        skipped = sum(1 for h in hints if h.stale_hours > interval)
+        print(
+            f"At the median scan interval ({interval:.1f}h), {skipped} of {len(scanned)} scanned reagents "
+            f"are within budget and would be skipped"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,47 @@
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    # Concurrent builds may fetch the same page; the last complete write wins and
+    # readers never see a partially written cache file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def rewrite_text_in_place(path: Path, text: str) -> None:
+    # For index files kept inside the cache: rewriting an existing file leaves its
+    # directory's mtime alone, so saving an index does not invalidate the cache index.
+    if path.exists():
+        path.write_text(text, encoding="utf-8")
+    else:
+        write_text_atomic(path, text)
+
+
+class SharedCache:
+    """Memo for version-independent inputs (Wago tables, skill pages, spell pages).
+
+    build_datapacks loads these once in the parent process and seeds every worker with the
+    parsed values, so each key is parsed once per build. A key nobody preloaded is loaded
+    at most once per process. Each worker builds one version at a time, so the memo needs
+    no locking.
+    """
+
+    def __init__(self, cache_root: Path, values: Optional[Dict[str, object]] = None) -> None:
+        self.cache_root = cache_root
+        self._values: Dict[str, object] = dict(values or {})
+
+    def get(self, key: str, loader: Callable[[], T]) -> T:
+        if key not in self._values:
+            self._values[key] = loader()
+        return self._values[key]  # type: ignore[return-value]
+
+    def values(self) -> Dict[str, object]:
+        """Everything loaded so far, for seeding the memo of another process."""
+        return dict(self._values)
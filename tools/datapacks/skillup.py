@@ -0,0 +1,79 @@
+from typing import List, Optional
+
+# Mirrors chanceForSkill in FrugalForge.lua: each color band eases from its high to its
+# low chance along t^gamma.
+YELLOW_BAND = (0.75, 0.35)
+GREEN_BAND = (0.25, 0.10)
+GRAY_BAND = (0.10, 0.03)
+BAND_GAMMA = 2.5
+
+DEFAULT_CRAFT_CURVE_SCALE = 1000
+
+
+def _first(*values: Optional[int]) -> int:
+    # Lua's `a or b` only skips nil, so 0 is a real threshold here too.
+    for value in values:
+        if value is not None:
+            return value
+    return 0
+
+
+def _thresholds(recipe: dict) -> List[int]:
+    orange = _first(recipe.get("orangeUntil"), recipe.get("minSkill"))
+    yellow = _first(recipe.get("yellowUntil"), orange)
+    green = _first(recipe.get("greenUntil"), yellow)
+    gray = _first(recipe.get("grayAt"), green)
+    return [orange, yellow, green, gray]
+
+
+def _band_chance(skill: int, band_start: int, band_end: int, hi: float, lo: float) -> float:
+    if band_end <= band_start:
+        return lo
+    t = min(1.0, max(0.0, (skill - band_start) / (band_end - band_start)))
+    return hi + (lo - hi) * (t**BAND_GAMMA)
+
+
+def chance_for_skill(skill: int, recipe: dict) -> float:
+    orange, yellow, green, gray = _thresholds(recipe)
+    if skill <= orange:
+        return 1.0
+    if skill <= yellow:
+        return _band_chance(skill, orange, yellow, *YELLOW_BAND)
+    if skill <= green:
+        return _band_chance(skill, yellow, green, *GREEN_BAND)
+    if skill < gray:
+        return _band_chance(skill, green, gray, *GRAY_BAND)
+    return 0.0
+
+
+def craft_curve(recipe: dict, scale: int = DEFAULT_CRAFT_CURVE_SCALE) -> List[int]:
+    """Cumulative expected crafts (x scale, rounded) for skills orangeUntil+1 .. grayAt-1.
+
+    Entry k (1-based) covers skill orangeUntil + k; the crafts needed at one skill are the
+    difference of neighbouring entries, and a run of skills is one difference. Skills up
+    to orangeUntil always take exactly one craft and are not stored.
+    """
+    orange, _, _, gray = _thresholds(recipe)
+    out: List[int] = []
+    total = 0.0
+    for skill in range(orange + 1, gray):
+        p = chance_for_skill(skill, recipe)
+        if p <= 0:
+            break
+        total += 1.0 / p
+        out.append(int(round(total * scale)))
+    return out
+
+
+def expected_crafts(recipe: dict, curve: List[int], from_skill: int, to_skill: int, scale: int) -> float:
+    """Expected crafts to go from from_skill to to_skill + 1 with one recipe, from its curve."""
+    orange = _thresholds(recipe)[0]
+
+    def cum(skill: int) -> int:
+        k = skill - orange
+        if k <= 0 or not curve:
+            return 0
+        return curve[min(k, len(curve)) - 1]
+
+    flat = max(0, min(to_skill, orange) - from_skill + 1)
+    return flat + (cum(to_skill) - cum(from_skill - 1)) / scale
@@ -0,0 +1,185 @@
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from lua_values import load_lua_file, lua_array
+
+# Packed lastSnapshot.prices and scannedAt as written by FrugalForgeScan.lua at logout:
+# entries sorted by itemId, each "<itemId delta>,<minUnitBuyoutCopper>,<totalQuantity>,
+# <seconds scanned before generatedAtEpochUtc>" in base 36 and separated by ";"; an empty
+# field is nil, and an item scanned but not found has no price or quantity. Version 1
+# strings have no scan time field.
+SNAPSHOT_PACK_VERSION = 2
+SCAN_SCHEMA = "wowahplanner-scan-v1"
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Optional snapshot fields, in the order BuildExportJsonFromSnapshot writes them.
+_OPTIONAL_STRING_FIELDS = ("region", "gameVersion", "realmSlug")
+
+
+def to_base36(n: int) -> str:
+    n = int(n)
+    if n <= 0:
+        return "0"
+    digits: List[str] = []
+    while n > 0:
+        n, d = divmod(n, 36)
+        digits.append(_BASE36_DIGITS[d])
+    return "".join(reversed(digits))
+
+
+def pack_prices(prices: List[dict], scanned_at: Optional[Dict[int, int]] = None, snapshot_at: int = 0) -> str:
+    scanned_at = scanned_at or {}
+    by_item: Dict[int, dict] = {}
+    for p in prices:
+        by_item.setdefault(int(p["itemId"]), p)
+    for item_id in scanned_at:
+        by_item.setdefault(int(item_id), {})
+    parts: List[str] = []
+    last_item_id = 0
+    for item_id in sorted(by_item):
+        if item_id <= 0:
+            continue
+        p = by_item[item_id]
+        price = p.get("minUnitBuyoutCopper")
+        qty = p.get("totalQuantity")
+        at = scanned_at.get(item_id)
+        parts.append(
+            f"{to_base36(item_id - last_item_id)},"
+            f"{'' if price is None else to_base36(price)},"
+            f"{'' if qty is None else to_base36(qty)},"
+            f"{'' if at is None else to_base36(snapshot_at - int(at))}"
+        )
+        last_item_id = item_id
+    return ";".join(parts)
+
+
+def unpack_prices(packed: str, snapshot_at: int = 0) -> Tuple[List[dict], Dict[int, int]]:
+    """(prices, scannedAt by itemId) from a packed string of either pack version."""
+    prices: List[dict] = []
+    scanned_at: Dict[int, int] = {}
+    item_id = 0
+    for entry in packed.split(";") if packed else []:
+        delta, price, qty, *rest = entry.split(",")
+        item_id += int(delta, 36)
+        if price or qty:
+            p: Dict[str, Optional[int]] = {"itemId": item_id}
+            p["minUnitBuyoutCopper"] = int(price, 36) if price else None
+            p["totalQuantity"] = int(qty, 36) if qty else None
+            prices.append(p)
+        if rest and rest[0]:
+            scanned_at[item_id] = snapshot_at - int(rest[0], 36)
+    return prices, scanned_at
+
+
+def export_json(snapshot: dict) -> str:
+    """The export string BuildExportJsonFromSnapshot builds for a snapshot."""
+    parts = [f'{{"schema":"{SCAN_SCHEMA}"']
+    parts.append(f',"snapshotTimestampUtc":"{snapshot.get("snapshotTimestampUtc") or ""}"')
+    parts.append(f',"realmName":"{snapshot.get("realmName") or ""}"')
+    parts.append(f',"faction":"{snapshot.get("faction") or ""}"')
+    for field in _OPTIONAL_STRING_FIELDS:
+        if snapshot.get(field):
+            parts.append(f',"{field}":"{snapshot[field]}"')
+    if snapshot.get("targetProfessionId"):
+        parts.append(f',"targetProfessionId":{snapshot["targetProfessionId"]}')
+    if snapshot.get("targetProfessionName"):
+        parts.append(f',"targetProfessionName":"{snapshot["targetProfessionName"]}"')
+    if snapshot.get("priceRank"):
+        parts.append(f',"priceRank":{int(snapshot["priceRank"])}')
+    parts.append(',"prices":[')
+    scanned_at = snapshot.get("scannedAt") or {}
+    entries: List[str] = []
+    for p in snapshot.get("prices") or []:
+        entry = (
+            f'{{"itemId":{int(p["itemId"])},"minUnitBuyoutCopper":{int(p.get("minUnitBuyoutCopper") or 0)},'
+            f'"totalQuantity":{int(p.get("totalQuantity") or 0)}'
+        )
+        at = scanned_at.get(int(p["itemId"]))
+        if at is not None:
+            entry += f',"scannedAt":{int(at)}'
+        entries.append(entry + "}")
+    parts.append(",".join(entries))
+    parts.append("]}")
+    return "".join(parts)
+
+
+def snapshot_from_saved_variables(path: Path) -> dict:
+    """FrugalScanDB.lastSnapshot from a SavedVariables file, with packed prices unpacked."""
+    db = load_lua_file(path).get("FrugalScanDB")
+    snap = db.get("lastSnapshot") if isinstance(db, dict) else None
+    if not isinstance(snap, dict):
+        raise SystemExit(f"No FrugalScanDB.lastSnapshot in {path}")
+    snap = dict(snap)
+    packed = snap.pop("packedPrices", None)
+    version = snap.pop("pricesPackVersion", None)
+    if isinstance(packed, str):
+        if version not in (1, SNAPSHOT_PACK_VERSION):
+            raise SystemExit(f"Unsupported pricesPackVersion {version!r} in {path}")
+        snap["prices"], scanned_at = unpack_prices(packed, int(snap.get("generatedAtEpochUtc") or 0))
+        if version == SNAPSHOT_PACK_VERSION:
+            snap["scannedAt"] = scanned_at
+    else:
+        snap["prices"] = [p for p in lua_array(snap.get("prices")) if isinstance(p, dict)]
+    return snap
+
+
+def _roundtrip(path: Path) -> bool:
+    raw = path.read_text(encoding="utf-8-sig")
+    data = json.loads(raw)
+    if data.get("schema") != SCAN_SCHEMA:
+        print(f"{path}: skipped, schema {data.get('schema')!r}")
+        return True
+    scanned_at = {int(p["itemId"]): p["scannedAt"] for p in data.get("prices") or [] if "scannedAt" in p}
+    # Exports carry no generation epoch; the newest scan time is as good a base as any.
+    snapshot_at = max(scanned_at.values(), default=0)
+    packed = pack_prices(data.get("prices") or [], scanned_at, snapshot_at)
+    prices, restored_scanned_at = unpack_prices(packed, snapshot_at)
+    restored = dict(data, prices=prices, scannedAt=restored_scanned_at)
+    rebuilt = json.loads(export_json(restored))
+    # Packing sorts by itemId; the export's price order carries no meaning.
+    expected = dict(data, prices=sorted(data.get("prices") or [], key=lambda p: int(p["itemId"])))
+    ok = rebuilt == expected
+    print(
+        f"{path}: {'ok' if ok else 'MISMATCH'} - {len(data.get('prices') or [])} prices, "
+        f"JSON {len(raw.encode('utf-8'))} bytes, packed {len(packed)} bytes"
+    )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Encode/decode the packed scan snapshot format FrugalScan saves.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rt = sub.add_parser("roundtrip", help=f"Pack and unpack {SCAN_SCHEMA} exports and check the JSON survives.")
+    rt.add_argument("exports", type=Path, nargs="+")
+
+    pack = sub.add_parser("pack", help=f"Print the packed prices string for a {SCAN_SCHEMA} export.")
+    pack.add_argument("export", type=Path)
+
+    unpack = sub.add_parser("export", help=f"Write the {SCAN_SCHEMA} JSON for the snapshot in a SavedVariables file.")
+    unpack.add_argument("--saved-variables", type=Path, required=True, help="WTF/Account/<account>/SavedVariables/FrugalForge.lua")
+    unpack.add_argument("--out", type=Path, default=None, help="Default: stdout")
+    args = parser.parse_args()
+
+    if args.command == "roundtrip":
+        return 0 if all([_roundtrip(path) for path in args.exports]) else 1
+
+    if args.command == "pack":
+        data = json.loads(args.export.read_text(encoding="utf-8-sig"))
+        scanned_at = {int(p["itemId"]): p["scannedAt"] for p in data.get("prices") or [] if "scannedAt" in p}
+        print(pack_prices(data.get("prices") or [], scanned_at, max(scanned_at.values(), default=0)))
+        return 0
+
+    text = export_json(snapshot_from_saved_variables(args.saved_variables))
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+        print(f"Wrote {args.out}")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())